@@ -0,0 +1,125 @@
+# ------------------------------------------------------------------------------
+# Copyright 2025 Esri
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+# Name: startupBenchmark.py
+# Description: Reports the startup cost of OptimizeRasters per component. Each import is timed
+# in a new python process so the numbers reflect a cold run (e.g. a lambda or a short batch run).
+# Version: 20250220
+# Requirements: Python
+# Required Arguments: N/A
+# Optional Arguments: -runs -config
+# Author: Esri Imagery Workflows team
+# ------------------------------------------------------------------------------
+# !/usr/bin/env python
+
+import sys
+import os
+import time
+import argparse
+import subprocess
+import tempfile
+import shutil
+import statistics
+
+OptimizeRastersRoot = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# component, module to import
+Components = [
+    ('OptimizeRasters', 'OptimizeRasters'),
+    ('Logger', 'logger'),
+    ('Amazon (boto3)', 'boto3'),
+    ('Azure', 'azure.storage.blob'),
+    ('Google', 'google.cloud.storage'),
+]
+
+ImportSnippet = '''
+import sys, time
+sys.path[0:0] = [{root!r}, {logger!r}]
+t = time.perf_counter()
+import {module}
+print(time.perf_counter() - t)
+'''
+
+InitSnippet = '''
+import sys, time
+sys.path.insert(0, {root!r})
+import OptimizeRasters
+t = time.perf_counter()
+app = OptimizeRasters.Application({args!r})
+ret = app.init()
+print(ret)
+print(time.perf_counter() - t)
+'''
+
+
+def runSnippet(snippet):
+    env = dict(os.environ, OR_DISABLE_VER_CHECK='true')
+    p = subprocess.run([sys.executable, '-c', snippet], stdout=subprocess.PIPE,
+                       stderr=subprocess.PIPE, universal_newlines=True, env=env)
+    if (p.returncode != 0):
+        return None
+    return p.stdout.strip().split('\n')
+
+
+def timeIt(snippet, runs):
+    timings = []
+    for i in range(0, runs):
+        ret = runSnippet(snippet)
+        if (ret is None):
+            return None
+        timings.append(float(ret[-1]))
+    return timings
+
+
+def report(name, timings):
+    if (timings is None):
+        print('{:<28}{:>12}'.format(name, 'n/a'))
+        return
+    print('{:<28}{:>12.1f}{:>12.1f}'.format(
+        name, statistics.median(timings) * 1000, min(timings) * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OptimizeRasters startup benchmark')
+    parser.add_argument('-runs', type=int, default=5, help='Runs per component (Def: 5)')
+    parser.add_argument('-config', default=os.path.join(OptimizeRastersRoot, 'Templates', 'Imagery_to_MRF_LERC.xml'),
+                        help='Template to time the Application init with')
+    args = parser.parse_args()
+    print('{:<28}{:>12}{:>12}'.format('Component', 'median(ms)', 'min(ms)'))
+    # (python OptimizeRasters.py) compiles the script on every run, the module import uses the cached bytecode.
+    with open(os.path.join(OptimizeRastersRoot, 'OptimizeRasters.py'), 'r', encoding='utf-8') as reader:
+        source = reader.read()
+    timings = []
+    for i in range(0, args.runs):
+        t = time.perf_counter()
+        compile(source, 'OptimizeRasters.py', 'exec')
+        timings.append(time.perf_counter() - t)
+    report('Script compile', timings)
+    for (name, module) in Components:
+        report('Import {}'.format(name), timeIt(ImportSnippet.format(
+            root=OptimizeRastersRoot, logger=os.path.join(OptimizeRastersRoot, 'SolutionsLog'), module=module), args.runs))
+    workDir = tempfile.mkdtemp()
+    initArgs = {
+        'input': workDir,
+        'output': workDir,
+        'config': args.config
+    }
+    report('Application init', timeIt(InitSnippet.format(
+        root=OptimizeRastersRoot, args=initArgs), args.runs))
+    shutil.rmtree(workDir, ignore_errors=True)
+    return True
+
+
+if __name__ == '__main__':
+    main()
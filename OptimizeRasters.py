@@ -32,8 +32,6 @@
 # !/usr/bin/env python
 
 # IMPORTANT> Set (CRUN_IN_AWSLAMBDA) to (True) when the OptimizeRasters.py is used within the (lambda_function.zip) to act as a lambda function.
-import tarfile
-import mimetypes
 import fnmatch
 from datetime import datetime, timedelta
 import binascii
@@ -44,9 +42,16 @@ import math
 import argparse
 import shutil
 import subprocess
+import tempfile
 from xml.dom import minidom
 import time
 import threading
+import array
+import bisect
+import heapq
+import random
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import mmap
 import base64
 import os
@@ -72,6 +77,16 @@ CRUN_IN_AWSLAMBDA = getBooleanValue(
 CDISABLE_GDAL_CHECK = getBooleanValue(os.environ.get('OR_DISABLE_GDAL', False))
 CDisableVersionCheck = getBooleanValue(
     os.environ.get('OR_DISABLE_VER_CHECK', False))
+# hours the version check result is cached for, overrides the (CheckForUpdate) schedule in CheckForUpdate.json
+try:
+    CVersionCheckTTL = float(os.environ['OR_VER_CHECK_TTL']) * 3600
+except (KeyError, ValueError):
+    CVersionCheckTTL = None
+CVersionCheckTimeout = 3     # secs
+# log messages are streamed to disk as they arrive [xml/jsonl/false], the final log keeps a summary.
+CLogStreamFormat = os.environ.get('OR_LOG_STREAM', 'xml').lower()
+# set in the (-op=daemon) worker processes, the parsed templates/cloud sessions are reused across jobs.
+CWarmCache = False
 
 if (sys.version_info[0] < 3):
     import ConfigParser
@@ -79,8 +94,16 @@ if (sys.version_info[0] < 3):
     from urlparse import urlparse
 else:
     import configparser as ConfigParser
-    from urllib.request import urlopen, Request
     from urllib.parse import urlencode, urlparse, quote
+
+    # (urllib.request) pulls in http.client/email/ssl, deferred till the first use to cut the startup time.
+    def urlopen(*args, **kwargs):
+        from urllib.request import urlopen
+        return urlopen(*args, **kwargs)
+
+    def Request(*args, **kwargs):
+        from urllib.request import Request
+        return Request(*args, **kwargs)
 # ends
 
 # enum error codes
@@ -120,8 +143,11 @@ SigAlibaba = 'aliyuncs.com'
 
 # Del delay
 CDEL_DELAY_SECS = 20
+CDEL_RETRIES = 5
 # ends
 
+CSERVER_SIDE_COPY = '__SERVER_SIDE_COPY__'
+
 CPRJ_NAME = 'ProjectName'
 CLOAD_RESTORE_POINT = '__LOAD_RESTORE_POINT__'
 CCMD_ARG_INPUT = '__CMD_ARG_INPUT__'
@@ -139,6 +165,7 @@ COP_NOCONVERT = 'noconvert'
 COP_LAMBDA = 'lambda'
 COP_COPYONLY = 'copyonly'
 COP_CREATEJOB = 'createjob'
+COP_DAEMON = 'daemon'
 # ends
 
 # clone specific
@@ -237,6 +264,9 @@ CS3_MSG_DETAIL = False
 CS3_UPLOAD_RETRIES = 3
 # ends
 
+# (S3Upl) return value for an upload waiting on the retry queue, the (uploaded) record status is set once it settles.
+CUPL_PENDING = 'pending'
+
 # S3Storage direction
 CS3STORAGE_IN = 0
 CS3STORAGE_OUT = 1
@@ -439,14 +469,28 @@ class MEMORYSTATUSEX(ctypes.Structure):
             ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(self))
         return self
 
+    # returns the physical memory (bytes) available to new processes without swapping.
+    def getAvailPhys(self):
+        if (not self.isLinux):
+            return self.memoryStatus().ullAvailPhys
+        try:
+            with open('/proc/meminfo', 'r') as meminfo:
+                for ln in meminfo:
+                    if (ln.startswith('MemAvailable:')):
+                        return int(ln.split()[1]) * 1024
+        except BaseException:
+            pass
+        try:
+            return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        except BaseException:
+            return 0
+
     def getFreeMem(self):
-        if (self.isLinux):
-            try:
-                return int(int(os.popen("free -b").readlines()[1].split()[2]) * .01)
-            except Exception as e:
-                return self.CMINSIZEALLOWED
+        availPhys = self.getAvailPhys()
+        if (not availPhys):
+            return self.CMINSIZEALLOWED
         # download file isn't split in chunks, for now usage is set to 0.01
-        return int(self.memoryStatus().ullAvailPhys * .01)
+        return int(availPhys * .01)
 
     def memoryPerDownloadChunk(self):
         return self.getFreeMem()
@@ -464,13 +508,19 @@ class Lambda:
     account_key = 'aws_secret_access_key'
     account_region = 'region'
     account_sns = 'sns_arn'
+    # optional, SQS queue set as the function's async (OnSuccess/OnFailure) destination.
+    account_result_queue = 'lambda_result_queue'
     queue_length = 'queuelength'
+    MaxWorkers = 100
+    AsyncTimeout = 3600     # secs to wait on the async results.
+    AsyncPollSecs = 20      # SQS long poll.
 
     def __init__(self, base=None):
         self._sns_aws_access_key = \
             self._sns_aws_secret_access_key = None
         self._sns_region = 'us-east-1'
         self._sns_ARN = None
+        self._result_queue = None
         self._sns_connection = None
         self._aws_credentials = None    # aws credential file.
         self._base = base
@@ -494,6 +544,8 @@ class Lambda:
                 keyProfileName, self.account_region)
         self._sns_ARN = self._aws_credentials.get(keyProfileName, self.account_sns) if self._aws_credentials.has_option(
             keyProfileName, self.account_sns) else None
+        self._result_queue = self._aws_credentials.get(keyProfileName, self.account_result_queue) if self._aws_credentials.has_option(
+            keyProfileName, self.account_result_queue) else None
         if (not self._sns_aws_access_key or
                 not self._sns_aws_secret_access_key):
             return False
@@ -584,8 +636,7 @@ class Lambda:
         return True
 
     def submitJob(self, orjob):
-        if (not self._sns_connection or
-                not orjob):
+        if (not orjob):
             return False
         _orjob = Report(Base())
         if (not _orjob.init(orjob) or
@@ -593,6 +644,18 @@ class Lambda:
             self._base.message('Job file read error',
                                self._base.const_critical_text)
             return False
+        functionName = None
+        useLambdaFunction = False
+        lambdaArgs = _orjob.operation.split(':')
+        if (len(lambdaArgs) > 2):
+            if (lambdaArgs[1].lower() == 'function'):
+                # preserve case in lambda functions.
+                functionName = lambdaArgs[2]
+                useLambdaFunction = True
+        isEmulated = LambdaEmulator.isEmulated(_orjob.operation)
+        if (not self._sns_connection and
+                not isEmulated):
+            return False
         orjobName = os.path.basename(orjob)
         orjobWOExt = orjobName.lower().replace(Report.CJOB_EXT, '')
         configPath = _orjob._header['config']
@@ -620,21 +683,19 @@ class Lambda:
         try:
             doc = minidom.parseString(configContent)
             # skip looking into the parameter file for credentials if the input is a direct HTTP link with no reqruirement to pre-download the raster/file before processing.
-            if (not _orjob._isInputHTTP):
+            # emulated runs have access to the local profiles.
+            if (not isEmulated and
+                    not _orjob._isInputHTTP):
                 if (not self._updateCredentials(doc, 'In')):
                     return False
-            if (not self._updateCredentials(doc, 'Out')):
+            if (not isEmulated and
+                    not self._updateCredentials(doc, 'Out')):
                 return False
             configContent = doc.toprettyxml()
         except Exception as e:
             self._base.message(str(e), self._base.const_critical_text)
             return False
-        orjobHeader = ''
-        for hdr in _orjob._header:
-            # lambda works with AWS key pairs and not profile names.
-            if (hdr in [InputProfile, OutputProfile]):
-                continue
-            orjobHeader += '# {}={}\n'.format(hdr, _orjob._header[hdr])
+        orjobHeader = self._getJobHeader(_orjob, isEmulated)
         length = len(_orjob._input_list)
         jobQueue = self._base.getUserConfiguration.getValue(self.queue_length)
         if (not jobQueue):
@@ -645,47 +706,82 @@ class Lambda:
             (jobQueue <= 0 or
              jobQueue > length)):
             jobQueue = length
-        i = 0
         errLambda = False
         functionJobs = []
-        functionName = None
-        useLambdaFunction = False
-        lambdaArgs = _orjob.operation.split(':')
-        if (len(lambdaArgs) > 2):
-            if (lambdaArgs[1].lower() == 'function'):
-                # preserve case in lambda functions.
-                functionName = lambdaArgs[2]
-                useLambdaFunction = True
+        localJobs = []
         self._base.message('Invoke using ({})'.format(
-            'Function' if useLambdaFunction else 'SNS'))
-        while (i < length):
-            orjobContent = ''
-            for j in range(i, i + jobQueue):
-                if (j == length):
-                    break
-                f = _orjob._input_list[j]
-                if (f.endswith('/')):
-                    i += 1
-                    continue    # skip folder entries
-                if (not orjobContent):
-                    orjobContent += orjobHeader
-                orjobContent += '{}\n'.format(f)
-                i += 1
-            if (not orjobContent):
-                continue
-            store = {'orjob': {'file': '{}_{}{}'.format(orjobWOExt, i, Report.CJOB_EXT), 'content': orjobContent}, 'config': {
+            lambdaArgs[1].capitalize() if isEmulated else 'Function' if useLambdaFunction else 'SNS'))
+        oversized = []
+        chunker = LambdaChunker(self._base, getattr(self._base, 'inputSizes', None),
+                                _orjob._header[CTimeIt] if CTimeIt in _orjob._header else None, jobQueue)
+        entries = [f for f in _orjob._input_list if not f.endswith('/')]   # skip folder entries
+        if (chunker.isInformed or
+                any(chunker.size(f) is not None for f in entries)):
+            (chunks, oversized) = chunker.pack(entries)
+        else:
+            self._base.message('No raster sizes/-timeit info, ({}) rasters per job'.format(
+                jobQueue), self._base.const_warning_text)
+            chunks = []
+            i = 0
+            while (i < length):
+                chunk = []
+                for j in range(i, i + jobQueue):
+                    if (j == length):
+                        break
+                    f = _orjob._input_list[j]
+                    if (not f.endswith('/')):
+                        chunk.append(f)
+                if (chunk):
+                    chunks.append(chunk)
+                i += jobQueue
+        i = 0
+        # the oversized rasters get a job each on the local pool.
+        for f in oversized:
+            self._base.message('({}) is over the function limits (est. {:.0f}s/{:.0f}MB), converting locally'.format(
+                f, chunker.cost(f), chunker.storage(f)), self._base.const_warning_text)
+        for (chunk, isLocal) in [(c, False) for c in chunks] + [([f], True) for f in oversized]:
+            i += len(chunk)
+            store = {'orjob': {'file': '{}_{}{}'.format(orjobWOExt, i, Report.CJOB_EXT), 'content': '{}{}\n'.format(
+                self._getJobHeader(_orjob, True) if isLocal else orjobHeader, '\n'.join(chunk))}, 'config': {
                 'file': configName, 'content': configContent}}
             message = json.dumps(store)
-            if (useLambdaFunction):
+            if (isLocal):
+                localJobs.append(message)
+            elif (useLambdaFunction or
+                    isEmulated):
                 functionJobs.append(message)
             else:
                 if (not self.invokeSNS(message)):
                     errLambda = True
-        if (useLambdaFunction and
+        if (isEmulated):
+            if (not LambdaEmulator(self._base).invoke(_orjob.operation, functionJobs)):
+                errLambda = True
+        elif (useLambdaFunction and
+                functionJobs and
                 not self.invokeFunction(functionName, functionJobs)):
             errLambda = True
+        if (localJobs):
+            self._base.message('Running ({}) raster(s) too large for the function locally..'.format(
+                len(localJobs)))
+            if (not LambdaEmulator(self._base).invoke('{}:{}'.format(COP_LAMBDA, LambdaEmulator.Local), localJobs)):
+                errLambda = True
         return not errLambda
 
+    # (emulated) jobs run as regular jobs and are read back once done.
+    def _getJobHeader(self, _orjob, emulated=False):
+        orjobHeader = ''
+        for hdr in _orjob._header:
+            if (emulated):
+                if (hdr in [Report.CHDR_OP, 'keeplogfile']):
+                    continue
+            # lambda works with AWS key pairs and not profile names.
+            elif (hdr in [InputProfile, OutputProfile]):
+                continue
+            orjobHeader += '# {}={}\n'.format(hdr, _orjob._header[hdr])
+        if (emulated):
+            orjobHeader += '# keeplogfile=true\n'
+        return orjobHeader
+
     def invokeSNS(self, message):
         publish = None
         try:
@@ -713,17 +809,34 @@ class Lambda:
                 payload = {'Records': [{'Sns': {'Message': message[i]}}]}
                 payloads.append(payload)
             timeStart = datetime.now()
-            pool = ThreadPool(LambdaFunction, base=self._base, function_name=functionName,
-                              aws_access_key_id=self._sns_aws_access_key, aws_secret_access_key=self._sns_aws_secret_access_key)
-            pool.init(maxWorkers=100)
+            import boto3
+            import botocore
+            session = boto3.Session(aws_access_key_id=self._sns_aws_access_key,
+                                    aws_secret_access_key=self._sns_aws_secret_access_key, region_name=self._sns_region)
+            # a single client shared by the workers, clients are thread-safe and the pool is sized to the fan-out.
+            client = session.client('lambda', config=botocore.config.Config(max_pool_connections=self.MaxWorkers,
+                                                                             retries={'max_attempts': 10, 'mode': 'adaptive'}))
+            useAsync = self._result_queue is not None
+            pending = {}    # RequestId -> jobID of the async invocations.
+            merger = LambdaStatusMerger(self._base, len(payloads))
+            pool = ThreadPool(LambdaFunction, base=self._base, function_name=functionName, client=client,
+                              invocation_type='Event' if useAsync else 'RequestResponse', pending=pending, merger=merger)
+            pool.init(maxWorkers=self.MaxWorkers)
             for i in range(0, len(payloads)):
                 pool.addWorker(payloads[i], i)
             pool.run()
+            if (useAsync and
+                    pending):
+                self._base.message('Waiting on ({}) async invocations..'.format(
+                    len(pending)))
+                self.pollResults(session.client('sqs'), pending, merger)
+            merger.close()
             self._base.getUserConfiguration.getValue(
                 CPRT_HANDLER).write()    # update .orjob status
             self._base.message('duration> {}s'.format(
                 (datetime.now() - timeStart).total_seconds()))
-            if (pool.isErrorDetected):
+            if (pool.isErrorDetected or
+                    pending):
                 return False
         except Exception as e:
             self._base.message('{}'.format(str(e)),
@@ -731,6 +844,362 @@ class Lambda:
             return False
         return True
 
+    # picks the async results for (pending) off the destination queue, results of other runs are left on the queue.
+    def pollResults(self, sqs, pending, merger=None):
+        timeEnd = time.time() + self.AsyncTimeout
+        while (pending and
+               time.time() < timeEnd):
+            resp = sqs.receive_message(QueueUrl=self._result_queue,
+                                       MaxNumberOfMessages=10, WaitTimeSeconds=self.AsyncPollSecs)
+            for msg in resp.get('Messages', []):
+                try:
+                    record = json.loads(msg['Body'])
+                    requestContext = record.get('requestContext', {})
+                    requestID = requestContext.get('requestId')
+                except Exception as e:
+                    continue
+                if (requestID not in pending):
+                    continue
+                jobID = pending.pop(requestID)
+                sqs.delete_message(QueueUrl=self._result_queue,
+                                   ReceiptHandle=msg['ReceiptHandle'])
+                if (requestContext.get('condition') != 'Success'):
+                    self._base.message('Failed/{}/({})'.format(jobID, requestContext.get(
+                        'condition')), self._base.const_critical_text)
+                    self._base.getUserConfiguration.setValue(
+                        CCFG_LAMBDA_INVOCATION_ERR, True)
+                    continue
+                LambdaFunction.updateStatus(
+                    self._base, record.get('responsePayload'), jobID, merger)
+        if (pending):
+            self._base.message('Timed out waiting on jobs ({})'.format(', '.join(
+                [str(pending[k]) for k in pending])), self._base.const_critical_text)
+            return False
+        return True
+
+
+# packs the .orjob entries into function jobs by their estimated cost rather than by count. Costs (secs) come from
+# the object sizes off the input listing and the per-format rates in a previous -timeit report.
+class LambdaChunker(object):
+    TargetSecs = 600    # per job, leaves headroom under the 900 secs function limit.
+    StorageMB = 512     # function's /tmp
+    StorageFactor = 2   # input plus the converted output
+    DefSecsPerMB = 0.5  # when there's no -timeit info for the format.
+    DefSecs = 10        # entries with no size or -timeit info.
+
+    def __init__(self, base, sizes=None, timeItReport=None, maxEntries=None):
+        self._base = base
+        self._sizes = {}
+        for key in (sizes or {}):
+            self._sizes[key.replace('\\', '/')] = sizes[key] / (1024 * 1024)   # in MB
+        self._maxEntries = maxEntries
+        self._secsPerMB = {}    # ext => secs per MB
+        self._secs = {}         # ext => mean secs per raster when the sizes aren't known.
+        if (timeItReport):
+            self._loadTimeIt(timeItReport)
+
+    @property
+    def isInformed(self):
+        return bool(self._sizes or
+                    self._secsPerMB or
+                    self._secs)
+
+    def _loadTimeIt(self, timeItReport):
+        if (not os.path.exists(timeItReport)):
+            return False
+        import csv
+        totals = {}     # ext => [secs, MB, secs for unknown sizes, count of unknown sizes]
+        sizesByName = {os.path.basename(k): v for k, v in self._sizes.items()}
+        try:
+            with open(timeItReport, 'r', newline='') as csvfile:
+                for row in csv.DictReader(csvfile):
+                    name = (row.get(TimeIt.Name) or '').replace('\\', '/')
+                    if (not name):
+                        continue
+                    secs = 0
+                    for column in (TimeIt.Conversion, TimeIt.Overview, TimeIt.Download, TimeIt.Upload):
+                        try:
+                            secs += float(row.get(column) or 0)
+                        except ValueError:
+                            pass
+                    ext = os.path.splitext(name)[1].lower()
+                    total = totals.setdefault(ext, [0, 0, 0, 0])
+                    size = self._sizes.get(name, sizesByName.get(os.path.basename(name)))
+                    if (size):
+                        total[0] += secs
+                        total[1] += size
+                    else:
+                        total[2] += secs
+                        total[3] += 1
+        except Exception as e:
+            self._base.message('TimeIt> {}'.format(str(e)),
+                               self._base.const_warning_text)
+            return False
+        for ext in totals:
+            (secs, size, unsizedSecs, unsized) = totals[ext]
+            if (size):
+                self._secsPerMB[ext] = secs / size
+            if (unsized):
+                self._secs[ext] = unsizedSecs / unsized
+        return True
+
+    # in MB, off the input listing or the local file. None if unknown.
+    def size(self, path):
+        size = self._sizes.get(path)
+        if (size is None and
+                os.path.isfile(path)):
+            size = self._sizes[path] = os.path.getsize(path) / (1024 * 1024)
+        return size
+
+    def cost(self, path):
+        ext = os.path.splitext(path)[1].lower()
+        size = self.size(path)
+        if (size is None):
+            return self._secs.get(ext, self.DefSecs)
+        return size * self._secsPerMB.get(ext, self.DefSecsPerMB)
+
+    def storage(self, path):
+        return (self.size(path) or 0) * self.StorageFactor
+
+    # returns ([jobs], [oversized]). First-fit decreasing on the cost with the storage as the second budget.
+    def pack(self, entries):
+        bins = []   # [secs, MB, [entries]]
+        oversized = []
+        for (secs, size, f) in sorted([(self.cost(f), self.storage(f), f) for f in entries], reverse=True):
+            if (secs > self.TargetSecs or
+                    size > self.StorageMB):
+                oversized.append(f)
+                continue
+            for _bin in bins:
+                if (_bin[0] + secs <= self.TargetSecs and
+                    _bin[1] + size <= self.StorageMB and
+                        (not self._maxEntries or
+                         len(_bin[2]) < self._maxEntries)):
+                    break
+            else:
+                _bin = [0, 0, []]
+                bins.append(_bin)
+            _bin[0] += secs
+            _bin[1] += size
+            _bin[2].append(f)
+        if (bins):
+            self._base.message('Packed ({}) rasters into ({}) jobs, est. max job ({:.0f}s), oversized ({})'.format(
+                len(entries) - len(oversized), len(bins), max([b[0] for b in bins]), len(oversized)))
+        return ([b[2] for b in bins], oversized)
+
+
+# runs the -op=lambda payloads without AWS. (lambda:local[:workers]) runs them on a local process pool,
+# (lambda:queue:<path>) drops them into a directory queue served by any number of (-op=lambda:worker:<path>) instances.
+# workers keep polling till the (<path>/stop) marker exists, it's written once the queued jobs are collected.
+class LambdaEmulator(object):
+    Local = 'local'
+    Queue = 'queue'
+    Worker = 'worker'
+    Pending = 'pending'
+    Running = 'running'
+    Done = 'done'
+    Stop = 'stop'
+    PollSecs = 2
+    FailedLogLines = 20     # lines of a failed job's output that get logged.
+    # secs a claimed job can run before it's taken to be from a dead worker and re-queued.
+    StaleSecs = float(os.environ.get('OR_QUEUE_JOB_TIMEOUT', 3600))
+    # secs to wait on all the queued jobs before giving up on the rest.
+    TimeoutSecs = float(os.environ.get('OR_QUEUE_TIMEOUT', 86400))
+
+    def __init__(self, base):
+        self._base = base
+
+    @staticmethod
+    def isEmulated(op):
+        if (not op):
+            return False
+        lambdaArgs = op.split(':')
+        return (lambdaArgs[0].lower() == COP_LAMBDA and
+                len(lambdaArgs) > 1 and
+                lambdaArgs[1].lower() in (LambdaEmulator.Local, LambdaEmulator.Queue, LambdaEmulator.Worker))
+
+    def message(self, message, messageType=0):
+        if (self._base is not None):
+            return self._base.message(message, messageType)
+        print(message)
+
+    # stand-in for the lambda function. Runs the payload (message) as a job, returns the status same as the function.
+    def handler(self, message):
+        store = json.loads(message)
+        workDir = tempfile.mkdtemp(prefix='orlambda_').replace('\\', '/')
+        try:
+            orjobPath = '{}/{}'.format(workDir, store['orjob']['file'])
+            with open('{}/{}'.format(workDir, store['config']['file']), 'w', encoding='utf-8') as writer:
+                writer.write(store['config']['content'])
+            with open(orjobPath, 'w', encoding='utf-8') as writer:
+                # (/tmp) paths set for the function are moved into the work dir.
+                writer.write(store['orjob']['content'].replace('=/tmp/', '={}/'.format(workDir)))
+            consolePath = '{}/{}'.format(workDir, 'console.log')
+            with open(consolePath, 'w') as log:
+                ret = subprocess.call([sys.executable, os.path.abspath(__file__), '-input', orjobPath],
+                                      stdout=log, stderr=subprocess.STDOUT, env=dict(os.environ, OR_DISABLE_VER_CHECK='true'))
+            if (ret != eOK):
+                # the work dir doesn't outlive the call, the tail of the job output is logged instead.
+                with open(consolePath, 'r', errors='replace') as log:
+                    self.message('Job ({}) failed\n{}'.format(store['orjob']['file'], ''.join(
+                        log.readlines()[-self.FailedLogLines:])), const_critical_text)
+            _orjob = Report(Base())
+            if (not _orjob.init(orjobPath) or
+                    not _orjob.read()):
+                self.message('Unable to read the job status ({})'.format(
+                    orjobPath), const_critical_text)
+                return None
+            status = {
+                'status': 'OK' if ret == eOK else 'FAILED',
+                'input_list_info': {}
+            }
+            for f in _orjob._input_list_info:
+                record = _orjob._input_list_info[f]
+                status['input_list_info'][f] = {_type: record.get(_type) for _type in (
+                    CRPT_COPIED, CRPT_PROCESSED, CRPT_UPLOADED)}
+            return status
+        finally:
+            shutil.rmtree(workDir, ignore_errors=True)
+
+    def invoke(self, op, messages):
+        # the queue path is kept whole, it can have a ':' of its own (e.g. C:\spool)
+        lambdaArgs = op.split(':', 2)
+        timeStart = datetime.now()
+        if (lambdaArgs[1].lower() != self.Local and
+            (len(lambdaArgs) < 3 or
+             not lambdaArgs[2])):
+            self.message('Queue path is missing (-op=lambda:queue:<path>)',
+                         const_critical_text)
+            return False
+        workers = os.cpu_count()
+        if (lambdaArgs[1].lower() == self.Local and
+            len(lambdaArgs) > 2 and
+                lambdaArgs[2]):
+            try:
+                workers = int(lambdaArgs[2])
+            except ValueError:
+                self.message('Invalid worker count ({}), usage -op=lambda:local[:<workers>]'.format(
+                    lambdaArgs[2]), const_critical_text)
+                return False
+        merger = LambdaStatusMerger(self._base, len(messages))
+        if (lambdaArgs[1].lower() == self.Local):
+            ret = self._invokeLocal(messages, workers, merger)
+        else:
+            ret = self._invokeQueue(messages, lambdaArgs[2], merger)
+        merger.close()
+        self._base.getUserConfiguration.getValue(
+            CPRT_HANDLER).write()    # update .orjob status
+        self.message('duration> {}s'.format(
+            (datetime.now() - timeStart).total_seconds()))
+        return ret
+
+    def _invokeLocal(self, messages, workers, merger):
+        ret = True
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            jobs = {pool.submit(self.handler, m): jobID for (jobID, m) in enumerate(messages)}
+            for job in as_completed(jobs):
+                jobID = jobs[job]
+                try:
+                    status = job.result()
+                except Exception as e:
+                    self.message('{}'.format(e), const_critical_text)
+                    status = None
+                if (status is None or
+                        status['status'] != 'OK'):
+                    ret = False
+                LambdaFunction.updateStatus(self._base, status, jobID, merger)
+        return ret
+
+    def _invokeQueue(self, messages, queuePath, merger):
+        pending = {}
+        for folder in (self.Pending, self.Running, self.Done):
+            makedirs(os.path.join(queuePath, folder))
+        stopPath = os.path.join(queuePath, self.Stop)
+        if (os.path.exists(stopPath)):
+            os.remove(stopPath)
+        for jobID, message in enumerate(messages):
+            name = '{}.json'.format(json.loads(message)['orjob']['file'])
+            self._putFile(os.path.join(queuePath, self.Pending, name), message)
+            pending[name] = jobID
+        self.message('Queued ({}) jobs at ({}), waiting on -op={}:{}:{} instances..'.format(
+            len(pending), queuePath, COP_LAMBDA, self.Worker, queuePath))
+        ret = True
+        deadline = time.time() + self.TimeoutSecs
+        while (pending):
+            if (time.time() > deadline):
+                self.message('Timed out waiting on ({}) queued jobs at ({})'.format(
+                    len(pending), queuePath), const_critical_text)
+                ret = False
+                break
+            time.sleep(self.PollSecs)
+            for name in list(pending):
+                donePath = os.path.join(queuePath, self.Done, name)
+                if (not os.path.exists(donePath)):
+                    runningPath = os.path.join(queuePath, self.Running, name)
+                    try:
+                        if (time.time() - os.path.getmtime(runningPath) > self.StaleSecs):
+                            os.rename(runningPath, os.path.join(
+                                queuePath, self.Pending, name))
+                            self.message('Re-queued stale job ({})'.format(name), const_warning_text)
+                    except OSError:
+                        pass    # not claimed yet or the worker has just finished it.
+                    continue
+                with open(donePath, 'r', encoding='utf-8') as reader:
+                    status = json.load(reader)
+                os.remove(donePath)
+                if (status is None or
+                        status['status'] != 'OK'):
+                    ret = False
+                LambdaFunction.updateStatus(
+                    self._base, status, pending.pop(name), merger)
+        self._putFile(stopPath, '')     # lets the workers exit.
+        return ret
+
+    # serves the payloads in the queue at (queuePath) till the (stop) marker exists and there aren't any left.
+    def serve(self, queuePath):
+        pendingPath = os.path.join(queuePath, self.Pending)
+        if (not os.path.isdir(pendingPath)):
+            self.message('Invalid queue path ({})'.format(
+                queuePath), const_critical_text)
+            return False
+        stopPath = os.path.join(queuePath, self.Stop)
+        while (1):
+            names = sorted(os.listdir(pendingPath))
+            if (not names):
+                if (os.path.exists(stopPath)):
+                    break
+                time.sleep(self.PollSecs)
+                continue
+            for name in names:
+                runningPath = os.path.join(queuePath, self.Running, name)
+                try:
+                    # the rename is atomic, only one worker gets to claim the job.
+                    os.rename(os.path.join(pendingPath, name), runningPath)
+                except OSError:
+                    continue
+                os.utime(runningPath)   # the rename keeps the queued time, the job's age counts from the claim.
+                self.message('Started/{}'.format(name))
+                with open(runningPath, 'r', encoding='utf-8') as reader:
+                    message = reader.read()
+                try:
+                    status = self.handler(message)
+                except Exception as e:
+                    self.message('{}'.format(e), const_critical_text)
+                    status = None
+                self._putFile(os.path.join(queuePath, self.Done, name), json.dumps(status))
+                try:
+                    os.remove(runningPath)
+                except OSError:
+                    pass    # re-queued as stale meanwhile.
+                self.message('Completed/{}'.format(name))
+        return True
+
+    def _putFile(self, path, content):
+        tmpPath = '{}.tmp'.format(path)
+        with open(tmpPath, 'w', encoding='utf-8') as writer:
+            writer.write(content)
+        os.replace(tmpPath, path)   # readers never see a partial file.
+
 
 class LambdaFunction(threading.Thread):
     Base = 'base'
@@ -767,24 +1236,46 @@ class LambdaFunction(threading.Thread):
                 return self.base.message(message, messageType)
         print(message)
 
+    # merges the function response (respJSON) into the local .orjob, through the (merger) if one is given.
+    @staticmethod
+    def updateStatus(base, respJSON, jobID, merger=None):
+        if (not respJSON):
+            return None
+        respStatus = respJSON['status'] if 'status' in respJSON else None
+        if (merger is not None):
+            merger.put(jobID, respJSON)
+            return respStatus
+        message = 'Completed/{}/Status [{}]'.format(jobID, str(respStatus))
+        if (base is None):
+            print(message)
+            return respStatus
+        report = base.getUserConfiguration.getValue(CPRT_HANDLER)
+        report.syncRemoteToLocal(respJSON)
+        base.message(message)
+        return respStatus
+
     def run(self):
         try:
-            import boto3
-            import boto3.session
-            session = boto3.session.Session()
-            client = session.client('lambda', aws_access_key_id=self.kwargs['aws_access_key_id'] if 'aws_access_key_id' in self.kwargs else None,
-                                    aws_secret_access_key=self.kwargs['aws_secret_access_key'] if 'aws_secret_access_key' in self.kwargs else None)
-            self.result = client.invoke(FunctionName=self.function, InvocationType='RequestResponse',
+            client = self.kwargs['client'] if 'client' in self.kwargs else None
+            if (client is None):
+                import boto3
+                import boto3.session
+                session = boto3.session.Session()
+                client = session.client('lambda', aws_access_key_id=self.kwargs['aws_access_key_id'] if 'aws_access_key_id' in self.kwargs else None,
+                                        aws_secret_access_key=self.kwargs['aws_secret_access_key'] if 'aws_secret_access_key' in self.kwargs else None)
+            invocationType = self.kwargs['invocation_type'] if 'invocation_type' in self.kwargs else 'RequestResponse'
+            self.result = client.invoke(FunctionName=self.function, InvocationType=invocationType,
                                         Payload=json.dumps(self.payload))
+            if (invocationType == 'Event'):
+                # queued by lambda, the result gets picked up off the destination queue.
+                self.kwargs['pending'][self.result['ResponseMetadata']['RequestId']] = self.jobID
+                self.message('Queued/{}'.format(self.jobID))
+                return True
             respJSON = json.loads(self.result['Payload'].read())
             if (not respJSON):
                 return None
-            respStatus = respJSON['status'] if 'status' in respJSON else None
-            if (self.base is not None):
-                report = self.base.getUserConfiguration.getValue(CPRT_HANDLER)
-                report.syncRemoteToLocal(respJSON)
-            self.message(
-                'Completed/{}/Status [{}]'.format(self.jobID, str(respStatus)))
+            self.updateStatus(self.base, respJSON, self.jobID,
+                              self.kwargs['merger'] if 'merger' in self.kwargs else None)
         except Exception as e:
             # 2 for critical
             self.message('{}'.format(
@@ -796,6 +1287,60 @@ class LambdaFunction(threading.Thread):
         return True
 
 
+# single consumer of the function results. The workers queue their responses and the status changes get applied to
+# the .orjob in batches (see Report.updateRecordStatusBatch) rather than by each worker with its own snapshots.
+class LambdaStatusMerger(object):
+    MaxBatch = 100  # responses merged at a time
+
+    def __init__(self, base, total):
+        self._base = base
+        self._total = total
+        self._completed = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def put(self, jobID, respJSON):
+        self._queue.put((jobID, respJSON))
+
+    # waits for the queued responses to be merged.
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        report = self._base.getUserConfiguration.getValue(CPRT_HANDLER)
+        isClosed = False
+        while (not isClosed):
+            batch = [self._queue.get()]
+            while (len(batch) < self.MaxBatch):
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            updates = []
+            jobs = []
+            for item in batch:
+                if (item is None):
+                    isClosed = True
+                    continue
+                (jobID, respJSON) = item
+                updates += Report.getRemoteStatus(respJSON)
+                jobs.append((jobID, respJSON['status']
+                             if 'status' in respJSON else None))
+            if (updates):
+                try:
+                    report.updateRecordStatusBatch(updates)
+                except Exception as e:
+                    self._base.message('{}'.format(
+                        e), self._base.const_critical_text)
+            for (jobID, respStatus) in jobs:
+                self._completed += 1
+                self._base.message('Completed/{}/Status [{}] ({}/{})'.format(
+                    jobID, str(respStatus), self._completed, self._total))
+
+
 class ThreadPool(object):
     DefMaxWorkers = 1
     Job = 'job'
@@ -878,6 +1423,250 @@ class ThreadPool(object):
         return True
 
 
+# settles an upload once all of its files handed to the retry queue have, (onSettled) gets the overall status.
+class PendingUpload(object):
+
+    def __init__(self, onSettled):
+        self._lock = threading.Lock()
+        self._count = None      # set once the queued files are known.
+        self._done = 0
+        self._status = True
+        self._onSettled = onSettled
+
+    def retried(self, status):
+        with self._lock:
+            self._done += 1
+            self._status = self._status and bool(status)
+            settled = self._done == self._count
+        if (settled):
+            self._onSettled(self._status)
+
+    def setQueued(self, count):
+        with self._lock:
+            self._count = count
+            settled = self._done == count
+        if (settled):
+            self._onSettled(self._status)
+
+
+class RetryQueue(object):
+    BaseDelay = 1           # secs, doubled per attempt with full jitter.
+    MaxDelay = CDEL_DELAY_SECS * 3
+    RetryBudget = 0.2       # retries allowed as a fraction of the requests made, on top of the MinRetryBudget.
+    MinRetryBudget = 10
+    DefMaxWorkers = 4
+
+    def __init__(self, base=None, maxWorkers=DefMaxWorkers):
+        self._base = base
+        self._cond = threading.Condition()
+        self._queue = []    # heap of (due, seq, task)
+        self._seq = 0
+        self._pending = 0   # queued + running retries
+        self._requests = 0
+        self._retries = 0
+        self._maxWorkers = maxWorkers
+        self._pool = None
+        self._scheduler = None
+        self._closed = False
+
+    def message(self, message, messageType=0):
+        if (self._base is not None):
+            return self._base.message(message, messageType)
+        print(message)
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.MaxDelay, self.BaseDelay * (2 ** attempt)))
+
+    @property
+    def pending(self):
+        return self._pending
+
+    # calls (fnc) and on failure queues it for up to (attempts) retries. Returns True if the first call succeeded,
+    # None if queued or False if the retry budget turned it down.
+    # (onDone) is only called for the failed calls, with the final status, once they succeed or give up.
+    def run(self, fnc, attempts, onDone=None):
+        with self._cond:
+            self._requests += 1
+        if (self._call(fnc)):
+            return True
+        if (self._add((fnc, attempts, onDone, 1))):
+            return None
+        return False
+
+    def _call(self, fnc):
+        try:
+            return fnc()
+        except Exception as e:
+            self.message('Retry ({})'.format(str(e)), const_warning_text)
+            return False
+
+    def _add(self, task):
+        (fnc, attempts, onDone, attempt) = task
+        with self._cond:
+            queued = (attempt <= attempts and
+                      self._retries < self.MinRetryBudget + self.RetryBudget * self._requests)
+            if (queued):
+                self._retries += 1
+                self._pending += 1
+                self._seq += 1
+                heapq.heappush(
+                    self._queue, (time.time() + self.backoff(attempt), self._seq, task))
+                if (self._scheduler is None):
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self._maxWorkers)
+                    self._scheduler = threading.Thread(target=self._schedule)
+                    self._scheduler.daemon = True
+                    self._scheduler.start()
+                self._cond.notify_all()
+        if (not queued and
+                onDone):
+            onDone(False)
+        return queued
+
+    def _schedule(self):
+        while (True):
+            with self._cond:
+                if (not self._queue):
+                    if (self._closed):
+                        break
+                    self._cond.wait()
+                    continue
+                wait = self._queue[0][0] - time.time()
+                if (wait > 0):
+                    self._cond.wait(wait)
+                    continue
+                task = heapq.heappop(self._queue)[2]
+            self._pool.submit(self._execute, task)
+
+    def _execute(self, task):
+        (fnc, attempts, onDone, attempt) = task
+        try:
+            if (self._call(fnc)):
+                if (onDone):
+                    onDone(True)
+            else:
+                self._add((fnc, attempts, onDone, attempt + 1))
+        except Exception as e:
+            self.message('Retry ({})'.format(str(e)), const_critical_text)
+        finally:
+            with self._cond:
+                self._pending -= 1
+                self._cond.notify_all()
+
+    # blocks until all the queued retries have settled.
+    def wait(self):
+        with self._cond:
+            while (self._pending):
+                self._cond.wait()
+
+    # settles the queued retries and stops the scheduler/pool threads.
+    def close(self):
+        self.wait()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if (self._pool is not None):
+            self._pool.shutdown(wait=True)
+
+
+class RequestRateController(object):
+    # AIMD, the in-flight limit grows by one per (limit) successful requests and is cut on throttling.
+    DecreaseFactor = 0.5
+    MinLimit = 1
+    WindowSecs = 1          # throttle responses within a window count as a single congestion event.
+    RateWindowSecs = 5
+    ThrottleCodes = ('SlowDown', 'ServiceUnavailable', 'ServerBusy',
+                     'RequestLimitExceeded', 'Throttling', 'TooManyRequests')
+
+    def __init__(self, maxLimit, name='', base=None):
+        self._base = base
+        self._name = name
+        self._cond = threading.Condition()
+        self._maxLimit = max(self.MinLimit, maxLimit)
+        self._limit = float(self._maxLimit)
+        self._inflight = 0
+        self._requests = 0
+        self._throttled = 0
+        self._lastDecrease = 0
+        self._windowStart = time.time()
+        self._windowCount = 0
+        self._rate = 0.0
+
+    @staticmethod
+    def isThrottled(e):
+        try:
+            if (e.response['Error']['Code'] in RequestRateController.ThrottleCodes):    # botocore
+                return True
+        except BaseException:
+            pass
+        if (getattr(e, 'error_code', None) in RequestRateController.ThrottleCodes or     # azure
+                getattr(e, 'status_code', None) in (429, 503)):
+            return True
+        msg = str(e)
+        return any(code in msg for code in RequestRateController.ThrottleCodes)
+
+    def acquire(self):
+        with self._cond:
+            while (self._inflight >= int(self._limit)):
+                self._cond.wait()
+            self._inflight += 1
+
+    def release(self, throttled=False):
+        with self._cond:
+            self._inflight -= 1
+            self._requests += 1
+            now = time.time()
+            self._windowCount += 1
+            if (now - self._windowStart >= self.RateWindowSecs):
+                self._rate = self._windowCount / (now - self._windowStart)
+                self._windowStart = now
+                self._windowCount = 0
+            limit = self._limit
+            if (throttled):
+                self._throttled += 1
+                if (now - self._lastDecrease >= self.WindowSecs):
+                    self._lastDecrease = now
+                    self._limit = max(self.MinLimit,
+                                      self._limit * self.DecreaseFactor)
+            else:
+                self._limit = min(self._maxLimit,
+                                  self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+        # the additive ramp-up is silent, (metrics) has the current limit.
+        if (throttled and
+            int(limit) != int(self._limit) and
+                self._base is not None):
+            self._base.message('[{}] Throttled, request concurrency {} -> {}'.format(
+                self._name, int(limit), int(self._limit)), const_warning_text)
+
+    # runs a storage request within the current limit.
+    def call(self, fnc, *args, **kwargs):
+        self.acquire()
+        throttled = False
+        try:
+            return fnc(*args, **kwargs)
+        except Exception as e:
+            throttled = self.isThrottled(e)
+            raise
+        finally:
+            self.release(throttled)
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    @property
+    def metrics(self):
+        with self._cond:
+            rate = self._rate
+            elapsed = time.time() - self._windowStart
+            if (not rate and
+                    elapsed > 0):
+                rate = self._windowCount / elapsed
+            return {'limit': int(self._limit), 'inflight': self._inflight, 'rate': rate,
+                    'requests': self._requests, 'throttled': self._throttled}
+
+
 class RasterAssociates(object):
     RasterAuxExtensions = ['.lrc', '.idx', '.pjg', '.ppng', '.pft', '.pjp',
                            '.pzp', '.tif.cog.pzp', '.tif.cog.idx', '.tif.cogtiff.aux.xml']
@@ -955,12 +1744,19 @@ class Base(object):
     const_critical_text = 2
     const_status_text = 3
     # ends
+    CUploadThreadPrefix = 'ORUpload'
 
     def __init__(self, msgHandler=None, msgCallback=None, userConfig=None):
         self._m_log = msgHandler
         self._m_msg_callback = msgCallback
         self._m_user_config = userConfig
         self._lastMsg = ''
+        self._uploadPool = None
+        self._uploadPoolLock = threading.Lock()
+        self._retryQueue = None
+        self._rateControllers = {}
+        self._transferProgress = None
+        self._serverSideCopy = True
         if (self._m_msg_callback):
             if (self._m_log):
                 self._m_log.isPrint = False
@@ -968,6 +1764,7 @@ class Base(object):
     def init(self):
         self.hashInfo = {}
         self.timedInfo = {'files': []}
+        self.inputSizes = {}    # object key => size (bytes) off the input listing.
         self._modifiedProxies = []
         return True
 
@@ -1076,6 +1873,158 @@ class Base(object):
             _storePaths.append(encoded.split('=')[1])
         return '/'.join(_storePaths)
 
+    # returns the thread count set for (key) or the (default) if undefined/invalid.
+    def getThreadCount(self, key, default):
+        if (not self._m_user_config):
+            return default
+        try:
+            value = int(self._m_user_config.getValue(key))
+        except BaseException:
+            return default
+        return value if value > 0 else default
+
+    # uploads from all the download/conversion threads share this pool, sized by (UploadThreads).
+    def getUploadPool(self):
+        with self._uploadPoolLock:
+            if (self._uploadPool is None):
+                self._uploadPool = ThreadPoolExecutor(
+                    max_workers=self.getThreadCount(CCFG_UPLOAD_THREADS, CCLOUD_UPLOAD_THREADS), thread_name_prefix=self.CUploadThreadPrefix)
+        return self._uploadPool
+
+    # submits (fnc) to the upload pool, or runs it in place if called from one of the pool threads
+    # (e.g. the retry callbacks) as waiting on the pool from within could deadlock it once it's saturated.
+    def submitUpload(self, fnc, *args, **kwargs):
+        if (not threading.current_thread().name.startswith(self.CUploadThreadPrefix)):
+            return self.getUploadPool().submit(fnc, *args, **kwargs)
+        from concurrent.futures import Future
+        future = Future()
+        try:
+            future.set_result(fnc(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    # failed uploads/deletes are retried in the background, the calling threads move on.
+    def getRetryQueue(self):
+        with self._uploadPoolLock:
+            if (self._retryQueue is None):
+                self._retryQueue = RetryQueue(self)
+        return self._retryQueue
+
+    # storage request concurrency (AIMD) shared by all the S3/Azure requests in a (direction).
+    def getRateController(self, direction=CS3STORAGE_OUT):
+        with self._uploadPoolLock:
+            if (direction not in self._rateControllers):
+                isOut = direction == CS3STORAGE_OUT
+                self._rateControllers[direction] = RequestRateController(
+                    self.getThreadCount(CCFG_UPLOAD_THREADS, CCLOUD_UPLOAD_THREADS) if isOut else
+                    self.getThreadCount(CCFG_DOWNLOAD_THREADS, CCFG_THREADS), 'Upload' if isOut else 'Download', self)
+        return self._rateControllers[direction]
+
+    def getTransferProgress(self):
+        with self._uploadPoolLock:
+            if (self._transferProgress is None):
+                self._transferProgress = TransferProgress(self)
+        return self._transferProgress
+
+    def reportRequestRates(self):
+        if (self._transferProgress is not None):
+            self._transferProgress.report(final=True)
+        for direction in sorted(self._rateControllers):
+            controller = self._rateControllers[direction]
+            metrics = controller.metrics
+            self.message('[{}] Requests ({}), throttled ({}), rate ({:.2f}/s), concurrency limit ({})'.format(
+                controller._name, metrics['requests'], metrics['throttled'], metrics['rate'], metrics['limit']))
+
+    CAccessErrorCodes = ('AccessDenied', 'AllAccessDisabled', 'InvalidAccessKeyId', 'AuthorizationFailure',
+                         'AuthorizationPermissionMismatch', 'CannotVerifyCopySource')
+
+    # True if (e) is a permission/cross-account refusal by the storage (botocore/azure/google exceptions).
+    @staticmethod
+    def _isAccessError(e):
+        response = getattr(e, 'response', None)
+        if (isinstance(response, dict)):    # botocore
+            status = response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+            code = response.get('Error', {}).get('Code')
+        else:
+            status = getattr(e, 'status_code', None) or getattr(e, 'code', None)
+            code = getattr(e, 'error_code', None)
+        return (status in (401, 403) or
+                code in Base.CAccessErrorCodes)
+
+    # op=copyonly between the same cloud types copies the objects on the storage side, without the local transit.
+    def isServerSideCopy(self):
+        _user_config = self.getUserConfiguration
+        if (not self._serverSideCopy or
+                not _user_config):
+            return False
+        return (_user_config.getValue(CSERVER_SIDE_COPY) and
+                self.getBooleanValue(_user_config.getValue(CCLOUD_UPLOAD)) and
+                _user_config.getValue(CIN_CLOUD_TYPE, True) == _user_config.getValue(COUT_CLOUD_TYPE, True) and
+                not _user_config.getValue(CCLONE_PATH, False))
+
+    # returns False if the copy wasn't possible, the caller falls back to the download/upload.
+    def copyServerSide(self, target, source, key, targetKey):
+        if (target is None):
+            return False
+        self.message('[Copy] {} -> {}'.format(key, targetKey))
+        try:
+            if (not target.copyFrom(source, key, targetKey)):
+                self.message('[Copy] {} isn\'t available, using download/upload'.format(
+                    key), self.const_warning_text)
+                return False
+        except Exception as e:
+            if (self._isAccessError(e)):
+                # no read access to the source with the output credentials (cross-account etc), don't keep trying.
+                self._serverSideCopy = False
+                self.message('Server-side copy isn\'t available, using download/upload ({})'.format(
+                    str(e)), self.const_warning_text)
+                return False
+            # throttling/transient errors, only this key falls back to the download/upload.
+            self.message('[Copy] {} failed, using download/upload ({})'.format(
+                key, str(e)), self.const_warning_text)
+            return False
+        if (_rpt):
+            _rpt.updateRecordStatus(key, CRPT_COPIED, CRPT_YES)
+            _rpt.updateRecordStatus(key, CRPT_UPLOADED, CRPT_YES)
+        return True
+
+    def waitForRetries(self):
+        if (self._retryQueue is not None and
+                self._retryQueue.pending):
+            self.message('Waiting on ({}) pending retries..'.format(
+                self._retryQueue.pending))
+            self._retryQueue.wait()
+
+    # stops the upload pool/retry queue threads, for a (Base) that isn't used any further e.g. in the (-op=daemon) workers.
+    def closePools(self):
+        with self._uploadPoolLock:
+            (retryQueue, self._retryQueue) = (self._retryQueue, None)
+            (uploadPool, self._uploadPool) = (self._uploadPool, None)
+        if (retryQueue is not None):
+            retryQueue.close()
+        if (uploadPool is not None):
+            uploadPool.shutdown(wait=True)
+
+    # removes (path), a failed delete is queued for retries.
+    def removeFile(self, path):
+        def remove():
+            try:
+                os.remove(path)
+            except BaseException:
+                return not os.path.exists(path)
+            return True
+
+        def onDone(status):
+            if (status):
+                self.message('[Del] %s' % (path))
+                return
+            self.message('[Del] Err. (%s)' % (path), self.const_critical_text)
+        if (self.getRetryQueue().run(remove, CDEL_RETRIES, onDone)):
+            self.message('[Del] %s' % (path))
+            return True
+        return False
+
     def getBooleanValue(self, value):        # helper function
         if (value is None):
             return False
@@ -1187,8 +2136,18 @@ class Base(object):
                     _single_upload = self.getBooleanValue(user_args[CSIN_UPL])
                 if (CINC_SUB in user_args):
                     _include_subs = self.getBooleanValue(user_args[CINC_SUB])
+            queued = []     # uploads waiting on a retry, settled through (_postUpload)
+            Input = 'input'
+            recordInput = kwargs[Input] if kwargs and Input in kwargs else input_file
+            pendingUpload = PendingUpload(lambda status: setUploadRecordStatus(
+                recordInput, CRPT_YES if status else CRPT_NO))
             ret_buff = S3_storage.upload_group(
-                input_file, single_upload=_single_upload, include_subs=_include_subs)
+                input_file, single_upload=_single_upload, include_subs=_include_subs, onRetried=lambda f, status: self._postUpload(f, status, user_args, pendingUpload), queued=queued)
+            if (queued):
+                for f in ret_buff:
+                    self._removeUploaded(f, user_args)
+                pendingUpload.setQueued(len(queued))
+                return CUPL_PENDING
             if (len(ret_buff) == 0):
                 return False
         elif (upload_cloud_type == CCLOUD_AZURE):
@@ -1209,22 +2168,26 @@ class Base(object):
             if (indx >= 0):
                 file_name_prefix = file_name_prefix[:indx]
             input_folder = os.path.dirname(_input_file)
+            uploads = []
             for r, d, f in os.walk(input_folder):
                 r = r.replace('\\', '/')
                 if (r == input_folder):
                     for _file in f:
                         if (_file.startswith('{}.'.format(file_name_prefix))):
                             file_to_upload = os.path.join(r, _file)
-                            if (azure_storage.upload(
+                            uploads.append((file_to_upload, self.submitUpload(
+                                azure_storage.upload,
                                 file_to_upload,
                                 self._m_user_config.getValue(
                                     COUT_AZURE_CONTAINER, False),
                                 self._m_user_config.getValue(
                                     CCFG_PRIVATE_OUTPUT, False),
                                 properties, name=_source_path, method=TimeIt.Upload, store=self
-                            )):
-                                ret_buff.append(file_to_upload)
+                            )))
                     break
+            for file_to_upload, upload in uploads:
+                if (upload.result()):
+                    ret_buff.append(file_to_upload)
         elif (upload_cloud_type == Store.TypeGoogle):
             if (google_storage is None):
                 self.message(internal_err_msg, self.const_critical_text)
@@ -1240,6 +2203,7 @@ class Base(object):
             if (indx >= 0):
                 file_name_prefix = file_name_prefix[:indx]
             input_folder = os.path.dirname(_input_file)
+            uploads = []
             for r, d, f in os.walk(input_folder):
                 r = r.replace('\\', '/')
                 if (r == input_folder):
@@ -1247,63 +2211,68 @@ class Base(object):
                         if (_file.startswith('{}.'.format(file_name_prefix))):
                             file_to_upload = self.convertToForwardSlash(
                                 os.path.join(r, _file), False)
-                            if (google_storage.upload(
+                            uploads.append((file_to_upload, self.submitUpload(
+                                google_storage.upload,
                                 file_to_upload,
                                 self._m_user_config.getValue(
                                     COUT_GOOGLE_BUCKET, False),
                                 self._m_user_config.getValue(
                                     CCFG_PRIVATE_OUTPUT, False),
                                 properties
-                            )):
-                                ret_buff.append(file_to_upload)
+                            )))
                     break
+            for file_to_upload, upload in uploads:
+                if (upload.result()):
+                    ret_buff.append(file_to_upload)
         if (CS3_MSG_DETAIL):
             self.message('Following file(s) uploaded to ({})'.format(
                 upload_cloud_type.capitalize()))
             [self.message('{}'.format(f)) for f in ret_buff]
-        if (user_args):
-            if (USR_ARG_DEL in user_args):
-                if (user_args[USR_ARG_DEL] and
-                        user_args[USR_ARG_DEL]):
-                    isProxyCSV = False
-                    rpt = self.getUserConfiguration.getValue(CPRT_HANDLER)
-                    if (rpt):
-                        proxyPath = rpt._header.get(CRASTERPROXYPATH)
-                        tmpOutput = rpt._header.get(CTEMPOUTPUT)
-                        if (proxyPath and
-                            tmpOutput and
-                                proxyPath[-4:].lower().endswith('.csv')):
-                            isProxyCSV = True
-                    for f in ret_buff:
-                        try:
-                            _is_remove = True
-                            if (til):
-                                if (til.fileTILRelated(f)):
-                                    _is_remove = False
-                            if (_is_remove):
-                                try:
-                                    if (isProxyCSV):
-                                        if (f.lower().endswith('.aux.xml')):
-                                            dstAuxPath = os.path.join(
-                                                os.path.dirname(proxyPath), os.path.basename(f))
-                                            self.message(
-                                                'Copying {} -> {}'.format(f, dstAuxPath))
-                                            shutil.copyfile(
-                                                f, dstAuxPath)  # GH 104
-                                    os.remove(f)
-                                except BaseException:
-                                    time.sleep(CDEL_DELAY_SECS)
-                                    os.remove(f)
-                                self.message('[Del] %s' % (f))
-                        except Exception as e:
-                            self.message('[Del] Err. (%s)' %
-                                         (str(e)), self.const_critical_text)
+        for f in ret_buff:
+            self._removeUploaded(f, user_args)
         if (ret_buff):
             Input = 'input'
             setUploadRecordStatus(
                 kwargs[Input] if kwargs and Input in kwargs else input_file, CRPT_YES)
         return (len(ret_buff) > 0)
 
+    # called for the uploads that went through the retry queue.
+    def _postUpload(self, f, status, user_args, pendingUpload):
+        if (status):
+            self._removeUploaded(f, user_args)
+        pendingUpload.retried(status)
+
+    def _removeUploaded(self, f, user_args):
+        if (not user_args or
+            USR_ARG_DEL not in user_args or
+                not user_args[USR_ARG_DEL]):
+            return
+        isProxyCSV = False
+        rpt = self.getUserConfiguration.getValue(CPRT_HANDLER)
+        if (rpt):
+            proxyPath = rpt._header.get(CRASTERPROXYPATH)
+            tmpOutput = rpt._header.get(CTEMPOUTPUT)
+            if (proxyPath and
+                tmpOutput and
+                    proxyPath[-4:].lower().endswith('.csv')):
+                isProxyCSV = True
+        try:
+            if (til):
+                if (til.fileTILRelated(f)):
+                    return
+            if (isProxyCSV):
+                if (f.lower().endswith('.aux.xml')):
+                    dstAuxPath = os.path.join(
+                        os.path.dirname(proxyPath), os.path.basename(f))
+                    self.message(
+                        'Copying {} -> {}'.format(f, dstAuxPath))
+                    shutil.copyfile(
+                        f, dstAuxPath)  # GH 104
+            self.removeFile(f)
+        except Exception as e:
+            self.message('[Del] Err. (%s)' %
+                         (str(e)), self.const_critical_text)
+
     def getSecuredCloudHandlerPrefix(self, direction):
         warningMsg = 'getSecuredCloudHandlerPrefix/{} is false'.format(
             '-usetoken' if direction == CS3STORAGE_IN else 'internal/usetokenonoutput')
@@ -1734,6 +2703,249 @@ class UpdateMRF:
         return True
 
 
+# view onto a single .orjob record. Reads/writes go straight to the columns in (ReportRecords).
+class ReportRecord(object):
+    __slots__ = ('_records', '_index')
+
+    def __init__(self, records, index):
+        self._records = records
+        self._index = index
+
+    def __getitem__(self, key):
+        value = self._records.getValue(self._index, key)
+        if (value is None):
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._records.setValue(self._index, key, value)
+
+    def __contains__(self, key):
+        return self._records.getValue(self._index, key) is not None
+
+    def get(self, key, default=None):
+        value = self._records.getValue(self._index, key)
+        return default if value is None else value
+
+
+# compact backing store for the .orjob records. Paths are kept as (interned folder id, name) and the
+# status values as one byte per record per column. Behaves as a list of paths (in insertion order).
+class ReportRecords(object):
+    CSTATUS_VALUES = ('', CRPT_YES, CRPT_NO)
+    CSTATUS_OTHER = 0xff    # value kept verbatim in the sparse (_extra) dict.
+
+    def __init__(self, lock=None):
+        self._folders = []
+        self._folder_ids = {}
+        self._record_folders = array.array('I')
+        self._record_names = []
+        self._records = {}      # folder_id => {name: record index}
+        self._status = {
+            CRPT_COPIED: bytearray(),
+            CRPT_PROCESSED: bytearray(),
+            CRPT_UPLOADED: bytearray()
+        }
+        self._extra = {}        # record index => {key: value}, for anything other than the status columns.
+        # callable to pull in the next chunk of records, returns False when there's nothing more to read.
+        self._loader = None
+        self._loader_thread = None
+        self._load_lock = lock if lock else threading.RLock()
+        # callable that returns the chunk no. a path is in or -1, to look up the records not read in yet.
+        self._locate = None
+        self._chunks = 1        # chunks read in, the first one by the caller.
+
+    def setLoader(self, loader, locate=None):
+        self._loader = loader
+        self._locate = locate
+
+    # reads in the pending chunks, one if (wait_all) is False or till chunk no. (upto) is in.
+    def _load(self, wait_all=True, upto=None):
+        if (self._loader is None):
+            return
+        with self._load_lock:
+            if (self._loader_thread == threading.get_ident()):
+                return      # records being added by the loader itself.
+            while (self._loader is not None and
+                   (upto is None or
+                    self._chunks <= upto)):
+                self._loader_thread = threading.get_ident()
+                try:
+                    more = self._loader()
+                finally:
+                    self._loader_thread = None
+                self._chunks += 1
+                if (not more):
+                    self._loader = None
+                if (not wait_all):
+                    break
+
+    @staticmethod
+    def _split(path):
+        indx = path.rfind('/') + 1
+        return (path[:indx], path[indx:])
+
+    def find(self, path):
+        index = self._find(path)
+        if (index == -1 and
+            self._loader is not None and
+                self._loader_thread != threading.get_ident()):
+            if (self._locate is None):
+                self._load()
+            else:
+                chunk = self._locate(path)
+                if (chunk == -1):
+                    return -1   # not in the chunks yet to be read either.
+                self._load(upto=chunk)
+            index = self._find(path)
+        return index
+
+    def _find(self, path):
+        (folder, name) = self._split(path)
+        folder_id = self._folder_ids.get(folder)
+        if (folder_id is None):
+            return -1
+        return self._records[folder_id].get(name, -1)
+
+    def append(self, path):
+        (folder, name) = self._split(path)
+        folder_id = self._folder_ids.get(folder)
+        if (folder_id is None):
+            folder_id = len(self._folders)
+            self._folders.append(sys.intern(folder))
+            self._folder_ids[self._folders[folder_id]] = folder_id
+            self._records[folder_id] = {}
+        index = len(self._record_names)
+        self._records[folder_id][name] = index
+        self._record_folders.append(folder_id)
+        self._record_names.append(name)
+        for column in self._status.values():
+            column.append(0)
+        return index
+
+    def path(self, index):
+        return '{}{}'.format(self._folders[self._record_folders[index]], self._record_names[index])
+
+    def getValue(self, index, key):
+        if (key in self._status):
+            code = self._status[key][index]
+            if (code != self.CSTATUS_OTHER):
+                return self.CSTATUS_VALUES[code]
+        extra = self._extra.get(index)
+        if (extra is None):
+            return None
+        return extra.get(key)
+
+    def setValue(self, index, key, value):
+        if (key in self._status):
+            if (value in self.CSTATUS_VALUES):
+                self._status[key][index] = self.CSTATUS_VALUES.index(value)
+                return
+            self._status[key][index] = self.CSTATUS_OTHER
+        self._extra.setdefault(index, {})[key] = value
+
+    def hasStatus(self, value):
+        self._load()
+        code = self.CSTATUS_VALUES.index(value)
+        for column in self._status.values():
+            if (code in column):
+                return True
+        return False
+
+    # copy of the (mutable) status columns to write out without holding any locks.
+    def snapshot(self):
+        self._load()
+        extra = {}
+        for index in self._extra:
+            extra[index] = dict(self._extra[index])
+        return (len(self), dict((key, bytes(self._status[key])) for key in self._status), extra)
+
+    # yields (path, copied, processed, uploaded) for each record in the (snapshot).
+    def rows(self, snapshot):
+        (length, status, extra) = snapshot
+        columns = (CRPT_COPIED, CRPT_PROCESSED, CRPT_UPLOADED)
+        for i in range(length):
+            row = [self.path(i)]
+            for key in columns:
+                code = status[key][i]
+                row.append(self.CSTATUS_VALUES[code] if code != self.CSTATUS_OTHER else extra[i][key])
+            yield row
+
+    def __contains__(self, path):
+        return self.find(path) != -1
+
+    def __len__(self):
+        self._load()
+        return len(self._record_names)
+
+    # emptiness check without reading in the pending chunks.
+    def __bool__(self):
+        if (not self._record_names):
+            self._load(wait_all=False)
+        return len(self._record_names) != 0
+
+    def __getitem__(self, index):
+        if (isinstance(index, slice)):
+            return [self.path(i) for i in range(*index.indices(len(self)))]
+        if (index < 0 or
+                index >= len(self._record_names)):
+            self._load()    # not read in yet.
+        if (index < 0):
+            index += len(self._record_names)
+        if (index < 0 or
+                index >= len(self._record_names)):
+            raise IndexError(index)
+        return self.path(index)
+
+    # records still to be read are pulled in a chunk at a time as the iteration reaches them.
+    def __iter__(self):
+        i = 0
+        while (True):
+            while (i < len(self._record_names)):
+                yield self.path(i)
+                i += 1
+            if (self._loader is None):
+                break
+            self._load(wait_all=False)
+            if (i == len(self._record_names)):
+                break
+
+
+# dict like access to (ReportRecords) keyed by path. Used for (Report._input_list_info).
+class ReportRecordsInfo(object):
+
+    def __init__(self, records):
+        self._records = records
+
+    def __contains__(self, path):
+        return self._records.find(path) != -1
+
+    def __getitem__(self, path):
+        index = self._records.find(path)
+        if (index == -1):
+            raise KeyError(path)
+        return ReportRecord(self._records, index)
+
+    def __setitem__(self, path, values):
+        index = self._records.find(path)
+        if (index == -1):
+            index = self._records.append(path)
+        for key in values:
+            self._records.setValue(index, key, values[key])
+
+    def get(self, path, default=None):
+        index = self._records.find(path)
+        return default if index == -1 else ReportRecord(self._records, index)
+
+    def keys(self):
+        return iter(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+
 class Report:
     CHEADER_PREFIX = '#'
     CJOB_EXT = '.orjob'
@@ -1745,13 +2957,18 @@ class Report:
     CHDR_MODE = 'mode'
     CHDR_OP = 'op'
     CHDR_JOB = 'job'
+    # status changes since the last write, replayed on read.
+    CJOURNAL_EXT = '.journal'
     # Delay in secs before the partial status of the .orjob gets written to the local disk.
     SnapshotDelay = 20
+    # No. of records parsed at a time with read(chunked=True)
+    ReadChunkSize = 10000
 
     def __init__(self, base):
-        self._input_list = []
-        self._input_list_info = {}
-        self._input_list_info_ex = {}
+        # guards the record tables. Held only for in-memory updates, never during file I/O other than the chunked reads.
+        self._lock = threading.RLock()
+        self._input_list = ReportRecords(self._lock)
+        self._input_list_info = ReportRecordsInfo(self._input_list)
         self._header = {
             'version': '{}/{}'.format(Application.__program_ver__, Application.__program_date__)
         }
@@ -1766,6 +2983,16 @@ class Report:
         # status report for these extensions will be skipped. Case insensitive comparison.
         self._m_skipExtentions = ('til.ovr')
         self._rptPreviousTime = datetime.now()
+        # reverse lookup of (-tempoutput) paths (minus extension) to their source entries in the .orjob
+        self._temp_output_map = {}
+        # normalised path => .orjob entry, filled at read()/addFile() time for entries that differ from their normalised path.
+        self._input_keys = {}
+        # (folder, URL_NAME) => .orjob entry for http inputs with a content-disposition filename.
+        self._input_truenames = {}
+        # serialises writes to the .orjob file.
+        self._write_lock = threading.Lock()
+        self._snapshot_pending = False
+        self._readStatus = True     # False if (read) or any of its later chunks failed.
 
     def init(self, report_file, root=None):
         if (not self._base or
@@ -1789,11 +3016,11 @@ class Report:
             _root = root.replace('\\', '/')
             if ((self._base.getUserConfiguration and
                  self._base.getUserConfiguration.getValue('Mode') == BundleMaker.CMODE)):
-                self._input_list.append(_root)
+                self.addFile(_root)
                 return True
             _root = self._base.convertToForwardSlash(_root, True)
             # first element in the report is the -input path to source
-            self._input_list.append(_root)
+            self.addFile(_root)
         return True
 
     @property
@@ -1824,40 +3051,53 @@ class Report:
 
     def _createSnapshot(self):  # take snapshot/updates .job file partially.
         rptCurrentTime = datetime.now()
-        rptDuration = (rptCurrentTime - self._rptPreviousTime).total_seconds()
-        if (rptDuration > self.SnapshotDelay):
+        with self._lock:
+            rptDuration = (rptCurrentTime -
+                           self._rptPreviousTime).total_seconds()
+            if (rptDuration <= self.SnapshotDelay or
+                    self._snapshot_pending):
+                return
+            self._snapshot_pending = True
+            self._rptPreviousTime = rptCurrentTime
+        # the snapshot is written out on its own thread so the caller (conversion/upload threads) isn't held up by disk I/O.
+        t = threading.Thread(target=self._writeSnapshot)
+        t.daemon = True
+        t.start()
+
+    def _writeSnapshot(self):
+        try:
             result = self.write()
             self._base.message(
                 'Orjob/Snapshot/Status>{}@{}'.format(str(result), str(str(datetime.utcnow()))))
-            self._rptPreviousTime = rptCurrentTime
+        finally:
+            with self._lock:
+                self._snapshot_pending = False
 
-    # input is the (src) path name which is case sensitive.
-    def updateRecordStatus(self, input, type, value):
-        if (input is None or
-            type is None or
-                value is None):
-            return False
-        self._createSnapshot()
-        _type = type.upper()
-        _value = value.lower()
+    @staticmethod
+    def _getNormalisedKey(input):
+        return input.strip().split('?')[0].replace('\\', '/')
+
+    def setTrueName(self, input, name):
+        with self._lock:
+            if (input not in self._input_list_info):
+                return False
+            self._input_list_info[input][self.CRPT_URL_TRUENAME] = name
+            (p, e) = os.path.split(input)
+            self._input_truenames[(p, name)] = input
+        return True
+
+    # returns the .orjob entry for (input) or None.
+    def _findRecordKey(self, input):
         if (-1 != input.find('X-Amz-Credential=')):
             if (input in self._input_list_info):
-                self._input_list_info[input][_type] = _value
-                return True
-        _input = input.strip().split('?')[0]
-        if (_input.lower().endswith(self._m_skipExtentions)):
-            return True     # not flagged as an err
+                return input
+        _input = self._getNormalisedKey(input)
         if (CTEMPINPUT in self._header):
             if (_input.startswith(self._header[CTEMPINPUT])):
                 _input = _input.replace(self._header[CTEMPINPUT], self.root)
-                (p, e) = os.path.split(_input)
-                for _k in self._input_list_info:
-                    if (_k.startswith(p)):
-                        if (self.CRPT_URL_TRUENAME in self._input_list_info[_k]):
-                            if (self._input_list_info[_k][self.CRPT_URL_TRUENAME] == e):
-                                _input = _k
-                                break
-        _path = os.path.dirname(_input.replace('\\', '/'))
+                _input = self._input_truenames.get(
+                    os.path.split(_input), _input)
+        _path = os.path.dirname(_input)
         if (not _path.endswith('/')):
             _path += '/'
         if (CRESUME_HDR_OUTPUT in self._header and
@@ -1865,10 +3105,28 @@ class Report:
             _input = _input.replace(_path, self._header[CRESUME_HDR_INPUT])
         (p, e) = os.path.splitext(_input)
         while (e):
-            _input = '{}{}'.format(p, e)
-            if (_input in self._input_list_info):
-                break
+            _key = self._findKey('{}{}'.format(p, e))
+            if (_key is not None):
+                return _key
             (p, e) = os.path.splitext(p)
+        return self._findKey(_input)
+
+    def _findKey(self, input):
+        if (input in self._input_list):
+            return input
+        return self._input_keys.get(input)
+
+    # input is the (src) path name which is case sensitive.
+    def updateRecordStatus(self, input, type, value):
+        if (input is None or
+            type is None or
+                value is None):
+            return False
+        self._createSnapshot()
+        _type = type.upper()
+        _value = value.lower()
+        if (self._getNormalisedKey(input).lower().endswith(self._m_skipExtentions)):
+            return True     # not flagged as an err
         if (_type not in [CRPT_COPIED, CRPT_PROCESSED, CRPT_UPLOADED]):
             self._base.message('Invalid type ({}) at (Reporter)'.format(
                 type), self._base.const_critical_text)
@@ -1877,43 +3135,63 @@ class Report:
             self._base.message('Invalid value ({}) at (Reporter)'.format(
                 _value), self._base.const_critical_text)
             return False
-        if (not e):
-            if (_input in self._input_list_info and
+        with self._lock:
+            _input = self._findRecordKey(input)
+            if (_input is None):
+                return False
+            self._input_list_info[_input][_type] = _value
+            (p, e) = os.path.splitext(_input)
+            if (not e and
                     self.CRPT_URL_TRUENAME in self._input_list_info[_input]):
                 (p, e) = os.path.splitext(
                     self._input_list_info[_input][self.CRPT_URL_TRUENAME])
-            if (not e):  # still no extension?
-                self._base.message(
-                    'Invalid input/no extension for ({})/Reporter'.format(_input), self._base.const_warning_text)
-                self._input_list_info[_input][_type] = _value
-                return False
-        self._input_list_info[_input][_type] = _value
+        if (not e):  # still no extension?
+            self._base.message(
+                'Invalid input/no extension for ({})/Reporter'.format(_input), self._base.const_warning_text)
+            return False
         return True
 
     def addHeader(self, key, value):
         if (not key or
                 value is None):
             return False
-        self._header[key.lower()] = value
+        with self._lock:
+            self._header[key.lower()] = value
         return True
 
     def removeHeader(self, key):
         if (not key):
             return False
-        if (not key.lower() in self._header):
-            return False
-        del self._header[key.lower()]
+        with self._lock:
+            if (not key.lower() in self._header):
+                return False
+            del self._header[key.lower()]
         return True
 
     def addFile(self, file):
         if (not file):
             return False
         _file = file.replace('\\', '/')
-        _get_store = self.findWith(_file)
-        if (_get_store and
-                _get_store == _file):
-            return False        # no duplicate entries allowed.
-        self._input_list.append(_file)
+        with self._lock:
+            if (_file in self._input_list):
+                return False        # no duplicate entries allowed.
+            self._input_list.append(_file)
+            _key = self._getNormalisedKey(_file)
+            if (_key != _file and
+                    _key not in self._input_keys):
+                self._input_keys[_key] = _file
+        return True
+
+    # adds (file) along with its initial status values.
+    def addRecord(self, file, copied='', processed='', uploaded=''):
+        with self._lock:
+            if (not self.addFile(file)):
+                return False
+            self._input_list_info[file.replace('\\', '/')] = {
+                CRPT_COPIED: copied,
+                CRPT_PROCESSED: processed,
+                CRPT_UPLOADED: uploaded
+            }
         return True
 
     @property
@@ -1934,101 +3212,255 @@ class Report:
 
     @property
     def root(self):
-        if (not self._input_list):
+        if (not self._input_list):      # (ReportRecords.__bool__) doesn't read in the pending chunks.
             return ''
-        _root = self._input_list[0]
         if (CRESUME_HDR_INPUT in self._header):
             _root = self._header[CRESUME_HDR_INPUT]
             if (_root.lower().startswith('http')):
                 if (not _root.endswith('/')):
                     _root += '/'
-        return _root
+            return _root
+        return self._input_list[0]
+
+    # with (chunked=True) only the headers and the first (ReadChunkSize) records are read in. The remaining records are
+    # only indexed (key hash => chunk) and read in a chunk at a time as they are iterated or looked up.
+    def read(self, readCallback=None, chunked=False):
+        self._readStatus = True
+        self._retryAll = False
+        self._chunkOffsets = []     # file offsets of the chunks after the first.
+        self._chunksRead = 1
+        hashes = array.array('q')
+        chunkIds = array.array('I')
+        records = 0
+        try:
+            self._journal = self._readJournal()
+            for (offset, _fname, lns) in self._readLines(0, readCallback):
+                if (not chunked or
+                        records < self.ReadChunkSize):
+                    self._addRecordLine(_fname, lns)
+                else:
+                    if (records % self.ReadChunkSize == 0):
+                        self._chunkOffsets.append(offset)
+                    for key in {_fname, self._getNormalisedKey(_fname)}:
+                        hashes.append(hash(key))
+                        chunkIds.append(len(self._chunkOffsets))
+                records += 1
+        except Exception as exp:
+            self._base.message('{}'.format(str(exp)),
+                               self._base.const_critical_text)
+            self._readStatus = False
+            return False
+        if (not self._chunkOffsets):
+            self._journal = {}
+            return True
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        self._chunkHashes = array.array('q', (hashes[i] for i in order))
+        self._chunkIds = array.array('I', (chunkIds[i] for i in order))
+        self._input_list.setLoader(self._readChunk, self._locateChunk)
+        return True
 
-    def read(self, readCallback=None):
+    # returns the chunk no. (input) is in or -1 if it isn't in any of the chunks yet to be read.
+    def _locateChunk(self, input):
+        key = hash(input)
+        indx = bisect.bisect_left(self._chunkHashes, key)
+        chunk = -1
+        while (indx < len(self._chunkHashes) and
+               self._chunkHashes[indx] == key):
+            chunk = max(chunk, self._chunkIds[indx])     # hash collisions, the later chunk covers both.
+            indx += 1
+        return chunk
+
+    # reads in the next chunk, the file is opened for each chunk at the offset saved by read().
+    # Returns False once there are no more chunks left.
+    def _readChunk(self):
+        lines = self._readLines(self._chunkOffsets[self._chunksRead - 1])
         try:
-            with open(self._report_file, 'r', encoding='utf-8') as _fptr:
+            records = 0
+            for (offset, _fname, lns) in lines:
+                if (records == self.ReadChunkSize):
+                    break
+                self._addRecordLine(_fname, lns)
+                records += 1
+        except Exception as exp:
+            self._base.message('Unable to read ({}), {}'.format(
+                self._report_file, str(exp)), self._base.const_critical_text)
+            self._readStatus = False    # reported by (hasFailures) and stops (write) from dropping the unread records.
+            return False
+        finally:
+            lines.close()
+        self._chunksRead += 1
+        if (self._chunksRead > len(self._chunkOffsets)):
+            self._journal = {}
+            return False
+        return True
+
+    def _addRecordLine(self, _fname, lns):
+        # for now, previously stored status values aren't used.
+        _copied = '' if len(lns) <= 1 else lns[1].strip()
+        _processed = '' if len(lns) <= 2 else lns[2].strip()
+        _uploaded = '' if len(lns) <= 3 else lns[3].strip()
+        if (self._retryAll):
+            _copied = _processed = _uploaded = ''   # reset all status
+        self.addRecord(_fname, _copied, _processed, _uploaded)
+        if (not self._retryAll):
+            for (_type, _value) in self._journal.pop(_fname, ()):
+                self._input_list_info[_fname][_type] = _value
+
+    # yields (offset, source, columns) for the records from (offset) on. The header lines are only read if (offset) is 0.
+    def _readLines(self, offset, readCallback=None):
+        isHeader = offset == 0
+        hdr_skipped = not isHeader
+        with open(self._report_file, 'rb') as _fptr:
+            _fptr.seek(offset)
+            while (True):
+                pos = _fptr.tell()
                 ln = _fptr.readline()
-                hdr_skipped = False
-                # If 'resume=='retryall', files will be copied/processed/uploaded regardless of the individual file status.
-                retryAll = False
-                while (ln):
-                    ln = ln.strip()
-                    if (not ln or
-                            ln.startswith('##')):        # ignore empty-lines and comment lines (beginning with '##')
-                        ln = _fptr.readline()
+                if (not ln):
+                    break
+                ln = ln.decode('utf-8').strip()
+                if (not ln or
+                        ln.startswith('##')):        # ignore empty-lines and comment lines (beginning with '##')
+                    continue
+                if (readCallback):      # client side callback support.
+                    readCallback(ln)
+                lns = ln.split(self.CVSCHAR)
+                _fname = lns[0].strip().replace('\\', '/')
+                if (_fname.startswith(self.CHEADER_PREFIX)):
+                    _hdr = _fname.replace(
+                        self.CHEADER_PREFIX, '').split('=')
+                    if (len(_hdr) > 1):
+                        if (isHeader):
+                            self._readHeader(_hdr)
                         continue
-                    if (readCallback):      # client side callback support.
-                        readCallback(ln)
-                    lns = ln.split(self.CVSCHAR)
-                    _fname = lns[0].strip().replace('\\', '/')
-                    if (_fname.startswith(self.CHEADER_PREFIX)):
-                        _hdr = _fname.replace(
-                            self.CHEADER_PREFIX, '').split('=')
-                        if (len(_hdr) > 1):
-                            _hdr_key = _hdr[0].strip()
-                            _hdr.pop(0)
-                            _hdr_val = '='.join(_hdr).strip()
-                            if (_hdr_key == CTEMPINPUT or
-                                    _hdr_key == CTEMPOUTPUT):
-                                if (not _hdr_val.endswith('/')):
-                                    _hdr_val += '/'
-                            elif (_hdr_key == Lambda.queue_length):
-                                if (not str.isdigit(_hdr_val)):
-                                    ln = _fptr.readline()
-                                    continue
-                                # filter {Lambda.queuelength}
-                                _hdr_val = int(_hdr_val)
-                            elif (_hdr_key == self.CHDR_MODE):
-                                _hdr_val = _hdr_val.lower()  # lower case (mode)
-                            self.addHeader(_hdr_key, _hdr_val)
-                            ln = _fptr.readline()
-                            continue
-                    if (not _fname or
-                            not hdr_skipped):        # do not accept empty lines.
-                        if (ln.find(CRPT_SOURCE) >= 0 and
-                                ln.find(CRPT_COPIED)):      # skip line if it's the column header without the '#' prefix?
-                            ln = _fptr.readline()
-                        if (_fname):
-                            hdr_skipped = True
-                            if (CRESUME_HDR_INPUT in self._header):
-                                _input = self._header[CRESUME_HDR_INPUT]
-                                self._header[CRESUME_HDR_INPUT] = self._base.convertToForwardSlash(
-                                    _input, True)  # force suffix with '/' for input folders
-                                _input = _input.lower()
-                                if (_input.startswith('http://') or
-                                        _input.startswith('https://')):
-                                    self._isInputHTTP = True
-                            if (not retryAll and
-                                    CRESUME_ARG in self._header):
-                                if (self._header[CRESUME_ARG].lower() == CRESUME_ARG_VAL_RETRYALL):
-                                    retryAll = True
+                if (not _fname):        # do not accept empty lines.
+                    continue
+                if (not hdr_skipped):
+                    hdr_skipped = True
+                    self._onHeaderRead()
+                    if (ln.find(CRPT_SOURCE) >= 0 and
+                            ln.find(CRPT_COPIED)):      # skip line if it's the column header without the '#' prefix?
                         continue
-                    # for now, previously stored status values aren't used.
-                    _copied = '' if len(lns) <= 1 else lns[1].strip()
-                    _processed = '' if len(lns) <= 2 else lns[2].strip()
-                    _uploaded = '' if len(lns) <= 3 else lns[3].strip()
-                    if (retryAll):
-                        _copied = _processed = _uploaded = ''   # reset all status
-                    if (self.addFile(_fname)):
-                        self._input_list_info[_fname] = {
-                            CRPT_COPIED: _copied,
-                            CRPT_PROCESSED: _processed,
-                            CRPT_UPLOADED: _uploaded
-                        }
-                    ln = _fptr.readline()
+                yield (pos, _fname, lns)
+
+    def _readHeader(self, _hdr):
+        _hdr_key = _hdr[0].strip()
+        _hdr.pop(0)
+        _hdr_val = '='.join(_hdr).strip()
+        if (_hdr_key == CTEMPINPUT or
+                _hdr_key == CTEMPOUTPUT):
+            if (not _hdr_val.endswith('/')):
+                _hdr_val += '/'
+        elif (_hdr_key == Lambda.queue_length):
+            if (not str.isdigit(_hdr_val)):
+                return
+            # filter {Lambda.queuelength}
+            _hdr_val = int(_hdr_val)
+        elif (_hdr_key == self.CHDR_MODE):
+            _hdr_val = _hdr_val.lower()  # lower case (mode)
+        self.addHeader(_hdr_key, _hdr_val)
+
+    # called once the headers before the first record are read in.
+    def _onHeaderRead(self):
+        if (CRESUME_HDR_INPUT in self._header):
+            _input = self._header[CRESUME_HDR_INPUT]
+            self._header[CRESUME_HDR_INPUT] = self._base.convertToForwardSlash(
+                _input, True)  # force suffix with '/' for input folders
+            _input = _input.lower()
+            if (_input.startswith('http://') or
+                    _input.startswith('https://')):
+                self._isInputHTTP = True
+        # If 'resume=='retryall', files will be copied/processed/uploaded regardless of the individual file status.
+        if (CRESUME_ARG in self._header):
+            if (self._header[CRESUME_ARG].lower() == CRESUME_ARG_VAL_RETRYALL):
+                self._retryAll = True
+
+    # returns the status changes since the last write, {source: [(type, value)]}. Applied as the records get read in
+    # so the lookups that read in a chunk see them before the last chunk is in.
+    def _readJournal(self):
+        updates = {}
+        journal = '{}{}'.format(self._report_file, self.CJOURNAL_EXT)
+        if (not os.path.exists(journal)):
+            return updates
+        with open(journal, 'r', encoding='utf-8') as _fptr:
+            for ln in _fptr:
+                lns = ln.rstrip('\n').split(self.CVSCHAR)
+                if (len(lns) != 3):
+                    continue    # partially written last line.
+                updates.setdefault(lns[0], []).append((lns[1], lns[2]))
+        return updates
+
+    # returns the status updates [(input, type, value)] in the function response (statusInfo).
+    @staticmethod
+    def getRemoteStatus(statusInfo):
+        updates = []
+        InputListInfo = 'input_list_info'
+        if (not statusInfo or
+                InputListInfo not in statusInfo):
+            return updates
+        for entry in statusInfo[InputListInfo]:
+            status = statusInfo[InputListInfo][entry]
+            for _type in status:
+                if (not status[_type]):
+                    continue
+                updates.append((entry, _type, status[_type]))
+        return updates
+
+    # applies (updates) [(input, type, value)] with a single lock and appends them to the job journal
+    # instead of leaving them to the next snapshot. Returns the no. of updates applied.
+    def updateRecordStatusBatch(self, updates):
+        applied = []
+        with self._lock:
+            for (input, type, value) in updates:
+                _type = type.upper()
+                _value = value.lower()
+                if (_type not in [CRPT_COPIED, CRPT_PROCESSED, CRPT_UPLOADED] or
+                        _value not in [CRPT_YES, CRPT_NO]):
+                    continue
+                if (self._getNormalisedKey(input).lower().endswith(self._m_skipExtentions)):
+                    continue
+                _input = self._findRecordKey(input)
+                if (_input is None):
+                    continue
+                self._input_list_info[_input][_type] = _value
+                applied.append((_input, _type, _value))
+        if (not applied):
+            return 0
+        _frmt = '{}/{}/{}\n'.replace('/', self.CVSCHAR)
+        try:
+            with self._write_lock:
+                with open('{}{}'.format(self._report_file, self.CJOURNAL_EXT), 'a', encoding='utf-8') as _fptr:
+                    for record in applied:
+                        _fptr.write(_frmt.format(*record))
         except Exception as exp:
             self._base.message('{}'.format(str(exp)),
                                self._base.const_critical_text)
+        return len(applied)
+
+    def findExact(self, input):
+        if (input in self._input_list):
+            return input
+        return None
+
+    @staticmethod
+    def _getTempOutputKey(output):
+        _output = output.replace('\\', '/')
+        if (_output.lower().endswith('.aux.xml')):
+            _output = _output[:-len('.aux.xml')]
+        return os.path.splitext(_output)[0]
+
+    # map the (-tempoutput) path of a scheduled conversion to its source entry in the .orjob.
+    def addTempOutputSource(self, output, source):
+        if (not output or
+                not source):
             return False
+        self._temp_output_map[self._getTempOutputKey(output)] = source
         return True
 
-    def findExact(self, input):
-        if (not self._input_list):
+    # returns the source entry for the output or any of its side-car files, None if unknown.
+    def findTempOutputSource(self, output):
+        if (not output):
             return None
-        for f in self._input_list:
-            if (f == input):
-                return f
-        return None
+        return self._temp_output_map.get(self._getTempOutputKey(output))
 
     def findWith(self, input):
         if (not self._input_list):
@@ -2048,7 +3480,11 @@ class Report:
             if (not os.path.exists(path)):
                 makedirs(path)
             self._base.message('[MV] {}'.format(mk_path))
-            shutil.move(self._report_file, mk_path)
+            self._input_list._load()    # the rest of the records (if any) are read off the file being moved.
+            with self._write_lock:
+                shutil.move(self._report_file, mk_path)
+                # any pending snapshot updates the moved file.
+                self._report_file = mk_path
         except Exception as e:
             self._base.message('({})'.format(str(e)),
                                self._base.const_critical_text)
@@ -2056,35 +3492,45 @@ class Report:
         return True
 
     def hasFailures(self):
+        if (not self._readStatus):
+            return True
         if (not self._input_list):
             return False
-        for f in self:
-            if (self._input_list_info[f][CRPT_COPIED] == CRPT_NO or
-                self._input_list_info[f][CRPT_PROCESSED] == CRPT_NO or
-                    self._input_list_info[f][CRPT_UPLOADED] == CRPT_NO):
-                return True
-        return False
+        with self._lock:
+            return self._input_list.hasStatus(CRPT_NO)
 
     def write(self):
+        if (not self._readStatus):
+            self._base.message('({}) was only partly read in, not written.'.format(
+                self._report_file), self._base.const_critical_text)
+            return False
         try:
             _frmt = '{}/{}/{}/{}\n'.replace('/', self.CVSCHAR)
-            with open(self._report_file, 'w+', encoding='utf-8') as _fptr:
-                for key in self._header:
-                    if (self.CHDR_OP == key):
-                        # op==createjob header is not written out into the output .orjob file.
-                        # This allows the .orjob file to be used with the -input arg to process the data separately.
-                        if (self._header[key] == COP_CREATEJOB):
-                            continue
-                    _fptr.write('{} {}={}\n'.format(
-                        self.CHEADER_PREFIX, key, self._header[key]))
-                _fptr.write(_frmt.format(CRPT_SOURCE, CRPT_COPIED,
-                                         CRPT_PROCESSED, CRPT_UPLOADED))
-                for f in self._input_list:
-                    _fptr.write(_frmt.format(f,
-                                             self._input_list_info[f][CRPT_COPIED] if f in self._input_list_info else '',
-                                             self._input_list_info[f][CRPT_PROCESSED] if f in self._input_list_info else '',
-                                             self._input_list_info[f][CRPT_UPLOADED] if f in self._input_list_info else ''
-                                             ))
+            with self._write_lock:
+                # copy the status values under the lock and do the file I/O without it.
+                with self._lock:
+                    header = list(self._header.items())
+                    records = self._input_list.snapshot()
+                # written to a temp file and swapped in, an exit mid-write (e.g. the snapshot thread) leaves the .orjob intact.
+                tmpFile = '{}.tmp'.format(self._report_file)
+                with open(tmpFile, 'w+', encoding='utf-8') as _fptr:
+                    for key, value in header:
+                        if (self.CHDR_OP == key):
+                            # op==createjob header is not written out into the output .orjob file.
+                            # This allows the .orjob file to be used with the -input arg to process the data separately.
+                            if (value == COP_CREATEJOB):
+                                continue
+                        _fptr.write('{} {}={}\n'.format(
+                            self.CHEADER_PREFIX, key, value))
+                    _fptr.write(_frmt.format(CRPT_SOURCE, CRPT_COPIED,
+                                             CRPT_PROCESSED, CRPT_UPLOADED))
+                    for record in self._input_list.rows(records):
+                        _fptr.write(_frmt.format(*record))
+                os.replace(tmpFile, self._report_file)
+                # the journaled updates are now part of the .orjob.
+                journal = '{}{}'.format(self._report_file, self.CJOURNAL_EXT)
+                if (os.path.exists(journal)):
+                    os.remove(journal)
         except Exception as exp:
             self._base.message('{}'.format(str(exp)),
                                self._base.const_critical_text)
@@ -2108,11 +3554,9 @@ class Report:
         return True
 
     def walk(self):
-        walk_tree = []
         for f in self:
             (d, f) = os.path.split(f)
-            walk_tree.append(('{}/'.format(d), (), (f.strip(),)))
-        return walk_tree
+            yield ('{}/'.format(d), (), (f.strip(),))
 
     def __iter__(self):
         return iter(self._input_list)
@@ -2123,12 +3567,7 @@ class Report:
         InputListInfo = 'input_list_info'
         if (InputListInfo not in statusInfo):
             return False
-        for entry in statusInfo[InputListInfo]:
-            status = statusInfo[InputListInfo][entry]
-            for _type in status:
-                if (not status[_type]):
-                    continue
-                self.updateRecordStatus(entry, _type, status[_type])
+        self.updateRecordStatusBatch(self.getRemoteStatus(statusInfo))
         return True
 
     def addMetadata(self, file, key, value):
@@ -2139,14 +3578,11 @@ class Report:
                                self._base.const_critical_text)
             return False
         _file = file.replace('\\', '/')
-        srchIndex = -1
-        try:
-            srchIndex = list(self._input_list_info.keys()).index(_file)
-        except Exception as e:
-            return False
-        if (srchIndex not in self._input_list_info_ex):
-            self._input_list_info_ex[srchIndex] = {}
-        self._input_list_info_ex[srchIndex][key] = value
+        with self._lock:
+            srchIndex = self._input_list.find(_file)
+            if (srchIndex == -1):
+                return False
+            self._input_list.setValue(srchIndex, key, value)
         return True
 
     def getMetadata(self, file, key):
@@ -2156,18 +3592,17 @@ class Report:
                                self._base.const_critical_text)
             return None
         _file = file.replace('\\', '/')
-        srchIndex = -1
-        try:
-            srchIndex = list(self._input_list_info.keys()).index(_file)
-        except Exception as e:
-            return None
-        if (key not in self._input_list_info_ex[srchIndex]):
+        srchIndex = self._input_list.find(_file)
+        if (srchIndex == -1):
             return None
-        return self._input_list_info_ex[srchIndex][key]
+        return self._input_list.getValue(srchIndex, key)
 
     def __len__(self):
         return len(self._input_list)
 
+    def __bool__(self):
+        return bool(self._input_list)
+
     def __getitem__(self, index):
         return self._input_list[index]
 
@@ -2186,6 +3621,16 @@ class TIL:
         self._tils_info = {}
         self._output_path = {}
         self._defaultTILProcessing = False
+        # lookup indexes over (_tils/_rasters/_output_path).
+        self._tils_lookup = set()
+        self._raster_tils = {}      # raster filename => key in (_tils_info)
+        self._output_path_sources = {}
+        # sorted on demand for the prefix checks at (fileTILRelated), (_rasters) keeps the order the files were read in.
+        self._til_names = []
+        self._raster_names = []
+        self._names_sorted = True
+        # .til files can be parsed on multiple threads (S3Storage.getS3Content)
+        self._lock = threading.RLock()
 
     @property
     def defaultTILProcessing(self):
@@ -2203,9 +3648,16 @@ class TIL:
     def addTIL(self, input):
         # This when the (til) files are found before the associated (files) could be not found at the (til) location because they may not have been downloaded yet.
         _input = input.replace('\\', '/')
-        if (_input not in self._tils):
+        with self._lock:
+            return self._addTIL(_input)
+
+    def _addTIL(self, _input):
+        if (_input not in self._tils_lookup):
             self._tils.append(_input)
-        if (not input.lower() in self._tils_info):
+            self._tils_lookup.add(_input)
+            self._til_names.append(os.path.basename(_input))
+            self._names_sorted = False
+        if (not _input.lower() in self._tils_info):
             self._tils_info[_input.lower()] = {
                 self.CRELATED_FILE_COUNT: 0,
                 self.CPROCESSED_FILE_COUNT: 0,
@@ -2215,32 +3667,36 @@ class TIL:
         return True
 
     def findOriginalSourcePath(self, processPath):
-        for path in self._output_path:
-            if (self._output_path[path] == processPath):
-                return path
-        return None
+        return self._output_path_sources.get(processPath)
+
+    @staticmethod
+    def _hasPrefix(names, prefix):
+        indx = bisect.bisect_left(names, prefix)
+        return (indx < len(names) and
+                names[indx].startswith(prefix))
 
+    # returns True if (input) is a .til file or any of the files (.tif, .imd, ..) sharing its name.
     def fileTILRelated(self, input):
         idx = input.split('.')
         f = idx[0]
         f = f.replace('\\', '/').split('/')
         f = f[len(f) - 1]
-        for t in self._tils:
-            if (t.find(f) >= 0):
-                return True
-        for t in self._rasters:
-            if (t.startswith(f)):
-                return True
-        return False
+        with self._lock:
+            if (not self._names_sorted):
+                self._til_names.sort()
+                self._raster_names = sorted(self._rasters)
+                self._names_sorted = True
+            return (self._hasPrefix(self._til_names, f) or
+                    self._hasPrefix(self._raster_names, f))
 
     def addFileToProcessed(self, input):
-        for t in self._tils:
-            _key_til_info = t.lower()
-            if (_key_til_info in self._tils_info):
-                if (input in self._tils_info[_key_til_info][self.CKEY_FILES]):
-                    self._tils_info[_key_til_info][self.CPROCESSED_FILE_COUNT] += 1
-                    return True
-        return False
+        _key_til_info = self._raster_tils.get(input)
+        if (_key_til_info is None or
+                _key_til_info not in self._tils_info):
+            return False
+        with self._lock:
+            self._tils_info[_key_til_info][self.CPROCESSED_FILE_COUNT] += 1
+        return True
 
     def isAllFilesProcessed(self, input):
         if (not input):
@@ -2265,9 +3721,11 @@ class TIL:
         splt = ln.replace('"', '').replace(';', '').split(CBREAK)
         if (len(splt) == 2):
             file_name = splt[1].strip()
-            if (file_name not in self._rasters):
-                self._rasters.append(file_name)
+            if (file_name not in self._raster_tils):
                 _key_til_info = fileName.lower()
+                self._rasters.append(file_name)
+                self._names_sorted = False
+                self._raster_tils[file_name] = _key_til_info
                 if (not self._tils_info[_key_til_info][self.CRASTER_EXT_IN_TIL]):
                     rasterExtension = RasterAssociates.findExtension(file_name)
                     if (rasterExtension):
@@ -2278,12 +3736,14 @@ class TIL:
                         file_name)
         return True
 
+    # (content) is either the whole .til content or an iterable of its lines as they get read in.
     def processInMemoryTILContent(self, fileName, content):
         if (content is None):
             return False
-        lines = content.split('\n')
+        lines = content.split('\n') if isinstance(content, str) else content
         for line in lines:
-            self._processContent(fileName, line)
+            with self._lock:
+                self._processContent(fileName, line)
         return True
 
     def process(self, input):
@@ -2295,7 +3755,8 @@ class TIL:
         with open(input, 'r') as _fp:
             _line = _fp.readline()
             while (_line):
-                self._processContent(input, _line)
+                with self._lock:
+                    self._processContent(input, _line)
                 _line = _fp.readline()
         return True
 
@@ -2303,6 +3764,8 @@ class TIL:
     def setOutputPath(self, input, output):
         if (input not in self._output_path):
             self._output_path[input] = output
+            if (output not in self._output_path_sources):
+                self._output_path_sources[output] = input
 
     def getOutputPath(self, input):
         if (input not in self._output_path):
@@ -2310,39 +3773,141 @@ class TIL:
         return self._output_path[input]
 
     def find(self, input):
-        for _t in self._tils_info:
-            if (input in self._tils_info[_t][self.CKEY_FILES]):
-                if (self._tils_info[_t][self.CRELATED_FILE_COUNT] <= 1):
-                    return False
-                return True
-        return False
+        _t = self._raster_tils.get(input)
+        if (_t is None or
+                _t not in self._tils_info):
+            return False
+        if (self._tils_info[_t][self.CRELATED_FILE_COUNT] <= 1):
+            return False
+        return True
 
     def __iter__(self):
         return iter(self._tils)
 
 
+# shared by all the transfers in a run. Bytes are summed per file and in total, the throughput/ETA gets reported
+# at most every <ProgressSecs> rather than on each transfer callback. <ProgressPerFile> adds the in-flight files.
+class TransferProgress(object):
+    DefIntervalSecs = 10
+
+    def __init__(self, base):
+        self._base = base
+        self._lock = threading.Lock()
+        self._files = {}    # token: [filename, size, seen], a retry overlapping the original attempt gets its own.
+        self._nextToken = 0
+        self._totalBytes = 0
+        self._seenBytes = 0
+        self._completed = 0
+        self._startTime = None
+        self._lastReport = 0
+        self._intervalSecs = self.DefIntervalSecs
+        self._perFile = False
+        config = base.getUserConfiguration if base is not None else None
+        if (config):
+            try:
+                self._intervalSecs = float(config.getValue(CCFG_PROGRESS_SECS))
+            except (TypeError, ValueError):
+                pass
+            self._perFile = getBooleanValue(config.getValue(CCFG_PROGRESS_PER_FILE))
+
+    # returns the token to pass on to (update/done)
+    def add(self, filename, size):
+        with self._lock:
+            if (self._startTime is None):
+                self._startTime = self._lastReport = time.time()
+            self._nextToken += 1
+            self._files[self._nextToken] = [filename, size, 0]
+            self._totalBytes += size
+            return self._nextToken
+
+    def update(self, token, bytesAmount):
+        now = time.time()
+        with self._lock:
+            if (token in self._files):
+                self._files[token][2] += bytesAmount
+            self._seenBytes += bytesAmount
+            if (now - self._lastReport < self._intervalSecs):
+                return
+            self._lastReport = now
+            messages = self._getMessages(now)
+        for message in messages:
+            self._message(message)
+
+    # (ok) False drops the file from the totals, a retry gets added afresh.
+    def done(self, token, ok=True):
+        with self._lock:
+            if (token not in self._files):
+                return
+            filename, size, seen = self._files.pop(token)
+            if (ok):
+                self._completed += 1
+                self._seenBytes += size - seen
+            else:
+                self._totalBytes -= size
+                self._seenBytes -= seen
+
+    def report(self, final=False):
+        with self._lock:
+            if (self._startTime is None):
+                return
+            messages = self._getMessages(time.time(), final)
+        for message in messages:
+            self._message(message)
+
+    def _getMessages(self, now, final=False):
+        MB = 1024 * 1024
+        duration = max(now - self._startTime, 0.001)
+        rate = self._seenBytes / duration
+        if (final):
+            return ['[Transfer] Done, files ({}), {:.1f} MB in ({:.0f}s), {:.2f} MB/s'.format(
+                self._completed, self._seenBytes / MB, duration, rate / MB)]
+        remaining = max(self._totalBytes - self._seenBytes, 0)
+        messages = ['[Transfer] Files ({} in flight, {} done), {:.1f}/{:.1f} MB ({:.1f}%), {:.2f} MB/s, ETA ({})'.format(
+            len(self._files), self._completed, self._seenBytes / MB, self._totalBytes / MB,
+            self._seenBytes * 100 / self._totalBytes if self._totalBytes else 100, rate / MB,
+            '{:.0f}s'.format(remaining / rate) if rate > 0 else '-')]
+        if (self._perFile):
+            for filename, size, seen in sorted(self._files.values()):
+                messages.append('[Transfer] {} {:.1f}/{:.1f} MB ({:.1f}%)'.format(
+                    filename, seen / MB, size / MB, seen * 100 / size if size else 100))
+        return messages
+
+    def _message(self, message):
+        if (self._base is not None):
+            self._base.message(message, self._base.const_general_text)
+            return
+        print(message)
+
+
+# per-file transfer callback, feeds the shared (TransferProgress)
 class ProgressPercentage(object):
 
     def __init__(self, base, filename):
-        self._base = base       # base
-        self._filename = filename
-        self._size = float(os.path.getsize(filename))
-        self._seen_so_far = 0
-        self._lock = threading.Lock()
+        self._progress = base.getTransferProgress() if base is not None else TransferProgress(None)
+        self._token = self._progress.add(filename, os.path.getsize(filename))
 
     def __call__(self, bytes_amount):
-        with self._lock:
-            self._seen_so_far += bytes_amount
-            percentage = (self._seen_so_far / self._size) * 100
-            message = "%s / %d  (%.2f%%)" % (
-                self._seen_so_far, self._size,
-                percentage)
-            if (self._base is not None):
-                if (hasattr(self._base, 'message')):
-                    self._base.message(message, self._base.const_general_text)
-                    return True
-            sys.stdout.write(message)
-            sys.stdout.flush()
+        self._progress.update(self._token, bytes_amount)
+
+    def done(self, ok=True):
+        self._progress.done(self._token, ok)
+
+
+# file reader passed on to the SDKs that take a stream but have no transfer callback, reports the bytes read.
+class ProgressReader(object):
+
+    def __init__(self, fptr, progress):
+        self._fptr = fptr
+        self._progress = progress
+
+    def read(self, size=-1):
+        data = self._fptr.read(size)
+        if (data):
+            self._progress(len(data))
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._fptr, name)
 
 
 class S3Upload:
@@ -2371,10 +3936,14 @@ class S3Upload:
         # if (self.m_local_file.endswith('.lrc')):        # debug. Must be removed before release.
         # return True
         self._base.message('[S3-Push] {}'.format(self.m_local_file))
+        progress = None
         try:
-            self.mp.upload_file(self.m_local_file, self.m_s3_bucket.name, self.m_s3_path, extra_args={
-                                'ACL': self.m_acl_policy}, callback=ProgressPercentage(self._base, self.m_local_file))
+            progress = ProgressPercentage(self._base, self.m_local_file)
+            self._base.getRateController(CS3STORAGE_OUT).call(self.mp.upload_file, self.m_local_file, self.m_s3_bucket.name, self.m_s3_path, extra_args={
+                'ACL': self.m_acl_policy}, callback=progress)
         except Exception as e:  # trap any connection issues.
+            if (progress):
+                progress.done(False)
             msg = str(e)
             isRefreshToken = msg.find('(ExpiredToken)') != -1
             if (isRefreshToken):
@@ -2387,6 +3956,7 @@ class S3Upload:
             self._base.message('({})'.format(msg),
                                self._base.const_warning_text if isRefreshToken else self._base.const_critical_text)
             return False
+        progress.done()
         return True
 
     def __del__(self):
@@ -2520,6 +4090,12 @@ class Store(object):
             status_text = 'Err'
         print('{}{}{}'.format(status_text, '. ' if status_text else '', msg))
 
+    # object sizes off the input listing, used to pack the (-op=lambda) jobs.
+    def _addInputSize(self, name, size):
+        if (size is not None and
+                hasattr(self._base, 'inputSizes')):
+            self._base.inputSizes[name] = size
+
 
 class Google(Store):
     DafaultStorageDomain = 'http://storage.googleapis.com/'
@@ -2561,6 +4137,21 @@ class Google(Store):
     def id(self):
         return 'gs'  # short for google-storage
 
+    # GDAL env to access the bucket (/vsigs/) using the service account file.
+    def getGDALConfig(self):
+        if (not self._profile_name):
+            return None
+        return {
+            'GOOGLE_APPLICATION_CREDENTIALS': self._profile_name
+        }
+
+    # returns True if (blobName) exists in the bucket.
+    def exists(self, blobName):
+        try:
+            return self._bucket.blob(blobName).exists()
+        except Exception:
+            return False
+
     def _addBrowseContent(self, blobName):
         if (not blobName):
             return False
@@ -2580,6 +4171,7 @@ class Google(Store):
         super(Google, self).setSource(bucketName, url)
         for item in self._bucket.list_blobs(prefix=url, delimiter='/{}'.format('*' if self._include_subFolders else '')):
             self._addBrowseContent(item.name)
+            self._addInputSize(item.name, item.size)
             if (precb and
                     self._base.getUserConfiguration):
                 _resumeReporter = self._base.getUserConfiguration.getValue(
@@ -2660,10 +4252,14 @@ class Google(Store):
                 if (not is_tmp_input):
                     return True
             writeTo = output_path
-            self.message('[{}-Pull] {}'.format(self.id, blob_source))
             if (not is_raster):
                 writeTo = self._base.renameMetaFileToMatchRasterExtension(
                     writeTo)
+                if (self._base.isServerSideCopy()):
+                    if (self._base.copyServerSide(google_storage, self, blob_source, google_storage.getUploadPath(writeTo, _user_config.getValue(
+                            CCFG_PRIVATE_OUTPUT, False), {CTEMPOUTPUT: _user_config.getValue(CTEMPOUTPUT, False)}))):
+                        return True
+            self.message('[{}-Pull] {}'.format(self.id, blob_source))
             blob = self._bucket.get_blob(blob_source)
             blob.download_to_filename(writeTo)
             if (self._event_postCopyToLocal):
@@ -2701,11 +4297,8 @@ class Google(Store):
             return False
         return True
 
-    def upload(self, input_path, container_name, parent_folder, properties=None):
-        if (not input_path or
-            not container_name or
-                parent_folder is None):
-            return False
+    # returns the cloud path (input_path) is uploaded to.
+    def getUploadPath(self, input_path, parent_folder, properties=None):
         _parent_folder = parent_folder
         if (not _parent_folder):
             if (self._base.getUserConfiguration):
@@ -2727,11 +4320,33 @@ class Google(Store):
             (usrPath, usrPathPos) = usrPath.split(CHASH_DEF_SPLIT_CHAR)
             _parent_folder = self._base.insertUserTextToOutputPath('{}{}'.format(
                 _parent_folder, '/' if not _parent_folder.endswith('/') else ''), usrPath, usrPathPos)
+        return self._base.convertToForwardSlash(os.path.join(
+            _parent_folder, os.path.basename(input_path)), False)
+
+    # server-side copy (rewrite) of (blob_source) in the (source) bucket to (cloudPath) in this bucket.
+    def copyFrom(self, source, blob_source, cloudPath):
+        srcBlob = self._client.bucket(source._bucket.name).blob(blob_source)
+        dstBlob = self._client.bucket(self._bucket.name).blob(cloudPath)
+        token = None
+        while (True):
+            # large objects are rewritten over multiple calls.
+            token, bytesRewritten, totalBytes = self._base.getRateController(
+                CS3STORAGE_OUT).call(dstBlob.rewrite, srcBlob, token=token)
+            if (token is None):
+                break
+        return True
+
+    def upload(self, input_path, container_name, parent_folder, properties=None):
+        if (not input_path or
+            not container_name or
+                parent_folder is None):
+            return False
+        # uploads run concurrently on the same instance, use the locals over the (Store) members.
+        localPath = input_path
+        cloudPath = self.getUploadPath(input_path, parent_folder, properties)
         super(Google, self).upload(input_path,
-                                   container_name, _parent_folder, properties)
-        localPath = self._input_file_path
-        cloudPath = self._base.convertToForwardSlash(os.path.join(
-            self._upl_parent_folder, os.path.basename(localPath)), False)
+                                   container_name, os.path.dirname(cloudPath), properties)
+        progress = None
         try:
             self.message('[{}-Push] {}'.format(self.id, cloudPath))
             from google.cloud import storage
@@ -2739,10 +4354,14 @@ class Google(Store):
             client = storage.Client()
             bucket = client.get_bucket(self._bucket.name)
             blob = bucket.blob(cloudPath)
+            progress = ProgressPercentage(self._base, localPath)    # no transfer callback, the bytes get counted on (done).
             blob.upload_from_filename(localPath)
         except Exception as e:
+            if (progress):
+                progress.done(False)
             self.message(str(e), self.const_critical_text)
             return False
+        progress.done()
         return True
 
 
@@ -2751,6 +4370,7 @@ class Azure(Store):
     COUT_AZURE_ACCOUNTNAME_INFILE = 'azure_account_name'
     COUT_AZURE_ACCOUNTKEY_INFILE = 'azure_account_key'
     DefaultDomain = 'blob.core.windows.net'
+    CopyTimeoutSecs = 600   # server-side copies still pending after are aborted.
 
     class azBlobInternal(object):
         def __init__(self, name):
@@ -2823,8 +4443,7 @@ class Azure(Store):
                     else:
                         self._base.getUserConfiguration.setValue(
                             UseTokenOnOuput, True)
-                os.environ['AZURE_STORAGE_ACCOUNT'] = self._account_name.split('.')[
-                    0].split('//')[1]
+                os.environ['AZURE_STORAGE_ACCOUNT'] = self.accountId
                 if (self._account_key):
                     os.environ['AZURE_STORAGE_ACCESS_KEY'] = self._account_key
         except Exception as e:
@@ -2836,6 +4455,30 @@ class Azure(Store):
     def getAccountName(self):
         return self._account_name
 
+    # the storage account name off the account URL, or the name itself if given without one.
+    @property
+    def accountId(self):
+        return (urlparse(self._account_name).netloc or self._account_name).split('.')[0]
+
+    # GDAL env to access the account (/vsiaz/) using either the key or the SAS token.
+    def getGDALConfig(self):
+        if (not self._account_name or
+                (not self._account_key and
+                 not self._SASToken)):
+            return None
+        return {
+            'AZURE_STORAGE_ACCOUNT': self.accountId,
+            'AZURE_STORAGE_ACCESS_KEY': None if self._SASToken else self._account_key,
+            'AZURE_STORAGE_SAS_TOKEN': self._SASToken
+        }
+
+    # returns True if the blob (blob_name) exists in the container.
+    def exists(self, blob_name):
+        try:
+            return self._blob_service.get_blob_client(blob_name).exists()
+        except Exception:
+            return False
+
     def _runBlock(self, bobj, fobj, container_name, blob_name, block_id):
         fobj.seek(0)
         bobj.put_block(container_name, blob_name, fobj.read(), block_id)
@@ -2871,6 +4514,7 @@ class Azure(Store):
                         if (not bFound):
                             bFound = True
                         blobs.append(self.azBlobInternal(blob.name))
+                        self._addInputSize(blob.name, getattr(blob, 'size', None))
                     if (not bFound):
                         _resumeReporter.updateRecordStatus(
                             _resumeReporter._input_list[i], CRPT_COPIED, CRPT_NO)
@@ -2889,6 +4533,7 @@ class Azure(Store):
                 if (not name in _resumeReporter._input_list):
                     continue
             self._addBrowseContent(name)
+            self._addInputSize(name, getattr(blob, 'size', None))
             if (precb and
                     self._base.getUserConfiguration):
                 if (_resumeReporter):
@@ -2907,10 +4552,12 @@ class Azure(Store):
                 CPRT_HANDLER)
             cli = self._blob_service.get_blob_client(blob_source)
             with open(writeTo, 'wb') as writer:
-                cli.download_blob().download_to_stream(writer)
+                self._base.getRateController(CS3STORAGE_IN).call(
+                    lambda: cli.download_blob().download_to_stream(writer))
             _, f = os.path.split(blob_source)
             baseName = f.split(TarGzExt)[0]
             if (f.lower().endswith(TarGzExt)):
+                import tarfile
                 tarFile = tarfile.open(writeTo)
                 extractTo = os.path.join(os.path.dirname(writeTo), baseName)
                 tarFile.extractall(extractTo)
@@ -2922,12 +4569,7 @@ class Azure(Store):
                     if (_resumeReporter):
                         name = '{}/{}/{}'.format(
                             blob_source[:blob_source.rfind('/')], baseName, x.name)
-                        _resumeReporter.addFile(name)
-                        _resumeReporter._input_list_info[name] = {
-                            CRPT_COPIED: CRPT_YES,
-                            CRPT_PROCESSED: '',
-                            CRPT_UPLOADED: ''
-                        }
+                        _resumeReporter.addRecord(name, CRPT_YES)
                         if (not filterPaths(x.name, self._base.getUserConfiguration.getValue(CCFG_RASTERS_NODE))):
                             if (not bToCloud):
                                 trail = '{}/{}'.format(baseName, x.name)
@@ -3023,10 +4665,14 @@ class Azure(Store):
                 if (not is_tmp_input):
                     return True
             writeTo = output_path
-            self._base.message('[Azure-Pull] {}'.format(blob_source))
             if (not is_raster):
                 writeTo = self._base.renameMetaFileToMatchRasterExtension(
                     writeTo)
+                if (self._base.isServerSideCopy()):
+                    if (self._base.copyServerSide(azure_storage, self, blob_source, azure_storage.getUploadPath(writeTo, _user_config.getValue(
+                            CCFG_PRIVATE_OUTPUT, False), {CTEMPOUTPUT: _user_config.getValue(CTEMPOUTPUT, False)}))):
+                        return True
+            self._base.message('[Azure-Pull] {}'.format(blob_source))
             result = self.__copyRemoteToLocal(
                 blob_source, writeTo, name=blob_source, method=TimeIt.Download, store=self._base)
             if (not result):
@@ -3054,6 +4700,7 @@ class Azure(Store):
                 if (getBooleanValue(_user_config.getValue(CISTEMPINPUT))):
                     if (is_raster):
                         if (writeTo.endswith(TarGzExt[1:])):
+                            import tarfile
                             tarFile = tarfile.open(writeTo)
                             p, f = os.path.split(writeTo)
                             for x in tarFile.getmembers():
@@ -3078,12 +4725,8 @@ class Azure(Store):
             return False
         return True
 
-    @TimeIt.timeOperation
-    def upload(self, input_path, container_name, parent_folder, properties=None, **kwargs):
-        if (not input_path or
-            not container_name or
-                parent_folder is None):
-            return False
+    # returns the blob name (input_path) is uploaded to.
+    def getUploadPath(self, input_path, parent_folder, properties=None):
         _parent_folder = parent_folder
         if (not _parent_folder):
             if (self._base.getUserConfiguration):
@@ -3108,11 +4751,58 @@ class Azure(Store):
             (usrPath, usrPathPos) = usrPath.split(CHASH_DEF_SPLIT_CHAR)
             _parent_folder = self._base.insertUserTextToOutputPath('{}{}'.format(
                 _parent_folder, '/' if not _parent_folder.endswith('/') else ''), usrPath, usrPathPos)
+        return os.path.join(_parent_folder, os.path.basename(input_path))
+
+    # server-side copy of (blob_source) in the (source) container to (blob_name) in this container.
+    # returns False if the copy can't be done on the service, the caller falls back to the download/upload.
+    def copyFrom(self, source, blob_source, blob_name):
+        from azure.core.exceptions import ResourceExistsError
+        try:
+            self._blobSrvCli.create_container(self._blob_service.container_name)
+        except ResourceExistsError:
+            pass
+        src = source._blob_service.get_blob_client(blob_source)
+        sas = source._SASToken
+        if (not sas):
+            accountKey = getattr(source._blob_service.credential, 'account_key', None)
+            if (not accountKey):
+                return False    # AAD/token credentials, no key to sign the source URL with.
+            from azure.storage.blob import ResourceTypes, AccountSasPermissions, generate_account_sas
+            sas = generate_account_sas(source._blob_service.account_name, accountKey, resource_types=ResourceTypes(object=True),
+                                       permission=AccountSasPermissions(
+                                           read=True),
+                                       expiry=datetime.utcnow() + timedelta(hours=1))
+        dst = self._blob_service.get_blob_client(blob_name)
+        self._base.getRateController(CS3STORAGE_OUT).call(
+            dst.start_copy_from_url, '{}?{}'.format(src.url, sas.lstrip('?')))
+        # copies across accounts complete asynchronously on the service.
+        copy = dst.get_blob_properties().copy
+        timeEnd = time.time() + self.CopyTimeoutSecs
+        while (copy.status == 'pending'):
+            if (time.time() > timeEnd):
+                dst.abort_copy(copy.id)
+                self.message('[Copy] ({}) timed out after ({}s), aborted'.format(
+                    blob_name, self.CopyTimeoutSecs), self.const_warning_text)
+                return False
+            time.sleep(1)
+            copy = dst.get_blob_properties().copy
+        status = copy.status
+        if (status != 'success'):
+            raise Exception('Copy status ({}) for ({})'.format(
+                status, blob_name))
+        return True
+
+    @TimeIt.timeOperation
+    def upload(self, input_path, container_name, parent_folder, properties=None, **kwargs):
+        if (not input_path or
+            not container_name or
+                parent_folder is None):
+            return False
+        # uploads run concurrently on the same instance, use the locals over the (Store) members.
+        blob_path = input_path
+        blob_name = self.getUploadPath(input_path, parent_folder, properties)
         super(Azure, self).upload(input_path,
-                                  container_name, _parent_folder, properties)
-        blob_path = self._input_file_path
-        blob_name = os.path.join(
-            self._upl_parent_folder, os.path.basename(blob_path))
+                                  container_name, os.path.dirname(blob_name), properties)
 # if (blob_name.endswith('.lrc')):         # debug. Must be removed before release.
 # return True                          #  "
         # return True     # debug. Must be removed before release.
@@ -3121,12 +4811,12 @@ class Azure(Store):
         time_to_wait_before_retry = 3
         max_time_to_wait = 60
         self.message('Accessing container ({})..'.format(
-            self._upl_container_name))
+            container_name))
         while (True):
             try:
                 _access = properties['access'] if properties and 'access' in properties else None
                 self._blobSrvCli.create_container(
-                    self._upl_container_name, public_access=_access)
+                    container_name, public_access=_access)
                 isContainerCreated = True
                 break
             except Exception as e:
@@ -3147,19 +4837,24 @@ class Azure(Store):
                     break
         if (not isContainerCreated):
             self.message('Unable to create the container ({})'.format(
-                self._upl_container_name), self.const_critical_text)
+                container_name), self.const_critical_text)
             exit(1)
         self.message('Done.')
         st = datetime.now()
+        progress = None
         try:
             from azure.storage.blob import ContentSettings
+            import mimetypes
             with open(blob_path, 'rb') as reader:
                 cli = self._blob_service.get_blob_client(blob_name)
                 mtype, encoding = (mimetypes.guess_type(blob_path))
                 self.message('Uploading ({})'.format(blob_path))
-                cli.upload_blob(
-                    reader, overwrite=True, content_settings=ContentSettings(content_type=mtype))
+                progress = ProgressPercentage(self._base, blob_path)
+                self._base.getRateController(CS3STORAGE_OUT).call(cli.upload_blob,
+                                                                  ProgressReader(reader, progress), overwrite=True, content_settings=ContentSettings(content_type=mtype))
         except Exception as e:
+            if (progress):
+                progress.done(False)
             self.message('File open/upload: ({})'.format(str(e)),
                          self.const_critical_text)
             return False
@@ -3167,6 +4862,7 @@ class Azure(Store):
             self.message('Duration. ({} sec)'.format(
                 (datetime.now() - st).seconds))
             self.message('Done.')
+        progress.done()
         return True
 
 
@@ -3174,6 +4870,9 @@ class S3Storage:
     RoleAccessKeyId = 'AccessKeyId'
     RoleSecretAccessKey = 'SecretAccessKey'
     RoleToken = 'Token'
+    _sessions = {}      # used if (CWarmCache)
+    _regions = {}
+    _cacheLock = threading.Lock()
 
     def __init__(self, base):
         self._base = base
@@ -3181,6 +4880,30 @@ class S3Storage:
         self._isRequesterPay = False
         self._isNoAccessToListBuckets = False
         self._direction = CS3STORAGE_IN
+        self._session = None
+
+    # the service models/credential chain are loaded once per session, the daemon workers keep theirs across jobs.
+    @staticmethod
+    def _getSession(*args, **kwargs):
+        if (not CWarmCache):
+            return boto3.Session(*args, **kwargs)
+        key = (args, tuple(sorted(kwargs.items())))
+        with S3Storage._cacheLock:
+            if (key not in S3Storage._sessions):
+                S3Storage._sessions[key] = boto3.Session(*args, **kwargs)
+            return S3Storage._sessions[key]
+
+    def _getBucketRegion(self, bucketCon, endpointURL):
+        key = (endpointURL, self.m_bucketname)
+        if (CWarmCache and
+                key in self._regions):
+            return self._regions[key]
+        loc = bucketCon.get_bucket_location(Bucket=self.m_bucketname)[
+            'LocationConstraint']
+        if (CWarmCache):
+            with self._cacheLock:
+                self._regions[key] = loc
+        return loc
 
     def init(self, remote_path, s3_key, s3_secret, direction):
         if (not isinstance(self._base, Base)):
@@ -3231,8 +4954,8 @@ class S3Storage:
                         self.CAWS_ACCESS_KEY_SECRET is None and \
                         _profile_name is None
                     try:
-                        session = boto3.Session(self.CAWS_ACCESS_KEY_ID if not sessionProfile else None, self.CAWS_ACCESS_KEY_SECRET if not sessionProfile else None,
-                                                profile_name=_profile_name if not awsSessionToken else None, aws_session_token=awsSessionToken if awsSessionToken else None)
+                        session = self._getSession(self.CAWS_ACCESS_KEY_ID if not sessionProfile else None, self.CAWS_ACCESS_KEY_SECRET if not sessionProfile else None,
+                                                   profile_name=_profile_name if not awsSessionToken else None, aws_session_token=awsSessionToken if awsSessionToken else None)
                     except botocore.exceptions.ProfileNotFound as e:
                         self._base.message('Invalid profile name ({}), checking with AWS env variables..'.format(
                             _profile_name), self._base.const_warning_text)
@@ -3240,7 +4963,7 @@ class S3Storage:
                                 AWSSecretAccessKey in os.environ):
                             self.CAWS_ACCESS_KEY_ID = os.environ[AWSAccessKeyId]
                             self.CAWS_ACCESS_KEY_SECRET = os.environ[AWSSecretAccessKey]
-                            session = boto3.Session(
+                            session = self._getSession(
                                 self.CAWS_ACCESS_KEY_ID, self.CAWS_ACCESS_KEY_SECRET)
                     if (not session):
                         return False
@@ -3288,8 +5011,7 @@ class S3Storage:
                     bucketCon = session.client('s3', endpoint_url=endpointURL)
                     region = DefS3Region
                     try:
-                        loc = bucketCon.get_bucket_location(Bucket=self.m_bucketname)[
-                            'LocationConstraint']
+                        loc = self._getBucketRegion(bucketCon, endpointURL)
                         if (loc):
                             region = loc
                     except Exception as e:
@@ -3301,6 +5023,10 @@ class S3Storage:
                             os.environ['AWS_VIRTUAL_HOSTING']) else 'virtual'
                     # env must be set for GDAL
                     os.environ['AWS_VIRTUAL_HOSTING'] = 'false' if useAddrStyle == 'path' else 'true'
+                    self._session = session
+                    self._region = region
+                    self._endpointURL = endpointURL
+                    self._useAddrStyle = useAddrStyle
                     self.con = session.resource('s3', region, endpoint_url=endpointURL if endpointURL else None, config=botocore.config.Config(
                         s3={'addressing_style': useAddrStyle}))
                     if (self._isBucketPublic):
@@ -3455,8 +5181,11 @@ class S3Storage:
         Contents = 'Contents'
         NextMarker = 'NextMarker'
         if (Contents in result):
+            isInput = self._direction == CS3STORAGE_IN and hasattr(self._base, 'inputSizes')
             for k in result[Contents]:
                 keys.append(k['Key'])
+                if (isInput):
+                    self._base.inputSizes[k['Key']] = k['Size']
         for item in result.get('CommonPrefixes', []):
             if (not includeSubFolders):
                 if (item['Prefix'].endswith('/')):
@@ -3480,7 +5209,11 @@ class S3Storage:
         if (not keys):
             return False
         isRoot = self.remote_path == '/'
-        # get the til files first
+        nDownloadThreads = self._base.getThreadCount(
+            CCFG_DOWNLOAD_THREADS, CCFG_THREADS)
+        # get the til files first. These are fetched/parsed on a pool while the raster downloads get going.
+        tilFetches = []
+        tilPool = None
         if (til):
             if (not til.TILCount):
                 try:
@@ -3492,8 +5225,6 @@ class S3Storage:
                             # remote path following the input folder/.
                             S3_path = key.replace(
                                 self.remote_path if not isRoot else '', '')
-                            # callback on the client-side
-                            cb(key, S3_path)
                             outputPath = self.m_user_config.getValue(
                                 CCFG_PRIVATE_OUTPUT, False) + S3_path
                             isCloudUpload = self._base.getBooleanValue(
@@ -3505,22 +5236,35 @@ class S3Storage:
                                     CTEMPOUTPUT, False) + S3_path
                             til.addTIL(key)
                             til.setOutputPath(key, outputPath)
-                            tilObj = self.con.meta.client.get_object(
-                                Bucket=self.m_bucketname, Key=key)
-                            tilContentsAsString = tilObj['Body'].read().decode(
-                                'utf-8')
-                            til.processInMemoryTILContent(
-                                key, tilContentsAsString)
+                            if (tilPool is None):
+                                tilPool = ThreadPoolExecutor(
+                                    max_workers=nDownloadThreads)
+                            tilFetches.append(tilPool.submit(
+                                self._fetchTIL, key, S3_path, cb))
                 except Exception as e:
                     self._base.message(
                         str(e), self._base.const_critical_text)
+                    if (tilPool):
+                        tilPool.shutdown(wait=False)
                     return False
         # ends
         try:
             threads = []
             keysIndx = 0
-            nBuffer = CCFG_THREADS
+            nBuffer = nDownloadThreads
+            # rasters that can't be matched to a (til) until all the .til files have been read.
+            deferredKeys = []
             while (1):
+                if (tilFetches and
+                        all(f.done() for f in tilFetches)):
+                    for f in tilFetches:
+                        if (f.exception()):
+                            self._base.message(
+                                str(f.exception()), self._base.const_critical_text)
+                            tilPool.shutdown(wait=False)
+                            return False
+                    tilFetches = []
+                    tilPool.shutdown(wait=False)
                 nThreads = len(threads)
                 while (nThreads > 0):
                     alive = [t.is_alive() for t in threads]
@@ -3530,17 +5274,26 @@ class S3Storage:
                         threads = [t for t in threads if t.is_alive()]
                         break
                 buffer = []
+                if (not tilFetches):
+                    buffer = deferredKeys[:nBuffer]
+                    deferredKeys = deferredKeys[nBuffer:]
                 if (keysIndx == 0):
                     if (keys[keysIndx].endswith('/')):
                         keysIndx += 1
-                for i in range(keysIndx, keysIndx + nBuffer):
+                nKeys = nBuffer - len(buffer)
+                for i in range(keysIndx, keysIndx + nKeys):
                     if (i >= len(keys)):
                         break
                     buffer.append(keys[i])
-                keysIndx += nBuffer
+                keysIndx += nKeys
                 if (len(buffer) == 0 and
                         len(threads) == 0):
-                    break
+                    if (not tilFetches):
+                        break
+                    # nothing else to do until the pending .til files are read for the (deferredKeys) to be processed.
+                    for f in tilFetches:
+                        f.exception()
+                    continue
                 for key in buffer:
                     try:
                         # remote path following the input folder/.
@@ -3562,6 +5315,10 @@ class S3Storage:
                                     if (not copyRemoteRaster and
                                             not key.lower().endswith(CTIL_EXTENSION_)):  # TIL is a raster but we need to copy it locally.
                                         if (not self._base.getBooleanValue(self.m_user_config.getValue(CISTEMPINPUT))):
+                                            if (tilFetches and
+                                                    til.defaultTILProcessing):
+                                                # could still belong to a .til not yet read.
+                                                deferredKeys.append(key)
                                             continue
                         t = threading.Thread(target=cb,
                                              args=(key, remotePath))
@@ -3577,11 +5334,21 @@ class S3Storage:
             return False
         return True
 
+    def _fetchTIL(self, key, S3_path, cb):
+        # callback on the client-side
+        cb(key, S3_path)
+        tilObj = self.con.meta.client.get_object(
+            Bucket=self.m_bucketname, Key=key)
+        # lines get parsed as they're streamed in.
+        til.processInMemoryTILContent(key, (ln.decode(
+            'utf-8') for ln in tilObj['Body'].iter_lines()))
+        return True
+
     @TimeIt.timeOperation
     def __copyRemoteToLocal(self, S3_key, mk_path, **kwargs):
         try:
-            self.con.meta.client.download_file(self.m_bucketname, S3_key, mk_path, ExtraArgs={
-                                               'RequestPayer': 'requester'} if self._isRequesterPay else {})
+            self._base.getRateController(CS3STORAGE_IN).call(self.con.meta.client.download_file, self.m_bucketname, S3_key, mk_path, ExtraArgs={
+                'RequestPayer': 'requester'} if self._isRequesterPay else {})
         except Exception as e:
             msg = str(e)
             isRefreshToken = msg.find('(ExpiredToken)') != -1
@@ -3656,8 +5423,16 @@ class S3Storage:
             return False
         # ends
         mk_path = output_path
-        self._base.message('[S3-Pull] %s' % (mk_path))
         mk_path = self._base.renameMetaFileToMatchRasterExtension(mk_path)
+        if (not is_raster and
+                self._base.isServerSideCopy()):
+            usrPath = self.m_user_config.getValue(CUSR_TEXT_IN_PATH, False)
+            usrPathPos = CHASH_DEF_INSERT_POS
+            if (usrPath):
+                (usrPath, usrPathPos) = usrPath.split(CHASH_DEF_SPLIT_CHAR)
+            if (self._base.copyServerSide(S3_storage, self, S3_key, S3_storage.getUploadPath(mk_path, usrPath, usrPathPos))):
+                return True
+        self._base.message('[S3-Pull] %s' % (mk_path))
         flr = os.path.dirname(mk_path)
         if (not os.path.exists(flr)):
             try:
@@ -3739,8 +5514,132 @@ class S3Storage:
                 {'local': localPath, 'remote': remotePath})
         return True
 
-    def upload_group(self, input_source, single_upload=False, include_subs=False):
-        global _rpt
+    # returns the S3 key (mk_path) is uploaded to.
+    def getUploadPath(self, mk_path, usrPath=None, usrPathPos=CHASH_DEF_INSERT_POS):
+        upl_file = mk_path.replace(
+            self.inputPath, self.remote_path)
+        if (getBooleanValue(self.m_user_config.getValue(CCLOUD_UPLOAD))):
+            rep = self.inputPath
+            if (not rep.endswith('/')):
+                rep += '/'
+            if (getBooleanValue(self.m_user_config.getValue(CISTEMPOUTPUT))):
+                rep = self.m_user_config.getValue(
+                    CTEMPOUTPUT, False)
+            upl_file = mk_path.replace(rep, self.remote_path if self.m_user_config.getValue(
+                'iss3') else self.m_user_config.getValue(CCFG_PRIVATE_OUTPUT, False))
+        if (usrPath):
+            upl_file = self._base.insertUserTextToOutputPath(
+                upl_file, usrPath, usrPathPos)
+        return upl_file
+
+    # GDAL env to access this bucket (/vsis3/) independent of the credentials the input has set in (os.environ).
+    def getGDALConfig(self):
+        if (self._session is None or
+                self._isBucketPublic):
+            return None
+        credentials = self._session.get_credentials()
+        if (credentials is None):
+            return None
+        credentials = credentials.get_frozen_credentials()
+        config = {
+            'AWS_ACCESS_KEY_ID': credentials.access_key,
+            'AWS_SECRET_ACCESS_KEY': credentials.secret_key,
+            'AWS_SESSION_TOKEN': credentials.token,
+            'AWS_REGION': self._region,
+            'AWS_VIRTUAL_HOSTING': 'FALSE' if self._useAddrStyle == 'path' else 'TRUE',
+            'AWS_REQUEST_PAYER': 'requester' if self._isRequesterPay else None
+        }
+        if (self._endpointURL):
+            resp = urlparse(self._endpointURL)
+            config['AWS_S3_ENDPOINT'] = resp.netloc
+            config['AWS_HTTPS'] = 'YES' if resp.scheme == 'https' else 'NO'
+        return config
+
+    # returns True if (key) exists in the bucket.
+    def exists(self, key):
+        extraArgs = {'RequestPayer': 'requester'} if self._isRequesterPay else {}
+        try:
+            self.bucketupload.meta.client.head_object(
+                Bucket=self.bucketupload.name, Key=key, **extraArgs)
+        except Exception:
+            return False
+        return True
+
+    # server-side copy of (S3_key) in the (source) bucket to (upl_file) in this bucket.
+    # The managed copy uses CopyObject and switches to UploadPartCopy for the large objects.
+    def copyFrom(self, source, S3_key, upl_file):
+        acl = self.m_user_config.getValue(COUT_S3_ACL)
+        extraArgs = {'ACL': 'private' if acl is None or acl.strip() == '' else acl}
+        if (source._isRequesterPay):
+            extraArgs['RequestPayer'] = 'requester'
+        self._base.getRateController(CS3STORAGE_OUT).call(self.bucketupload.meta.client.copy, {
+            'Bucket': source.m_bucketname, 'Key': S3_key}, self.bucketupload.name, upl_file, ExtraArgs=extraArgs, SourceClient=source.con.meta.client)
+        return True
+
+    # returns True if (mk_path) was uploaded, None if it was handed to the retry queue (only if (onRetried) is set).
+    def _uploadFile(self, mk_path, usrPath, usrPathPos, onRetried=None):
+        S3 = _source_path = upl_file = None
+        try:
+            if (_rpt):
+                _source_path = getSourcePathUsingTempOutput(
+                    mk_path)
+                if (_source_path):
+                    _ret_val = _rpt.getRecordStatus(
+                        _source_path, CRPT_UPLOADED)
+                    if (_ret_val == CRPT_YES):
+                        return False
+            upl_file = self.getUploadPath(mk_path, usrPath, usrPathPos)
+            S3 = S3Upload(self._base, self.bucketupload, upl_file, mk_path, self.m_user_config.getValue(
+                COUT_S3_ACL) if self.m_user_config else None)
+            if (not S3.init()):
+                self._base.message('Unable to initialize S3-Upload for (%s=>%s)' % (
+                    mk_path, upl_file), self._base.const_warning_text)
+                self._addToFailedList(mk_path, upl_file)
+                return False
+            upload = S3.upload
+
+            def retry():
+                return upload(name=_source_path, method=TimeIt.Upload, store=self._base, fptrRefresh=self.refresh)
+            if (onRetried is None):
+                # no caller to report back to, retry in place.
+                ret = retry()
+                attempt = 0
+                while (not ret and
+                       attempt < CS3_UPLOAD_RETRIES):
+                    attempt += 1
+                    time.sleep(self._base.getRetryQueue().backoff(attempt))
+                    self._base.message('[S3-Push] (%s), retries-left (%d)' % (
+                        upl_file, CS3_UPLOAD_RETRIES - attempt), self._base.const_warning_text)
+                    ret = retry()
+                if (not ret):
+                    self._addToFailedList(mk_path, upl_file)
+                return ret
+
+            def onDone(status):
+                if (not status):
+                    self._base.message('[S3-Push] (%s), retries exhausted' % (
+                        upl_file), self._base.const_warning_text)
+                    self._addToFailedList(mk_path, upl_file)
+                onRetried(mk_path, status)
+            ret = self._base.getRetryQueue().run(retry, CS3_UPLOAD_RETRIES, onDone)
+            if (ret is None):
+                self._base.message('[S3-Push] (%s), queued for retry' % (
+                    upl_file), self._base.const_warning_text)
+                return None
+            if (not ret):
+                return False    # turned down by the retry budget, (onDone) has already run.
+        except Exception as inf:
+            self._base.message(
+                '(%s)' % (str(inf)), self._base.const_critical_text)
+            self._addToFailedList(mk_path, upl_file)
+            return False
+        finally:
+            if (S3 is not None):
+                del S3
+                S3 = None
+        return True
+
+    def upload_group(self, input_source, single_upload=False, include_subs=False, onRetried=None, queued=None):
         m_input_source = input_source.replace('\\', '/')
         input_path = os.path.dirname(m_input_source)
         upload_buff = []
@@ -3751,70 +5650,34 @@ class S3Storage:
             (usrPath, usrPathPos) = usrPath.split(CHASH_DEF_SPLIT_CHAR)
         (p, e) = os.path.splitext(m_input_source)
         for r, d, f in os.walk(input_path):
+            uploads = []
             for file in f:
                 mk_path = os.path.join(r, file).replace('\\', '/')
                 if ((single_upload and
                      (mk_path == m_input_source)) or
                         mk_path.startswith('{}.'.format(p))):
-                    try:
-                        S3 = _source_path = None
-                        if (_rpt):
-                            _source_path = getSourcePathUsingTempOutput(
-                                mk_path)
-                            if (_source_path):
-                                _ret_val = _rpt.getRecordStatus(
-                                    _source_path, CRPT_UPLOADED)
-                                if (_ret_val == CRPT_YES):
-                                    continue
-                        upl_file = mk_path.replace(
-                            self.inputPath, self.remote_path)
-                        if (getBooleanValue(self.m_user_config.getValue(CCLOUD_UPLOAD))):
-                            rep = self.inputPath
-                            if (not rep.endswith('/')):
-                                rep += '/'
-                            if (getBooleanValue(self.m_user_config.getValue(CISTEMPOUTPUT))):
-                                rep = self.m_user_config.getValue(
-                                    CTEMPOUTPUT, False)
-                            upl_file = mk_path.replace(rep, self.remote_path if self.m_user_config.getValue(
-                                'iss3') else self.m_user_config.getValue(CCFG_PRIVATE_OUTPUT, False))
-                        if (usrPath):
-                            upl_file = self._base.insertUserTextToOutputPath(
-                                upl_file, usrPath, usrPathPos)
-                        S3 = S3Upload(self._base, self.bucketupload, upl_file, mk_path, self.m_user_config.getValue(
-                            COUT_S3_ACL) if self.m_user_config else None)
-                        if (not S3.init()):
-                            self._base.message('Unable to initialize S3-Upload for (%s=>%s)' % (
-                                mk_path, upl_file), self._base.const_warning_text)
-                            self._addToFailedList(mk_path, upl_file)
-                            continue
-                        upl_retries = CS3_UPLOAD_RETRIES
-                        ret = False
-                        while (upl_retries and not ret):
-                            ret = S3.upload(
-                                name=_source_path, method=TimeIt.Upload, store=self._base, fptrRefresh=self.refresh)
-                            if (not ret):
-                                # let's sleep for a while until s3 kick-starts
-                                time.sleep(10)
-                                upl_retries -= 1
-                                self._base.message('[S3-Push] (%s), retries-left (%d)' % (
-                                    upl_file, upl_retries), self._base.const_warning_text)
-                        if (not ret):
-                            self._addToFailedList(mk_path, upl_file)
-                            if (S3 is not None):
-                                del S3
-                                S3 = None
-                            continue
-                    except Exception as inf:
-                        self._base.message(
-                            '(%s)' % (str(inf)), self._base.const_critical_text)
-                    finally:
-                        if (S3 is not None):
-                            del S3
-                            S3 = None
-                    # successful entries to return.
-                    upload_buff.append(mk_path)
                     if (single_upload):
-                        return upload_buff
+                        ret = self._uploadFile(
+                            mk_path, usrPath, usrPathPos, onRetried)
+                        if (ret):
+                            upload_buff.append(mk_path)
+                            return upload_buff
+                        if (ret is None and
+                                queued is not None):
+                            queued.append(mk_path)
+                            return upload_buff
+                        continue
+                    # the group (raster + side-car) files go up in parallel over the shared upload pool.
+                    uploads.append((mk_path, self._base.submitUpload(
+                        self._uploadFile, mk_path, usrPath, usrPathPos, onRetried)))
+            for mk_path, upload in uploads:
+                ret = upload.result()
+                # successful entries to return.
+                if (ret):
+                    upload_buff.append(mk_path)
+                elif (ret is None and
+                      queued is not None):
+                    queued.append(mk_path)
             if (not include_subs):
                 return upload_buff
         return upload_buff       # this could be empty.
@@ -3846,6 +5709,13 @@ CCMD_PYRAMIDS_ONLY = 'only'
 CCMD_PYRAMIDS_EXTERNAL = 'external'
 CCMD_PYRAMIDS_SOURCE = 'source'  # Used by CreateRasterProxy
 CCFG_THREADS = 10
+CCFG_DOWNLOAD_THREADS = 'DownloadThreads'
+CCFG_CONVERT_THREADS = 'ConvertThreads'
+CCFG_UPLOAD_THREADS = 'UploadThreads'
+CCFG_PROGRESS_SECS = 'ProgressSecs'
+CCFG_PROGRESS_PER_FILE = 'ProgressPerFile'
+CCFG_DIRECT_CLOUD_OUTPUT = 'DirectCloudOutput'
+CTHREADS_AUTO = 'auto'
 CCFG_RASTERS_NODE = 'RasterFormatFilter'
 CCFG_EXCLUDE_NODE = 'ExcludeFilter'
 CCFG_PRIVATE_INC_BOTO = '__inc_boto__'
@@ -3855,6 +5725,8 @@ CFGAZSASW = '__szsasw__'
 CCFG_LAMBDA_INVOCATION_ERR = '__LAMBDA_INV_ERR__'
 CCFG_INTERLEAVE = 'Interleave'
 CCFG_PREDICTOR = 'Predictor'
+# build the (internal) pyramids in the same gdal_translate pass as the conversion where the output driver supports it.
+CCFG_SINGLE_PASS_PYRAMIDS = 'SinglePassPyramids'
 
 # log status
 const_general_text = 0
@@ -4102,22 +5974,31 @@ def exclude_callback_for_meta(file, src, dst):
     exclude_callback(file, src, dst)
 
 
+CSIDECAR_EXTENSIONS = ('.idx', '.lrc', '.pjg', '.pzp',
+                       '.pft', '.ppng', '.pjp', '.aux.xml')
+
+
 def getSourcePathUsingTempOutput(input):
     # cfg, _rpt are global vars.
     if (not _rpt or
             not getBooleanValue(cfg.getValue(CISTEMPOUTPUT))):
         return None
     _mk_path = input.replace(cfg.getValue(CTEMPOUTPUT, False), '')
-    _indx = -1
     # if any one of these extensions fails,
-    if (True in [_mk_path.lower().endswith(i) for i in ['.idx', '.lrc', '.pjg', '.pzp', '.pft', '.ppng', '.pjp', '.aux.xml']]):
-        # the main (raster) file upload entry in (Reporter) would be set to (no) denoting a failure in one of its associated files.
-        _indx = _mk_path.rfind('.')
-    if (_indx == -1):
-        return (_rpt.findExact('{}{}'.format(_rpt.root, _mk_path)))
+    if (not _mk_path.lower().endswith(CSIDECAR_EXTENSIONS)):
+        _src = '{}{}'.format(_rpt.root, _mk_path)
+        return _src if _src in _rpt._input_list_info else None
+    # the main (raster) file upload entry in (Reporter) would be set to (no) denoting a failure in one of its associated files.
+    _src = _rpt.findTempOutputSource(input)
+    if (_src):
+        return _src
+    # not registered at schedule time, fall back to scan the .orjob entries once and remember the result.
+    _indx = _mk_path.rfind('.')
+    rasterExts = tuple(cfg.getValue(CCFG_RASTERS_NODE))
     for i in _rpt:
         if (i.find(_mk_path[:_indx + 1]) != -1):
-            if (True in [i.endswith(x) for x in cfg.getValue(CCFG_RASTERS_NODE)]):
+            if (i.endswith(rasterExts)):
+                _rpt.addTempOutputSource(input, i)
                 return i
     return None
 
@@ -4291,9 +6172,8 @@ class Copy:
                                         if (v.startswith('Content-Disposition')):
                                             token = 'filename='
                                             if (isPlanet):
-                                                if (_mkRemoteURL in _rpt._input_list_info):
-                                                    _rpt._input_list_info[_mkRemoteURL][Report.CRPT_URL_TRUENAME] = v.split(':')[
-                                                        1].strip()
+                                                _rpt.setTrueName(
+                                                    _mkRemoteURL, v.split(':')[1].strip())
                                                 isFileNameInHeader = True
                                                 if (v.find(token) == -1):
                                                     break
@@ -4301,16 +6181,14 @@ class Copy:
                                             if (f != -1):
                                                 e = v.find(
                                                     '\r', f + len(token))
-                                                if (_mkRemoteURL in _rpt._input_list_info):
-                                                    _rpt._input_list_info[_mkRemoteURL][Report.CRPT_URL_TRUENAME] = v[f + len(
-                                                        token): e].strip().replace('"', '').replace('?', '_')
+                                                _rpt.setTrueName(_mkRemoteURL, v[f + len(
+                                                    token): e].strip().replace('"', '').replace('?', '_'))
                                                 isFileNameInHeader = True
                                             break
                                         # aws pre-signed URL support.
                                         elif (v.startswith('x-amz-request-id')):
-                                            if (_mkRemoteURL in _rpt._input_list_info):
-                                                _rpt._input_list_info[_mkRemoteURL][Report.CRPT_URL_TRUENAME] = file.split('?')[
-                                                    0]
+                                            _rpt.setTrueName(
+                                                _mkRemoteURL, file.split('?')[0])
                                             isFileNameInHeader = True
                                     localPath = self.m_user_config.getValue(
                                         CTEMPINPUT)
@@ -4469,7 +6347,145 @@ class Copy:
         return True
 
 
+# shares the node's memory/cores between the GDAL processes running at the same time.
+class GDALResourceBudget(object):
+    CacheShare = 0.5     # fraction of the available memory handed out for the GDAL block caches.
+    MinCacheMB = 64
+    MaxCacheMB = 4096
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+        self._cores = os.cpu_count() or 1
+        self._slots = CCFG_THREADS
+        self._sizer = None
+
+    # (slots) processes are allowed to run at once (the convert threads), with (Threads=auto) the (sizer) target is used instead.
+    def setSlots(self, slots, sizer=None):
+        with self._lock:
+            self._slots = max(1, slots)
+            self._sizer = sizer
+
+    # reserve a share for a new process, returns (cacheMB, threads)
+    # the memory/cores are split across the processes running now (this one included), up to the allowed slots.
+    def acquire(self):
+        with self._lock:
+            slots = self._sizer.target if self._sizer else self._slots
+            self._active += 1
+            count = max(1, min(self._active, slots))
+        availMB = MEMORYSTATUSEX().getAvailPhys() / (1024 * 1024)
+        cacheMB = int(availMB * self.CacheShare / count)
+        return (max(self.MinCacheMB, min(self.MaxCacheMB, cacheMB)),
+                max(1, self._cores // count))
+
+    def release(self):
+        with self._lock:
+            self._active = max(0, self._active - 1)
+
+    @property
+    def active(self):
+        return self._active
+
+
+class WorkerCountSizer(object):
+    SampleSecs = 5           # min. interval between the CPU samples used to resize the pool.
+    InitialSampleSecs = 0.5
+    MemoryPerWorkerMB = 512  # expected working set of a single worker (gdal_translate + its block cache)
+    MaxPerCore = 4
+    TargetUtilization = 0.85
+    SaturatedUtilization = 0.98
+
+    def __init__(self, base=None):
+        self._base = base
+        self._cores = os.cpu_count() or 1
+        self._utilization = self._ioWait = None
+        self._lastSample = self._cpuTimes()
+        # starts at a worker per core, the first sample (InitialSampleSecs) later accounts for the I/O wait.
+        self._isSized = False
+        self._nextSample = time.time() + self.InitialSampleSecs
+        self._target = max(1, min(self._cores, self.limit))
+
+    @property
+    def target(self):
+        return self._target
+
+    # returns the cumulative (busy, iowait, total) CPU ticks or None if unsupported.
+    def _cpuTimes(self):
+        if (os.name == 'posix'):
+            try:
+                with open('/proc/stat', 'r') as stat:
+                    v = [int(x) for x in stat.readline().split()[1:]]
+                ioWait = v[4] if len(v) > 4 else 0
+                total = sum(v[:8])  # guest time is already accounted in user.
+                return (total - v[3] - ioWait, ioWait, total)
+            except BaseException:
+                return None
+        try:
+            idle, kernel, user = ctypes.c_ulonglong(), ctypes.c_ulonglong(), ctypes.c_ulonglong()
+            if (not ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user))):
+                return None
+            total = kernel.value + user.value  # kernel time includes the idle time.
+            return (total - idle.value, 0, total)
+        except BaseException:
+            return None
+
+    def _sample(self):
+        current = self._cpuTimes()
+        previous, self._lastSample = self._lastSample, current
+        if (current is None or
+                previous is None):
+            return False
+        total = current[2] - previous[2]
+        if (total <= 0):
+            return False
+        self._utilization = (current[0] - previous[0]) / float(total)
+        self._ioWait = (current[1] - previous[1]) / float(total)
+        return True
+
+    # the most workers the cores/available memory allow.
+    @property
+    def limit(self):
+        limit = self._cores * self.MaxPerCore
+        availMB = MEMORYSTATUSEX().getAvailPhys() / (1024 * 1024)
+        if (availMB):
+            limit = min(limit, max(1, int(availMB // self.MemoryPerWorkerMB)))
+        return limit
+
+    # returns the worker count to maintain given the (pending) queue depth and the (running) workers.
+    # Cheap to call in a loop, the CPU is only sampled every (SampleSecs).
+    def update(self, pending, running):
+        now = time.time()
+        if (now < self._nextSample):
+            return self._target
+        self._nextSample = now + self.SampleSecs
+        if (not self._sample()):
+            return self._target
+        target = self._target
+        if (not self._isSized):
+            self._isSized = True
+            # workers blocked on I/O leave their core idle, allow proportionally more of them.
+            target = int(round(self._cores / max(1 - self._ioWait, 1.0 / self.MaxPerCore)))
+        elif (self._utilization < self.TargetUtilization and
+            pending and
+                running >= target):
+            target += 1
+        elif (self._utilization > self.SaturatedUtilization and
+              target > 1):
+            target -= 1
+        target = max(1, min(target, self.limit))
+        if (target != self._target):
+            if (self._base is not None):
+                self._base.message('Threads (auto) {} -> {} (CPU {:.0%}, I/O wait {:.0%}, pending {})'.format(
+                    self._target, target, self._utilization, self._ioWait, pending))
+            self._target = target
+        return self._target
+
+
 class Compression(object):
+    # shared by all the (Compression) instances/threads.
+    _resources = GDALResourceBudget()
+    CDirectOutputCredentialKeys = ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN', 'AZURE_STORAGE_ACCOUNT',
+                                   'AZURE_STORAGE_ACCESS_KEY', 'AZURE_STORAGE_SAS_TOKEN', 'GOOGLE_APPLICATION_CREDENTIALS')
 
     def __init__(self, gdal_path, base):
         self.m_gdal_path = gdal_path
@@ -4586,6 +6602,7 @@ class Compression(object):
 
     def compress(self, input_file, output_file, args_callback=None, build_pyramids=True, post_processing_callback=None, post_processing_callback_args=None, **kwargs):
         isRasterProxyCaller = False
+        directOutputPath = directOutputEnv = None
         if (UpdateOrjobStatus in kwargs):
             if (not kwargs[UpdateOrjobStatus]):
                 isRasterProxyCaller = True
@@ -4719,6 +6736,7 @@ class Compression(object):
                         return False
                     # ends
             do_pyramids = self.m_user_config.getValue('Pyramids')
+            pyramidsInConversion = False
             timeIt = kwargs['name'] if 'name' in kwargs else None
             azSAS = self.m_user_config.getValue(CFGAZSAS, False)
             bUnicode = False
@@ -4766,14 +6784,33 @@ class Compression(object):
                             except Exception as e:
                                 self.message(
                                     str(e), self._base.const_critical_text)
+                if (build_pyramids and
+                        not isRasterProxyCaller):
+                    singlePassArgs = self._getSinglePassPyramidArgs(args)
+                    if (singlePassArgs):
+                        args += singlePassArgs
+                        pyramidsInConversion = True
                 args.append(inputRaster)
                 useCOGTIFF = self.m_user_config.getValue('cog') == True
                 if (useCOGTIFF):
                     output_file += CloudOGTIFFExt
                 useVsimem = self._base.getBooleanValue(
                     self.m_user_config.getValue('vsimem'))
+                if (not useCOGTIFF and
+                    not useVsimem and
+                    not isRasterProxyCaller and
+                    build_pyramids and      # off for the (.til) rasters, they're needed locally.
+                    (pyramidsInConversion or
+                     (not self._base.getBooleanValue(do_pyramids) and
+                      do_pyramids != CCMD_PYRAMIDS_EXTERNAL))):
+                    directOutput = self._getDirectCloudOutput(
+                        args, input_file, output_file)
+                    if (directOutput):
+                        (directOutputPath, directOutputEnv) = directOutput
+                        self.message('Direct output ({})'.format(
+                            directOutputPath))
                 args.append('"{}{}"'.format(
-                    '/vsimem/' if useVsimem else '', output_file))
+                    '/vsimem/' if useVsimem else '', directOutputPath if directOutputPath else output_file))
                 self.message('Converting (%s)..' %
                              (useTokenPath if useTokenPath else input_file))
                 gdal_path = self.m_user_config.getValue(CCFG_GDAL_PATH, False)
@@ -4790,7 +6827,7 @@ class Compression(object):
                         return False
                     args[-2] = iiqMaker.output_path  # input pos to GDAL
                 ret = self._call_external(
-                    args, name=timeIt, method=TimeIt.Conversion, store=self._base)
+                    args, env=directOutputEnv, name=timeIt, method=TimeIt.Conversion, store=self._base)
                 if (use_iiq and
                         do_process):
                     iiqMaker.cleanup()  # cleanup iiq temp files.
@@ -4809,7 +6846,7 @@ class Compression(object):
                     os.environ['AWS_SESSION_TOKEN'] = roleInfo[store.RoleToken]
                     print('Retry/External call..')
                     ret = self._call_external(
-                        args, name=timeIt, method=TimeIt.Conversion, store=self._base)
+                        args, env=directOutputEnv, name=timeIt, method=TimeIt.Conversion, store=self._base)
                 self.message('Status: (%s).' % ('OK' if ret else 'FAILED'))
                 if (not ret):
                     if (_rpt):
@@ -4817,7 +6854,9 @@ class Compression(object):
                             _input_file, CRPT_PROCESSED, CRPT_NO)
                     return ret
             # build pyramids is always turned off for rasters that belong to (.til) files.
-            if (build_pyramids):
+            if (build_pyramids and
+                    not pyramidsInConversion and
+                    not directOutputPath):
                 if (self._base.getBooleanValue(do_pyramids) or     # accept any valid boolean value.
                     do_pyramids == CCMD_PYRAMIDS_ONLY or
                         do_pyramids == CCMD_PYRAMIDS_EXTERNAL):
@@ -4992,8 +7031,16 @@ class Compression(object):
             _indx = input_file.index(_processedPath)
             _input = os.path.basename(
                 input_file) if _indx <= 0 else input_file[_indx:]
-            ret = post_processing_callback(post_process_output, post_processing_callback_args, input=_input,
-                                           f=post_process_output, cfg=self.m_user_config)
+            if (directOutputPath):
+                # already written to the cloud, nothing staged to push.
+                ret = self._directCloudOutputExists(directOutputPath)
+                if (not ret):
+                    self.message('Direct output ({}) not found'.format(
+                        directOutputPath), self.const_critical_text)
+                setUploadRecordStatus(_input, CRPT_YES if ret else CRPT_NO)
+            else:
+                ret = post_processing_callback(post_process_output, post_processing_callback_args, input=_input,
+                                               f=post_process_output, cfg=self.m_user_config)
             self.message('Status: (%s).' % ('OK' if ret else 'FAILED'))
             _proxyPath = self.m_user_config.getValue(CCLONE_PATH)
             if (_proxyPath and
@@ -5057,6 +7104,107 @@ class Compression(object):
             _rpt.updateRecordStatus(_input_file, CRPT_PROCESSED, CRPT_YES)
         return ret
 
+    # returns (vsi output path, env for GDAL) to have gdal_translate write the COG output to the cloud directly or None to stage/upload.
+    # MRF/GTiff outputs still get staged as their drivers need random write access to the output.
+    def _getDirectCloudOutput(self, args, input_file, output_file):
+        _user_config = self.m_user_config
+        if (not self._base.getBooleanValue(_user_config.getValue(CCFG_DIRECT_CLOUD_OUTPUT)) or
+            not self._base.getBooleanValue(_user_config.getValue(CCLOUD_UPLOAD)) or
+                _user_config.getValue(CCLONE_PATH)):
+            return None
+        if ('-of' not in args or
+            args.index('-of') + 1 >= len(args) or
+                args[args.index('-of') + 1].lower() != 'cog'):
+            return None
+        cloudType = _user_config.getValue(COUT_CLOUD_TYPE, True)
+        vsiPath = config = None
+        if (cloudType == CCLOUD_AMAZON):
+            if (S3_storage is None):
+                return None
+            usrPath = _user_config.getValue(CUSR_TEXT_IN_PATH, False)
+            usrPathPos = CHASH_DEF_INSERT_POS
+            if (usrPath):
+                (usrPath, usrPathPos) = usrPath.split(CHASH_DEF_SPLIT_CHAR)
+            vsiPath = '/vsis3/{}/{}'.format(S3_storage.m_bucketname,
+                                            S3_storage.getUploadPath(output_file, usrPath, usrPathPos))
+            config = S3_storage.getGDALConfig()
+        elif (cloudType == CCLOUD_AZURE):
+            if (azure_storage is None):
+                return None
+            vsiPath = '/vsiaz/{}/{}'.format(_user_config.getValue(COUT_AZURE_CONTAINER, False),
+                                            azure_storage.getUploadPath(output_file, _user_config.getValue(CCFG_PRIVATE_OUTPUT, False), {
+                                                CTEMPOUTPUT: _user_config.getValue(CTEMPOUTPUT, False)}))
+            config = azure_storage.getGDALConfig()
+        elif (cloudType == Store.TypeGoogle):
+            if (google_storage is None):
+                return None
+            vsiPath = '/vsigs/{}/{}'.format(_user_config.getValue(COUT_GOOGLE_BUCKET, False),
+                                            google_storage.getUploadPath(output_file, _user_config.getValue(CCFG_PRIVATE_OUTPUT, False), {
+                                                CTEMPOUTPUT: _user_config.getValue(CTEMPOUTPUT, False)}))
+            config = google_storage.getGDALConfig()
+        if (not config):
+            return None
+        handler = vsiPath[:vsiPath.find('/', 1) + 1]
+        if (input_file.startswith(handler)):
+            # GDAL takes one set of credentials per handler from the env. Cloud to cloud on the same handler (e.g. S3->S3)
+            # goes direct if the input is readable with the output credentials, i.e. both sides use the same ones.
+            for key in self.CDirectOutputCredentialKeys:
+                if (config.get(key) and
+                        config[key] != os.environ.get(key)):
+                    return None
+        env = dict(os.environ)
+        env.update(config)
+        env['GDAL_PAM_ENABLED'] = 'NO'  # no .aux.xml next to the cloud output.
+        return (vsiPath.replace('//', '/'), {k: v for k, v in env.items() if v is not None})
+
+    # returns True if the output gdal_translate wrote to (vsiPath) directly is there.
+    def _directCloudOutputExists(self, vsiPath):
+        (handler, bucket, key) = vsiPath.split('/', 3)[1:]
+        store = {'vsis3': S3_storage, 'vsiaz': azure_storage,
+                 'vsigs': google_storage}.get(handler)
+        return (store is not None and
+                store.exists(key))
+
+    # returns the creation options to have the output driver build the pyramids during the conversion or None to fall back on gdaladdo.
+    def _getSinglePassPyramidArgs(self, args):
+        if (not self._base.getBooleanValue(self.m_user_config.getValue(CCFG_SINGLE_PASS_PYRAMIDS))):
+            return None
+        do_pyramids = self.m_user_config.getValue('Pyramids')
+        if (not self._base.getBooleanValue(do_pyramids) or
+                do_pyramids == CCMD_PYRAMIDS_EXTERNAL):
+            return None
+        # only the COG driver builds (internal) overviews as part of the CreateCopy.
+        if ('-of' not in args or
+                args.index('-of') + 1 >= len(args) or
+                args[args.index('-of') + 1].lower() != 'cog'):
+            return None
+        overviewArgs = []
+        pyFactor = self.m_user_config.getValue('PyramidFactor')
+        if (pyFactor and
+                pyFactor.strip()):
+            # COG overviews are always successive powers of 2, other factors are left to gdaladdo.
+            try:
+                factors = [int(f) for f in pyFactor.replace(',', ' ').split()]
+            except ValueError:
+                return None
+            if (factors != [2 ** (i + 1) for i in range(len(factors))]):
+                return None
+            overviewArgs += ['-co', 'OVERVIEW_COUNT={}'.format(len(factors))]
+        overviewArgs += ['-co', 'OVERVIEWS=IGNORE_EXISTING']
+        pySampling = self.m_user_config.getValue('PyramidSampling')
+        if (pySampling):
+            overviewArgs += ['-co', 'OVERVIEW_RESAMPLING={}'.format(
+                'average' if pySampling.lower() == 'avg' else pySampling)]
+        pyCompression = self.m_user_config.getValue('PyramidCompression')
+        if (pyCompression):
+            overviewArgs += ['-co',
+                             'OVERVIEW_COMPRESS={}'.format(pyCompression)]
+            if (pyCompression.lower() == 'jpeg'):
+                pyQuality = self.m_user_config.getValue('Quality')
+                overviewArgs += ['-co', 'OVERVIEW_QUALITY={}'.format(
+                    pyQuality if pyQuality else DefJpegQuality)]
+        return overviewArgs
+
     def createaOverview(self, input_file, isBQA=False, **kwargs):
         if (CreateOverviews in kwargs):
             if (not kwargs[CreateOverviews]):
@@ -5142,13 +7290,40 @@ class Compression(object):
             sourcePath = kwargs['source']
         return self._call_external(args, name=sourcePath, method=TimeIt.Overview, store=self._base)
 
+    # adds the GDAL_CACHEMAX/GDAL_NUM_THREADS/NUM_THREADS for the process share unless already set by the user.
+    def _addResourceArgs(self, args, cacheMB, threads):
+        exe = os.path.basename(args[0]).lower()
+        if (not exe.startswith((self.CGDAL_TRANSLATE_EXE.lower(), self.CGDAL_ADDO_EXE.lower()))):
+            return args
+        cmdLine = ' '.join(args[1:])
+        resourceArgs = []
+        if (cmdLine.find('GDAL_CACHEMAX') == -1):
+            resourceArgs += ['--config', 'GDAL_CACHEMAX', str(cacheMB)]
+        if (cmdLine.find('GDAL_NUM_THREADS') == -1):
+            resourceArgs += ['--config', 'GDAL_NUM_THREADS', str(threads)]
+        if (exe.startswith(self.CGDAL_TRANSLATE_EXE.lower()) and
+                cmdLine.find('NUM_THREADS=') == -1 and
+                '-of' in args and
+                args.index('-of') + 1 < len(args) and
+                args[args.index('-of') + 1].lower() in ('gtiff', 'cog')):
+            resourceArgs += ['-co', 'NUM_THREADS={}'.format(threads)]
+        return [args[0]] + resourceArgs + args[1:]
+
     @TimeIt.timeOperation
-    def _call_external(self, args, messageCallback=None, **kwargs):
+    def _call_external(self, args, messageCallback=None, env=None, **kwargs):
         if (CRUN_IN_AWSLAMBDA):
             tmpELF = '/tmp/{}'.format(os.path.basename(args[0]))
             args[0] = tmpELF
+        (cacheMB, threads) = self._resources.acquire()
+        try:
+            return self._run_external(self._addResourceArgs(args, cacheMB, threads), messageCallback, env)
+        finally:
+            self._resources.release()
+
+    # (env) replaces the inherited environment for the external process if set.
+    def _run_external(self, args, messageCallback=None, env=None):
         p = subprocess.Popen(' '.join(args), shell=True,
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
         message = ''
         messages = []
         val = p.poll()
@@ -5243,11 +7418,25 @@ class BundleMaker(Compression):
 
 
 class Config:
+    _cache = {}     # (path, mtime, root): settings, used if (CWarmCache)
+    _cacheLock = threading.Lock()
 
     def __init__(self):
         pass
 
     def init(self, config, root):
+        cacheKey = None
+        if (CWarmCache):
+            try:
+                cacheKey = (os.path.abspath(config),
+                            os.path.getmtime(config), root)
+            except (OSError, TypeError):
+                pass
+            with self._cacheLock:
+                if (cacheKey in self._cache):
+                    self.m_doc = None   # not parsed on a cache hit, only (m_cfgs) is valid.
+                    self.m_cfgs = dict(self._cache[cacheKey])
+                    return True
         try:
             self.m_doc = minidom.parse(config)
         except BaseException:
@@ -5265,6 +7454,9 @@ class Config:
                 self.m_cfgs[node.nodeName] = node.firstChild.nodeValue
             node = node.nextSibling
             pass
+        if (cacheKey):
+            with self._cacheLock:
+                self._cache[cacheKey] = dict(self.m_cfgs)
         return True
 
     def getValue(self, key, toLower=True):  # returns (value) or None
@@ -5567,22 +7759,25 @@ class Application(object):
         # ends
         return True
 
+    # runs on its own thread, the job doesn't wait on the check.
     def __setupVersionCheck(self):
-        self._base._m_log.CreateCategory('VersionCheck')
-        try:
-            from ProgramCheckAndUpdate import ProgramCheckAndUpdate
-        except ImportError as e:
-            msg = 'ProgramCheckAndUpdate module is not found, unable to check version updates.'
-            self._base.message(msg, self._base.const_warning_text)
-            self._base._m_log.CloseCategory()
-            return False
-        versionCheck = ProgramCheckAndUpdate()
-        self._base.message('Checking for updates..')
-        verMessage = versionCheck.run(
-            os.path.dirname(os.path.realpath(__file__)))
-        if (verMessage is not None):
-            self._base.message(verMessage)
-        self._base._m_log.CloseCategory()
+        def check():
+            try:
+                from ProgramCheckAndUpdate import ProgramCheckAndUpdate
+            except ImportError as e:
+                msg = 'ProgramCheckAndUpdate module is not found, unable to check version updates.'
+                self._base.message('[VersionCheck] {}'.format(
+                    msg), self._base.const_warning_text)
+                return False
+            versionCheck = ProgramCheckAndUpdate()
+            verMessage = versionCheck.run(
+                os.path.dirname(os.path.realpath(__file__)), CVersionCheckTimeout, CVersionCheckTTL)
+            if (verMessage is not None):
+                self._base.message('[VersionCheck] {}'.format(verMessage))
+            return True
+        t = threading.Thread(target=check)
+        t.daemon = True
+        t.start()
         return True
 
     def __setupLogSupport(self):
@@ -5703,7 +7898,18 @@ class Application(object):
         self.__set_log_folders()        # remap post cfg updates.
         if (self._base.getMessageHandler):
             self._base._m_log.isGPRun = self.postMessagesToArcGIS
-        if (not CDisableVersionCheck):
+            if (CLogStreamFormat in ('xml', 'jsonl') and
+                    not CRUN_IN_AWSLAMBDA and
+                    hasattr(self._base._m_log, 'StreamLog')):
+                self._base._m_log.SetLogFolder(cfg.getValue(CFGLogPath))
+                self._base._m_log.StreamLog('{}_messages.{}'.format(
+                    Report.getUniqueFileName(), CLogStreamFormat), CLogStreamFormat)
+        # no checks within lambda and when used as a library (args as a dict).
+        if (not CDisableVersionCheck and
+            not CRUN_IN_AWSLAMBDA and
+                isinstance(self._usr_args, argparse.Namespace) and
+                not (self._args.op and
+                     self._args.op.lower().startswith(COP_LAMBDA))):
             self.__setupVersionCheck()
         if (not self._base.init()):
             self._base.message(
@@ -5730,6 +7936,11 @@ class Application(object):
                     'Unable to read the -input job file.', self._base.const_critical_text)
                 self._base.close()
                 return False
+            # the caller's (convertthreads) applies if the job header doesn't set it, e.g. the -op=daemon slot share.
+            if (not self._args.convertthreads and
+                isinstance(self._usr_args, dict) and
+                    self._usr_args.get('convertthreads')):
+                self._args.convertthreads = self._usr_args['convertthreads']
             if (CRESUME_HDR_OUTPUT in self._usr_args):
                 # override the output path in the .orjob file if a custom 'output' path exists.
                 # do only if called by user code. self._usr_args type is 'argparse' when called by cmd-line
@@ -5839,9 +8050,12 @@ class Application(object):
 
     def _runLambdaJob(self, jobFile):
         # process @ lambda
-        self._base.message('Using AWS Lambda..')
+        isEmulated = LambdaEmulator.isEmulated(self._args.op)
+        self._base.message('Using {}..'.format(
+            'Lambda emulation' if isEmulated else 'AWS Lambda'))
         sns = Lambda(self._base)
-        if (not sns.initSNS('aws_lambda')):
+        if (not isEmulated and
+                not sns.initSNS('aws_lambda')):
             self._base.message('Unable to initialize',
                                self._base.const_critical_text)
             return False
@@ -5884,7 +8098,7 @@ class Application(object):
                 self._base.message(
                     'Unable to init (Reporter/obj)', self._base.const_critical_text)
                 return (terminate(self._base, eFAIL))
-            if (not _rpt.read()):
+            if (not _rpt.read(chunked=True)):
                 self._base.message('Unable to read the -input report file ({})'.format(
                     self._args.input), self._base.const_critical_text)
                 return (terminate(self._base, eFAIL))
@@ -5987,6 +8201,8 @@ class Application(object):
                     self._args.op = COP_NOCONVERT
                     # Delete temporary files in (local) transit for (op={COP_COPYONLY}) if the input source is from (cloud).
                     cfg.setValue(COUT_DELETE_AFTER_UPLOAD, True)
+                    # same cloud type on both ends can skip the local transit altogether.
+                    cfg.setValue(CSERVER_SIDE_COPY, True)
                     # However, If the input (source) path is from the local machine, the config value in (COUT_DELETE_AFTER_UPLOAD) is used.
         # ends
         if (self._args.op):
@@ -6218,6 +8434,12 @@ class Application(object):
             cfg.setValue('Quality', self._args.quality)
         if (self._args.prec):
             cfg.setValue('LERCPrecision', self._args.prec)
+        # network-bound transfers and the cpu-bound conversions use separate thread counts.
+        for key, value in ((CCFG_DOWNLOAD_THREADS, self._args.downloadthreads),
+                           (CCFG_CONVERT_THREADS, self._args.convertthreads),
+                           (CCFG_UPLOAD_THREADS, self._args.uploadthreads)):
+            if (value):
+                cfg.setValue(key, str(value))
         if (self._args.pyramids):
             if (self._args.pyramids == CCMD_PYRAMIDS_ONLY):
                 # -input, -output path check isn't done if -input points to a job (.orjob) file
@@ -6429,7 +8651,16 @@ class Application(object):
         # keep original-source-ext
         cfg_keep_original_ext = self._base.getBooleanValue(
             cfg.getValue('KeepExtension'))
-        cfg_threads = cfg.getValue('Threads')
+        cfg_threads = cfg.getValue(CCFG_CONVERT_THREADS)
+        if (cfg_threads is None):
+            cfg_threads = cfg.getValue('Threads')
+        threadSizer = None
+        if (cfg_threads is not None and
+                cfg_threads.strip() == CTHREADS_AUTO):
+            # sized from the cores/available memory/I/O wait and adjusted as the run progresses.
+            threadSizer = WorkerCountSizer(self._base)
+            cfg_threads = threadSizer.target
+            self._base.message('Threads (auto) {}'.format(cfg_threads))
         msg_threads = 'Thread-count invalid/undefined, resetting to default'
         try:
             cfg_threads = int(cfg_threads)   # (None) value is expected
@@ -6437,10 +8668,13 @@ class Application(object):
             cfg_threads = -1
         if (cfg_threads <= 0 or
                 (cfg_threads > CCFG_THREADS and
-                 not is_caching)):
+                 not is_caching and
+                 threadSizer is None)):
             cfg_threads = CCFG_THREADS
             self._base.message('%s(%s)' % (
                 msg_threads, CCFG_THREADS), self._base.const_warning_text)
+        # the GDAL cache/thread shares follow the (auto) count as it's resized.
+        Compression._resources.setSlots(cfg_threads, threadSizer)
         # ends
         # let's deal with copying when -input is on s3
         storeUseToken = cfg.getValue('UseToken')
@@ -6698,6 +8932,12 @@ class Application(object):
                         len_buffer = cnt_dead
                         threads = [t for t in threads if t.is_alive()]
                         break
+                    if (threadSizer and
+                            threadSizer.update(store_files_len - store_files_indx, len_threads) > len_threads):
+                        break
+                if (threadSizer):
+                    len_buffer = threadSizer.update(
+                        store_files_len - store_files_indx, len(threads)) - len(threads)
                 buffer = []
                 for i in range(0, len_buffer):
                     if (store_files_indx == store_files_len):
@@ -6718,6 +8958,12 @@ class Application(object):
                             modeExtension = e[1:]
                         output_file = output_file.replace(
                             e, '.{}'.format(modeExtension))
+                    if (_rpt and
+                            is_output_temp):
+                        # upload status updates for the output (side-car) files resolve back to this entry.
+                        _rptSrc = '{}{}'.format(req['src'], req['f']).replace('\\', '/')
+                        if (_rptSrc in _rpt._input_list_info):
+                            _rpt.addTempOutputSource(output_file, _rptSrc)
                     _build_pyramids = True
                     if (til):
                         if (til.find(req['f'])):
@@ -6939,6 +9185,12 @@ class Application(object):
                         len_buffer = cnt_dead
                         threads = [t for t in threads if t.is_alive()]
                         break
+                    if (threadSizer and
+                            threadSizer.update(store_files_len - store_files_indx, len_threads) > len_threads):
+                        break
+                if (threadSizer):
+                    len_buffer = threadSizer.update(
+                        store_files_len - store_files_indx, len(threads)) - len(threads)
                 buffer = []
                 for i in range(0, len_buffer):
                     if (store_files_indx == store_files_len):
@@ -7000,6 +9252,8 @@ class Application(object):
                         self._base.message('Err. {}'.format(
                             str(e)), self._base.const_critical_text)
                         continue
+        # let the queued upload/delete retries settle before the failed list is looked at.
+        self._base.waitForRetries()
         # do we have failed upload files on list?
         if (is_cloud_upload and
                 S3_storage):
@@ -7034,16 +9288,7 @@ class Application(object):
                                         setUploadRecordStatus(_local, CRPT_NO)
                         # ends
                         for r in ret:
-                            try:
-                                self._base.message('[Del] {}'.format(r))
-                                try:
-                                    os.remove(r)
-                                except BaseException:
-                                    time.sleep(CDEL_DELAY_SECS)
-                                    os.remove(r)
-                            except Exception as e:
-                                self._base.message(
-                                    '[Del] {} ({})'.format(r, str(e)))
+                            self._base.removeFile(r)
                     if (_fptr):
                         _fptr.close()
                         _fptr = None
@@ -7098,6 +9343,8 @@ class Application(object):
                 self._base.message(
                     'No input rasters to process..', self._base.const_warning_text)
         # ends
+        self._base.waitForRetries()
+        self._base.reportRequestRates()
         _status = eOK
         # write out the (job file) with updated status.
         if (_rpt):
@@ -7411,6 +9658,491 @@ class IIQMaker(Compression):
         return True
 
 
+# runs in the (JobDaemon) worker processes. The process outlives the job, imports/templates/cloud sessions stay warm.
+# module state (Application) sets per run, cleared so nothing carries over to the next job on the same worker process.
+def resetJobState():
+    global _rpt, cfg, til, g_rpt, raster_buff, user_args_Callback, S3_storage, azure_storage, google_storage
+    _rpt = cfg = til = g_rpt = user_args_Callback = None
+    S3_storage = azure_storage = google_storage = None
+    raster_buff = []
+
+
+def runDaemonJob(jobPath, convertThreads):
+    global CWarmCache
+    CWarmCache = True
+    resetJobState()
+    if (jobPath.lower().endswith(Report.CJOB_EXT)):
+        args = {CRESUME_HDR_INPUT: jobPath}     # a (convertthreads) in the .orjob header wins.
+    else:
+        with open(jobPath, 'r', encoding='utf-8') as reader:
+            args = json.load(reader)
+    if (not args.get('convertthreads')):
+        args['convertthreads'] = convertThreads
+    timeStart = datetime.now()
+    app = Application(args)
+    ret = eFAIL
+    try:
+        if (app.init()):
+            ret = app.run()
+        status = {
+            'status': 'OK' if (ret == eOK and
+                               not (_rpt and _rpt.hasFailures())) else 'FAILED',
+            'duration': (datetime.now() - timeStart).total_seconds()
+        }
+    finally:
+        if (app._base is not None):
+            app._base.closePools()
+        resetJobState()
+    return status
+
+
+# -op=daemon[:<jobs>]:<spool path>. Runs the (.orjob/.json) jobs dropped into <spool>/pending on (jobs) long-lived
+# worker processes. A .json job holds the args as given to (Application), e.g. {"input": .., "output": .., "config": ..}
+# Job specs can also be sent as a JSON line to the <spool>/daemon.sock unix socket. Create <spool>/stop to shut down.
+class JobDaemon(object):
+    Pending = LambdaEmulator.Pending
+    Running = LambdaEmulator.Running
+    Done = LambdaEmulator.Done
+    SocketName = 'daemon.sock'
+    StopName = 'stop'
+    JobExts = (Report.CJOB_EXT, '.json')
+    DefJobs = 2
+    PollSecs = 2
+
+    def __init__(self, spoolPath, jobs=None):
+        self._spoolPath = spoolPath
+        self._jobs = max(1, jobs if jobs else self.DefJobs)
+        # the conversion threads (sized from the cores/available memory) are shared across the jobs in flight.
+        self._convertThreads = max(1, WorkerCountSizer().target // self._jobs)
+        self._running = {}
+        self._wake = threading.Event()
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fromOp(op):
+        opArgs = op.split(':')
+        jobs = None
+        if (len(opArgs) > 2 and
+                opArgs[1].isdigit()):
+            jobs = int(opArgs.pop(1))
+        spoolPath = ':'.join(opArgs[1:])
+        if (not spoolPath):
+            print('Spool path is missing (-op={}[:<jobs>]:<path>)'.format(COP_DAEMON))
+            return None
+        return JobDaemon(spoolPath, jobs)
+
+    def message(self, message, messageType=0):
+        print(message)
+
+    def _path(self, folder, name=''):
+        return os.path.join(self._spoolPath, folder, name)
+
+    def serve(self):
+        for folder in (self.Pending, self.Running, self.Done):
+            makedirs(self._path(folder))
+        # jobs left in (running) by a stopped daemon are queued again.
+        for name in os.listdir(self._path(self.Running)):
+            os.replace(self._path(self.Running, name), self._path(self.Pending, name))
+        if (not self._listen()):
+            return False
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+        import multiprocessing
+        self.message('Serving ({}) with ({}) jobs/({}) convert threads each..'.format(
+            self._spoolPath, self._jobs, self._convertThreads))
+        stopPath = os.path.join(self._spoolPath, self.StopName)
+        try:
+            # (spawn) as forking would copy the socket thread/locks held at the time.
+            with ProcessPoolExecutor(max_workers=self._jobs, mp_context=multiprocessing.get_context('spawn')) as pool:
+                while (1):
+                    isStop = os.path.exists(stopPath)
+                    if (not isStop):
+                        self._submit(pool)
+                    if (not self._running):
+                        if (isStop):
+                            break
+                        self._wake.wait(self.PollSecs)
+                        self._wake.clear()
+                        continue
+                    done, _ = wait(list(self._running), timeout=self.PollSecs,
+                                   return_when=FIRST_COMPLETED)
+                    for job in done:
+                        self._complete(job)
+        except KeyboardInterrupt:
+            pass
+        for path in (stopPath, os.path.join(self._spoolPath, self.SocketName)):
+            if (os.path.exists(path)):
+                os.remove(path)
+        self.message('Stopped.')
+        return True
+
+    def _submit(self, pool):
+        free = self._jobs - len(self._running)
+        if (free <= 0):
+            return
+        for name in sorted(os.listdir(self._path(self.Pending))):
+            if (not free):
+                break
+            if (not name.lower().endswith(self.JobExts)):     # skips the (.tmp) files still being written.
+                continue
+            runningPath = self._path(self.Running, name)
+            try:
+                os.rename(self._path(self.Pending, name), runningPath)
+            except OSError:
+                continue
+            self.message('Started/{}'.format(name))
+            self._running[pool.submit(
+                runDaemonJob, runningPath, self._convertThreads)] = name
+            free -= 1
+
+    def _complete(self, job):
+        name = self._running.pop(job)
+        try:
+            status = job.result()
+        except Exception as e:
+            self.message('{}/{}'.format(name, e), const_critical_text)
+            status = {'status': 'FAILED', 'error': str(e)}
+        runningPath = self._path(self.Running, name)
+        if (os.path.exists(runningPath)):     # a successful .orjob may have been moved to the log path.
+            os.replace(runningPath, self._path(self.Done, name))
+        self._putFile(self._path(self.Done, '{}.status'.format(name)),
+                      json.dumps(status))
+        self.message('Completed/{}/Status [{}]'.format(name, status['status']))
+
+    def _putFile(self, path, content):
+        tmpPath = '{}.tmp'.format(path)
+        with open(tmpPath, 'w', encoding='utf-8') as writer:
+            writer.write(content)
+        os.replace(tmpPath, path)
+
+    # spools the job specs received on the unix socket, replies with the job name to look for in <spool>/done
+    def _listen(self):
+        import socket
+        if (not hasattr(socket, 'AF_UNIX')):
+            return True     # spool folder only.
+        sockPath = os.path.join(self._spoolPath, self.SocketName)
+        try:
+            if (os.path.exists(sockPath)):
+                os.remove(sockPath)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(sockPath)
+            server.listen(16)
+        except OSError as e:
+            self.message('Unable to listen on ({}), {}'.format(
+                sockPath, e), const_critical_text)
+            return False
+
+        def accept():
+            while (1):
+                conn, _ = server.accept()
+                with conn, conn.makefile('rw', encoding='utf-8') as stream:
+                    try:
+                        spec = json.loads(stream.readline())
+                        if (not isinstance(spec, dict)):
+                            raise ValueError('Job spec must be a JSON object')
+                        with self._lock:
+                            self._seq += 1
+                            name = '{}_{:04}.json'.format(
+                                datetime.now().strftime('%Y%m%d%H%M%S%f'), self._seq % 10000)
+                        self._putFile(self._path(self.Pending, name), json.dumps(spec))
+                        reply = {'job': name}
+                        self._wake.set()
+                    except Exception as e:
+                        reply = {'error': str(e)}
+                    stream.write('{}\n'.format(json.dumps(reply)))
+        thread = threading.Thread(target=accept)
+        thread.daemon = True
+        thread.start()
+        self.message('Listening on ({})'.format(sockPath))
+        return True
+
+
+# -watch converts the rasters landing in the -input folder as they get completed. New files are picked up with inotify
+# (or periodic os.scandir diffs elsewhere), held till unchanged for (stable) secs and then appended to a rolling .orjob
+# which is run as a resumed job. The .orjob rolls over after (RollRecords) entries.
+class FolderWatcher(object):
+    InCloseWrite = 0x00000008
+    InMovedTo = 0x00000080
+    InCreate = 0x00000100
+    InQOverflow = 0x00004000
+    InIsDir = 0x40000000
+    EventHdr = 'iIII'
+    DefStableSecs = 10
+    PollSecs = 5
+    RollRecords = 10000
+    CHDR_LASTWATCH = 'lastwatch'
+    SkipExts = ('.tmp', '.part', '.partial', '.crdownload')
+
+    def __init__(self, args, stableSecs=None):
+        self._args = args
+        self._stableSecs = stableSecs if stableSecs is not None else self.DefStableSecs
+        self._input = None
+        self._subs = True
+        self._fd = None
+        self._libc = None
+        self._watches = {}
+        self._pending = {}      # path: ((size, mtime), last changed)
+        self._snapshot = {}
+        self._lastWatch = 0
+        self._known = set()     # entries in the rolling job, read in once.
+        self._eventBuff = b''   # partial inotify event left over from the last read.
+
+    def message(self, message, messageType=0):
+        print(message)
+
+    def init(self):
+        if (not self._args.input or
+                not os.path.isdir(self._args.input)):
+            self.message('-watch requires a local -input folder',
+                         const_critical_text)
+            return False
+        self._input = os.path.abspath(self._args.input).replace('\\', '/')
+        if (not self._args.config):
+            self._args.config = os.path.join(
+                os.path.dirname(os.path.abspath(__file__)), CCFG_FILE)
+        self._args.config = os.path.abspath(
+            self._args.config).replace('\\', '/')
+        if (self._args.subs is not None):
+            self._subs = getBooleanValue(self._args.subs)
+        else:
+            _cfg = Config()
+            if (_cfg.init(self._args.config, 'Defaults')):
+                self._subs = getBooleanValue(
+                    _cfg.getValue('IncludeSubdirectories'))
+        job = self._args.job if self._args.job else 'OR_watch'
+        self._jobFolder = os.path.dirname(os.path.abspath(
+            job if os.path.dirname(job) else __file__))
+        self._jobPrefix = os.path.basename(job)
+        if (self._jobPrefix.lower().endswith(Report.CJOB_EXT)):
+            self._jobPrefix = self._jobPrefix[:-len(Report.CJOB_EXT)]
+        self._jobPath = None
+        jobs = sorted(fnmatch.filter(os.listdir(self._jobFolder), '{}_*{}'.format(
+            self._jobPrefix, Report.CJOB_EXT)))
+        if (jobs):      # carry on with the last .orjob
+            self._jobPath = os.path.join(
+                self._jobFolder, jobs[-1]).replace('\\', '/')
+            rpt = self._readJob()
+            if (rpt):
+                self._known = set(rpt._input_list)
+                if (self.CHDR_LASTWATCH in rpt._header):
+                    self._lastWatch = float(rpt._header[self.CHDR_LASTWATCH])
+        if (not self._initNotify()):
+            self.message('inotify unavailable, scanning ({}) every ({}s)'.format(
+                self._input, self.PollSecs))
+        return True
+
+    def _walkDirs(self, path):
+        yield path
+        if (not self._subs):
+            return
+        try:
+            for entry in os.scandir(path):
+                if (entry.is_dir(follow_symlinks=False)):
+                    yield from self._walkDirs(entry.path.replace('\\', '/'))
+        except OSError:
+            pass
+
+    def _scan(self):
+        files = {}
+        for path in self._walkDirs(self._input):
+            try:
+                for entry in os.scandir(path):
+                    if (entry.is_file(follow_symlinks=False)):
+                        st = entry.stat()
+                        files[entry.path.replace('\\', '/')] = (st.st_size, st.st_mtime)
+            except OSError:
+                pass
+        return files
+
+    def _initNotify(self):
+        if (not sys.platform.startswith('linux')):
+            return False
+        try:
+            import ctypes.util
+            self._libc = ctypes.CDLL(ctypes.util.find_library(
+                'c') or 'libc.so.6', use_errno=True)
+            self._fd = self._libc.inotify_init1(os.O_NONBLOCK)
+        except (OSError, AttributeError):
+            self._fd = None
+            return False
+        if (self._fd < 0):
+            self._fd = None
+            return False
+        for path in self._walkDirs(self._input):
+            if (not self._addWatch(path)):
+                os.close(self._fd)
+                self._fd = None
+                return False
+        return True
+
+    def _addWatch(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, path.encode(
+            'utf-8'), self.InCloseWrite | self.InMovedTo | self.InCreate)
+        if (wd < 0):
+            # most likely the (fs.inotify.max_user_watches) limit.
+            self.message('inotify/watch ({}), errno ({})'.format(path,
+                         ctypes.get_errno()), const_warning_text)
+            return False
+        self._watches[wd] = path
+        return True
+
+    # returns the paths changed within (timeout) secs.
+    def _changes(self, timeout):
+        if (self._fd is None):
+            time.sleep(timeout)
+            current = self._scan()
+            changed = [path for path in current if current[path]
+                       != self._snapshot.get(path)]
+            self._snapshot = current
+            return changed
+        import select
+        import struct
+        changed = []
+        if (not select.select([self._fd], [], [], timeout)[0]):
+            return changed
+        hdrSize = struct.calcsize(self.EventHdr)
+        while (1):
+            try:
+                data = self._eventBuff + os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            pos = 0
+            while (pos + hdrSize <= len(data)):
+                wd, mask, cookie, nameLen = struct.unpack_from(
+                    self.EventHdr, data, pos)
+                if (pos + hdrSize + nameLen > len(data)):
+                    break
+                name = data[pos + hdrSize:pos + hdrSize +
+                            nameLen].rstrip(b'\0').decode('utf-8', 'replace')
+                pos += hdrSize + nameLen
+                if (mask & self.InQOverflow):
+                    # events were dropped, anything modified since the last batch is looked at again.
+                    current = self._scan()
+                    changed.extend([path for path in current if current[path][1] >= self._lastWatch])
+                    continue
+                if (wd not in self._watches or
+                        not name):
+                    continue
+                path = '{}/{}'.format(self._watches[wd], name)
+                if (mask & self.InIsDir):
+                    if (mask & (self.InCreate | self.InMovedTo) and
+                            self._subs):
+                        for folder in self._walkDirs(path):
+                            self._addWatch(folder)
+                        # files could've landed before the watch got added.
+                        for folder in self._walkDirs(path):
+                            changed.extend(['{}/{}'.format(folder, entry.name)
+                                            for entry in os.scandir(folder) if entry.is_file()])
+                    continue
+                if (mask & (self.InCloseWrite | self.InMovedTo)):
+                    changed.append(path)
+            self._eventBuff = data[pos:]    # completed by the next read.
+        return changed
+
+    # returns the (pending) files that haven't changed for (stableSecs)
+    def _getStable(self):
+        now = time.time()
+        stable = []
+        for path in list(self._pending):
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self._pending[path]     # removed/renamed in the meantime.
+                continue
+            sig = (st.st_size, st.st_mtime)
+            last = self._pending[path]
+            if (last is None or
+                    last[0] != sig):
+                self._pending[path] = (sig, now)
+                continue
+            if (now - last[1] >= self._stableSecs):
+                stable.append(path)
+                del self._pending[path]
+        return stable
+
+    def _readJob(self):
+        rpt = Report(Base())
+        if (not rpt.init(self._jobPath) or
+                not rpt.read()):
+            self.message('Unable to read ({})'.format(
+                self._jobPath), const_critical_text)
+            return None
+        return rpt
+
+    def _newJob(self):
+        self._jobPath = os.path.join(self._jobFolder, '{}_{}{}'.format(
+            self._jobPrefix, datetime.now().strftime('%Y%m%dT%H%M%S'), Report.CJOB_EXT)).replace('\\', '/')
+        rpt = Report(Base())
+        if (not rpt.init(self._jobPath, self._input)):
+            return None
+        for arg in vars(self._args):
+            if (arg in ('watch', CRESUME_HDR_INPUT)):
+                continue
+            rpt.addHeader(arg, getattr(self._args, arg))
+        rpt.addHeader(CRESUME_HDR_INPUT, '{}/'.format(self._input))
+        rpt.addHeader('keeplogfile', 'true')    # the .orjob stays in place to get appended to.
+        self.message('Rolling job ({})'.format(self._jobPath))
+        return rpt
+
+    def _process(self, files, batchStart):
+        if (not self._jobPath or
+            not os.path.exists(self._jobPath) or
+                len(self._known) > self.RollRecords):
+            rpt = self._newJob()
+            if (rpt is None or
+                    not rpt.write()):
+                return False
+            self._known = set(rpt._input_list)
+        added = [f for f in sorted(files) if f not in self._known]
+        # only the new entries are appended, the later header line overrides the earlier (lastwatch) on read.
+        try:
+            with open(self._jobPath, 'a', encoding='utf-8') as writer:
+                for f in added:
+                    writer.write('{}\n'.format(Report.CVSCHAR.join((f, '', '', ''))))
+                writer.write('{} {}={}\n'.format(
+                    Report.CHEADER_PREFIX, self.CHDR_LASTWATCH, batchStart))
+        except OSError as e:
+            self.message('Unable to update ({}), {}'.format(
+                self._jobPath, e), const_critical_text)
+            return False
+        self._known.update(added)
+        self._lastWatch = batchStart
+        if (not added):
+            return True
+        self.message('Converting ({}) new file(s) via ({})'.format(
+            len(added), self._jobPath))
+        # run same as a daemon job, the module state isn't carried over to the next batch.
+        return runDaemonJob(self._jobPath, None)['status'] == 'OK'
+
+    def run(self):
+        global CWarmCache
+        CWarmCache = True   # the template is read once across the batches.
+        current = self._scan()
+        if (self._fd is None):
+            self._snapshot = current
+        # files landed while the watcher was down.
+        for path in current:
+            if (current[path][1] >= self._lastWatch):
+                self._pending[path] = None
+        self.message('Watching ({}), stable after ({}s)..'.format(
+            self._input, self._stableSecs))
+        try:
+            while (1):
+                for path in self._changes(self.PollSecs):
+                    if (not os.path.basename(path).startswith('.') and
+                            not path.lower().endswith(self.SkipExts)):
+                        self._pending[path] = None
+                batchStart = time.time()
+                stable = self._getStable()
+                if (stable):
+                    self._process(stable, batchStart)
+        except KeyboardInterrupt:
+            pass
+        if (self._fd is not None):
+            os.close(self._fd)
+        return True
+
+
 def main():
     optional = '[Optional]'
     parser = argparse.ArgumentParser()
@@ -7450,8 +10182,8 @@ def main():
         '-inputbucket', help='Input cloud bucket/container name', dest='inputbucket')
     parser.add_argument(
         '-outputbucket', help='Output cloud bucket/container name', dest='outputbucket')
-    parser.add_argument('-op', help='Utility operation mode [{}/{}/{}/{}/{}]'.format(
-        COP_UPL, COP_NOCONVERT, COP_LAMBDA, COP_COPYONLY, COP_CREATEJOB), dest=Report.CHDR_OP)
+    parser.add_argument('-op', help='Utility operation mode [{}/{}/{}/{}/{}/{}]'.format(
+        COP_UPL, COP_NOCONVERT, COP_LAMBDA, COP_COPYONLY, COP_CREATEJOB, COP_DAEMON), dest=Report.CHDR_OP)
     parser.add_argument(
         '-job', help='Name output job/log-prefix file name', dest='job')
     parser.add_argument('-hashkey', help='Hashkey for encryption to use in output paths for cloud storage. e.g. -hashkey=random@1. This will insert the encrypted text using the -hashkey (\'random\') as the first folder name for the output path', dest=CUSR_TEXT_IN_PATH)
@@ -7469,8 +10201,32 @@ def main():
         '-usetoken', help='Use token to access cloud data? [true/false: default:false]', dest=UseToken)
     parser.add_argument(
         '-timeit', help='Execution time details report', dest=CTimeIt)
+    parser.add_argument('-downloadthreads', help='{} Simultaneous cloud downloads'.format(optional),
+                        dest='downloadthreads')
+    parser.add_argument('-convertthreads', help='{} Simultaneous raster conversions. Overrides <Threads> [number/auto]'.format(optional),
+                        dest='convertthreads')
+    parser.add_argument('-uploadthreads', help='{} Simultaneous cloud uploads'.format(optional),
+                        dest='uploadthreads')
+    parser.add_argument('-watch', help='{} Convert new rasters as they land in -input [true/false/secs a file must stay unchanged, def: {}]'.format(optional, FolderWatcher.DefStableSecs),
+                        dest='watch')
 
     args = parser.parse_args()
+    # -op=lambda:worker:<path> serves the jobs queued by -op=lambda:queue:<path>
+    opArgs = args.op.split(':', 2) if args.op else []
+    if (len(opArgs) > 2 and
+        opArgs[0].lower() == COP_LAMBDA and
+            opArgs[1].lower() == LambdaEmulator.Worker):
+        return eOK if LambdaEmulator(None).serve(opArgs[2]) else eFAIL
+    if (opArgs and
+            opArgs[0].lower() == COP_DAEMON):
+        daemon = JobDaemon.fromOp(args.op)
+        return eOK if daemon and daemon.serve() else eFAIL
+    if (args.watch and
+            (args.watch.isdigit() or
+             getBooleanValue(args.watch))):
+        watcher = FolderWatcher(
+            args, int(args.watch) if args.watch.isdigit() else None)
+        return eOK if watcher.init() and watcher.run() else eFAIL
     app = Application(args)
     # app.registerMessageCallback(messageDebug)
     if (not app.init()):
@@ -25,6 +25,7 @@ import datetime as dt
 import json
 import os
 import io
+import time
 import requests
 import zipfile
 from dateutil.relativedelta import *
@@ -42,9 +43,9 @@ class ProgramCheckAndUpdate(object):
         except BaseException:
             return None
 
-    def readVersionJSON(self, checkFileURL):
+    def readVersionJSON(self, checkFileURL, timeout=10):
         try:
-            f = requests.get(checkFileURL, timeout=10)
+            f = requests.get(checkFileURL, timeout=timeout)
             x = f.content
             versionJSON = json.loads(x)
             return versionJSON
@@ -81,15 +82,28 @@ class ProgramCheckAndUpdate(object):
             
 
     def WriteNewCheckForUpdate(self, dict_check, filepath):
+        # written from a daemon thread, a process exiting mid-write must not leave a truncated file behind.
+        tmpPath = '{}.{}.tmp'.format(filepath, os.getpid())
         try:
-            with open(filepath, 'w') as f:
+            with open(tmpPath, 'w') as f:
                 json.dump(dict_check, f, indent=4)
+            os.replace(tmpPath, filepath)
             return True
         except BaseException:
+            if (os.path.exists(tmpPath)):
+                os.remove(tmpPath)
             return False
 
-    def IsCheckRequired(self, dict_check):
+    # (ttl) in secs overrides the (CheckForUpdate) Daily/Monthly schedule. Failed checks (LastCheckedTime) are honored by both.
+    def IsCheckRequired(self, dict_check, ttl=None):
         try:
+            if(ttl is None and
+                    dict_check.get('CheckTTLHours')):
+                ttl = float(dict_check['CheckTTLHours']) * 3600
+            if(ttl is not None):
+                if(dict_check['CheckForUpdate'] == "Never"):
+                    return False
+                return (time.time() - float(dict_check.get('LastCheckedTime', 0))) > ttl
             currentVersion = dict_check['CurrentVersion']
             if("LastChecked" in dict_check.keys()):
                 if(dict_check["LastChecked"] == ""):
@@ -98,6 +112,10 @@ class ProgramCheckAndUpdate(object):
                     lastChecked = dict_check['LastChecked']
             else:
                 lastChecked = "1970-01-01"
+            if(dict_check.get('LastCheckedTime')):
+                # failed attempts count as checks too, hosts without access don't retry (and wait on the timeout) every run.
+                lastAttempt = datetime.fromtimestamp(float(dict_check['LastCheckedTime'])).strftime('%Y-%m-%d')
+                lastChecked = max(lastChecked, lastAttempt)
             lastChecked_dateobj = datetime.strptime(lastChecked, '%Y-%m-%d')
             checkForUpdate = dict_check['CheckForUpdate']
             current_date = datetime.today().strftime('%Y-%m-%d')
@@ -117,15 +135,18 @@ class ProgramCheckAndUpdate(object):
         except BaseException:
             return None
 
-    def run(self, localrepo_path):
+    def run(self, localrepo_path, timeout=10, ttl=None):
         try:
             checkUpdateFilePath = os.path.join(localrepo_path, "CheckForUpdate.json")
             chkupdate = self.readCheckForUpdate(checkUpdateFilePath)
             if chkupdate is None:
                 return "Unable to read CheckForUpdate JSON"
-            if(self.IsCheckRequired(chkupdate)):
-                versionJSON = self.readVersionJSON(checkFileURL=chkupdate['CheckFile'])
+            if(self.IsCheckRequired(chkupdate, ttl)):
+                versionJSON = self.readVersionJSON(checkFileURL=chkupdate['CheckFile'], timeout=timeout)
+                # not to retry on every run till the TTL expires if the check file can't be reached.
+                chkupdate['LastCheckedTime'] = time.time()
                 if versionJSON is None:
+                    self.WriteNewCheckForUpdate(chkupdate, checkUpdateFilePath)
                     return "Unable to read VersionJSON"
                 [update_available, dict_check] = self.checkUpdate(chkupdate, versionJSON)
                 self.WriteNewCheckForUpdate(dict_check, checkUpdateFilePath)
@@ -21,10 +21,16 @@
 # !/usr/bin/env python
 
 from xml.dom.minidom import Document
+from xml.sax.saxutils import escape, quoteattr
 from datetime import datetime
+from collections import deque
 
 import os
 import sys
+import io
+import json
+import shutil
+import threading
 
 homePath = os.path.dirname(os.path.dirname(__file__))
 sys.path.append(homePath)
@@ -36,6 +42,101 @@ except:
 const_start_time_node = 'StartTime'
 const_end_time_node = 'EndTime'
 
+
+# writes the log records to disk as they arrive. Formats (xml) or (jsonl), rolls over to (path.1 .. path.backupCount)
+# once (maxBytes) is reached.
+class LogStream(object):
+    Xml = 'xml'
+    JsonLines = 'jsonl'
+
+    def __init__(self, path, fmt=Xml, maxBytes=64 * 1024 * 1024, backupCount=10, root='Projects', project='Project'):
+        self.path = path
+        self.fmt = fmt
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.root = root
+        self.project = project
+        self._fptr = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        folder = os.path.dirname(self.path)
+        if (folder and
+                not os.path.exists(folder)):
+            os.makedirs(folder)
+        self._fptr = io.open(self.path, 'w', encoding='utf-8')
+        self._size = 0
+        if (self.fmt == self.Xml):
+            self._write(u'<?xml version="1.0" ?>\n<{}>\n<{}>\n'.format(self.root, self.project))
+
+    def _write(self, text):
+        self._fptr.write(text)
+        self._size += len(text)
+
+    def _closeFile(self):
+        if (self._fptr is None):
+            return
+        if (self.fmt == self.Xml):
+            self._write(u'</{}>\n</{}>\n'.format(self.project, self.root))   # each file is a complete document.
+        self._fptr.close()
+        self._fptr = None
+
+    def _rollover(self):
+        self._closeFile()
+        for i in range(self.backupCount - 1, 0, -1):
+            src = '{}.{}'.format(self.path, i)
+            if (os.path.exists(src)):
+                os.rename(src, '{}.{}'.format(self.path, i + 1))
+        if (self.backupCount):
+            os.rename(self.path, '{}.1'.format(self.path))
+        self._open()
+
+    def write(self, category, record):
+        time = datetime.now().strftime('%Y%m%dT%H%M%S')
+        if (self.fmt == self.JsonLines):
+            entry = {'time': time, 'category': category}
+            entry.update(record['error'] if 'error' in record else record)
+            text = u'{}\n'.format(json.dumps(entry))
+        elif ('error' in record):
+            text = u'<Error category={} time="{}"><type>{}</type><text>{}</text></Error>\n'.format(
+                quoteattr(category), time, escape(str(record['error']['type'])), escape(str(record['error']['text'])))
+        else:
+            nodeName = 'Status' if record['type'] == 'status' else 'Message'
+            text = u'<{0} category={1} time="{2}">{3}</{0}>\n'.format(
+                nodeName, quoteattr(category), time, escape(str(record['text'])))
+        with self._lock:
+            if (self._fptr is None):
+                if (os.path.exists(self.path)):     # reopened after (close), the earlier records go to a backup.
+                    self._rollover()
+                else:
+                    self._open()
+            elif (self._size + len(text) > self.maxBytes):
+                self._rollover()
+            self._write(text)
+
+    def close(self):
+        with self._lock:
+            self._closeFile()
+
+    # moves the stream file and its backups to (path)
+    def moveTo(self, path):
+        with self._lock:
+            self._closeFile()
+            if (os.path.abspath(path) == os.path.abspath(self.path)):
+                return True
+            try:
+                for i in range(0, self.backupCount + 1):
+                    src = self.path if not i else '{}.{}'.format(self.path, i)
+                    if (os.path.exists(src)):
+                        shutil.move(src, path if not i else '{}.{}'.format(path, i))
+            except Exception as e:
+                print ('Unable to move the log stream ({})'.format(e))
+                return False
+            self.path = path
+        return True
+
+
 class Logger(object):
 
     const_general_text = 0
@@ -62,6 +163,23 @@ class Logger(object):
         self.m_base = base
         self.isGPRun = False
         self.isPrint = True
+        self.stream = None      # see (StreamLog)
+        self.ringSize = 1000
+
+    # streams the messages to (fileName) in the (logFolder) as they arrive. Only the last (ringSize) messages per category
+    # are kept in memory and make it to the (WriteLog) summary.
+    def StreamLog(self, fileName, fmt=LogStream.Xml, maxBytes=64 * 1024 * 1024, backupCount=10, ringSize=1000):
+        if (self.stream is not None):
+            return False
+        self.ringSize = ringSize
+        self.stream = LogStream(os.path.join(self.logFolder, fileName), fmt,
+                                maxBytes, backupCount, 'Projects', self.projectName)
+        for key in self.command_order:      # messages logged so far.
+            messages = self.projects[key]['logs']['message']
+            for msg in messages:
+                self.stream.write(key, msg)
+            self.projects[key]['logs']['message'] = deque(messages, self.ringSize)
+        return True
 
     @property
     def LogNamePrefix(self):
@@ -109,7 +227,7 @@ class Logger(object):
     def CreateCategory(self, project):
         key = project.strip()
         if ((key in self.projects.keys()) == False):
-            self.projects[key] = {'logs': {'message': []}}
+            self.projects[key] = {'logs': {'message': [] if self.stream is None else deque(maxlen=self.ringSize)}}
             self.active_key = key
             self.projects[key][const_start_time_node] = datetime.now()
             self.command_order.append(key)
@@ -121,17 +239,26 @@ class Logger(object):
             self.SetCurrentCategory('')
         key = self.active_key
         errorTypeText = 'msg'
+        record = None
         if (messageType is None or
             messageType == self.const_general_text or
                 messageType == self.const_status_text):
             if (messageType == self.const_status_text):
                 errorTypeText = 'status'
-            self.projects[key]['logs']['message'].append({'text': message, 'type': errorTypeText})
+            record = {'text': message, 'type': errorTypeText}
         elif(messageType > self.const_general_text):  # warning
             errorTypeText = 'warning'
             if (messageType == self.const_critical_text):
                 errorTypeText = "critical"
-            self.projects[key]['logs']['message'].append({'error': {'type': errorTypeText, 'text': message}})
+            record = {'error': {'type': errorTypeText, 'text': message}}
+        if (record is not None):
+            self.projects[key]['logs']['message'].append(record)
+            if (self.stream is not None):
+                try:
+                    self.stream.write(key, record)
+                except Exception as e:
+                    print ('Log stream disabled ({})'.format(e))
+                    self.stream = None
         _message = 'log-{}:{}'.format(errorTypeText, message)  # print out error message to console while logging.
         if (self.isGPRun):
             try:
@@ -246,6 +373,12 @@ class Logger(object):
             if (os.path.exists(self.logFolder) == False):
                 os.mkdir(self.logFolder)
             logPath = os.path.join(self.logFolder, recordUpdated)
+            if (self.stream is not None):
+                # the full message stream sits next to its summary.
+                self.stream.moveTo('{}_messages.{}'.format(logPath[:-4], self.stream.fmt))
+                summaryNode = doc.createElement('Stream')
+                summaryNode.appendChild(doc.createTextNode(os.path.basename(self.stream.path)))
+                eleParent.insertBefore(summaryNode, eleParent.firstChild)
             c = open(logPath, "w")
             c.write(doc.toprettyxml())
             c.close()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+homePath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, homePath)
+sys.path.insert(0, os.path.join(homePath, 'SolutionsLog'))
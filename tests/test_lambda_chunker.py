@@ -0,0 +1,62 @@
+import csv
+
+import OptimizeRasters as O
+
+MB = 1024 * 1024
+
+
+def chunker(sizes=None, **kwargs):
+    return O.LambdaChunker(O.Base(), {k: v * MB for k, v in (sizes or {}).items()}, **kwargs)
+
+
+def test_first_fit_decreasing_within_the_storage_budget():
+    c = chunker({'a.tif': 200, 'b.tif': 100, 'c.tif': 50, 'd.tif': 300})
+    # storage is twice the input, (d) doesn't fit in the 512 MB.
+    (jobs, oversized) = c.pack(['c.tif', 'd.tif', 'b.tif', 'a.tif'])
+    assert jobs == [['a.tif', 'c.tif'], ['b.tif']]
+    assert oversized == ['d.tif']
+
+
+def test_time_budget():
+    c = chunker()   # no sizes, (DefSecs) per raster.
+    c.TargetSecs = O.LambdaChunker.DefSecs * 2
+    (jobs, oversized) = c.pack(['{}.tif'.format(i) for i in range(5)])
+    assert [len(job) for job in jobs] == [2, 2, 1]
+    assert oversized == []
+
+
+def test_max_entries():
+    c = chunker({'a.tif': 1, 'b.tif': 1, 'c.tif': 1}, maxEntries=2)
+    (jobs, oversized) = c.pack(['a.tif', 'b.tif', 'c.tif'])
+    assert sorted(len(job) for job in jobs) == [1, 2]
+    assert sorted(sum(jobs, [])) == ['a.tif', 'b.tif', 'c.tif']
+
+
+def test_sizes_are_keyed_with_forward_slashes():
+    c = chunker({'in\\a.tif': 10})
+    assert c.size('in/a.tif') == 10
+    assert c.storage('in/a.tif') == 20
+    assert c.isInformed
+    assert not chunker().isInformed
+
+
+def test_local_file_size(tmp_path):
+    path = tmp_path / 'a.tif'
+    path.write_bytes(b'\0' * MB)
+    assert chunker().size(str(path)) == 1
+    assert chunker().size(str(tmp_path / 'missing.tif')) is None
+
+
+def test_timeit_report_sets_the_cost(tmp_path):
+    report = tmp_path / 'timeit.csv'
+    with open(str(report), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=[O.TimeIt.Name, O.TimeIt.Conversion,
+                                               O.TimeIt.Overview, O.TimeIt.Download, O.TimeIt.Upload])
+        writer.writeheader()
+        writer.writerow({O.TimeIt.Name: 'a.tif', O.TimeIt.Conversion: 30, O.TimeIt.Upload: 10})
+        writer.writerow({O.TimeIt.Name: 'x.jp2', O.TimeIt.Conversion: 40})
+        writer.writerow({O.TimeIt.Name: 'y.jp2', O.TimeIt.Conversion: 20})
+    c = chunker({'a.tif': 20, 'b.tif': 5}, timeItReport=str(report))
+    assert c.cost('b.tif') == 10            # 2 secs/MB off (a.tif)
+    assert c.cost('z.jp2') == 30            # mean of the unsized .jp2 rasters.
+    assert c.cost('z.mrf') == O.LambdaChunker.DefSecs
@@ -0,0 +1,80 @@
+import OptimizeRasters as O
+
+
+class Reporter(object):
+
+    def __init__(self):
+        self.batches = []
+
+    def updateRecordStatusBatch(self, updates):
+        self.batches.append(updates)
+        return len(updates)
+
+
+class Config(object):
+
+    def __init__(self, values):
+        self._values = values
+
+    def getValue(self, key):
+        return self._values.get(key)
+
+
+class MergerBase(O.Base):
+
+    def __init__(self, report):
+        super(MergerBase, self).__init__(userConfig=Config({O.CPRT_HANDLER: report}))
+        self.messages = []
+
+    def message(self, msg, status=0):
+        self.messages.append((msg, status))
+
+
+def response(status, **records):
+    return {'status': status, 'input_list_info': records}
+
+
+def test_merges_the_responses():
+    report = Reporter()
+    base = MergerBase(report)
+    merger = O.LambdaStatusMerger(base, 2)
+    merger.put(1, response('OK', **{'/in/a.tif': {O.CRPT_PROCESSED: O.CRPT_YES, O.CRPT_UPLOADED: ''}}))
+    merger.put(2, response('ERR', **{'/in/b.tif': {O.CRPT_PROCESSED: O.CRPT_NO}}))
+    merger.close()
+    updates = sum(report.batches, [])
+    assert sorted(updates) == [('/in/a.tif', O.CRPT_PROCESSED, O.CRPT_YES),
+                               ('/in/b.tif', O.CRPT_PROCESSED, O.CRPT_NO)]
+    assert [m for (m, s) in base.messages] == ['Completed/1/Status [OK] (1/2)',
+                                               'Completed/2/Status [ERR] (2/2)']
+
+
+def test_batches_up_to_max_batch():
+    report = Reporter()
+    base = MergerBase(report)
+    merger = O.LambdaStatusMerger(base, 4)
+    merger.MaxBatch = 2
+    for i in range(4):
+        merger.put(i, response('OK', **{'/in/{}.tif'.format(i): {O.CRPT_UPLOADED: O.CRPT_YES}}))
+    merger.close()
+    assert all(len(batch) <= 2 for batch in report.batches)
+    assert len(sum(report.batches, [])) == 4
+    assert len(base.messages) == 4
+
+
+def test_reporter_errors_are_logged():
+    class FailingReporter(Reporter):
+        def updateRecordStatusBatch(self, updates):
+            raise IOError('disk full')
+    base = MergerBase(FailingReporter())
+    merger = O.LambdaStatusMerger(base, 1)
+    merger.put(1, response('OK', **{'/in/a.tif': {O.CRPT_UPLOADED: O.CRPT_YES}}))
+    merger.close()
+    assert ('disk full', base.const_critical_text) in base.messages
+    assert base.messages[-1][0] == 'Completed/1/Status [OK] (1/1)'
+
+
+def test_remote_status():
+    assert O.Report.getRemoteStatus(None) == []
+    assert O.Report.getRemoteStatus({'status': 'OK'}) == []
+    assert O.Report.getRemoteStatus(response('OK', **{'a.tif': {O.CRPT_COPIED: '', O.CRPT_UPLOADED: O.CRPT_YES}})) == [
+        ('a.tif', O.CRPT_UPLOADED, O.CRPT_YES)]
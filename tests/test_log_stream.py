@@ -0,0 +1,78 @@
+import json
+import os
+from xml.dom import minidom
+
+from logger import LogStream
+
+
+def message(text):
+    return {'text': text, 'type': 'msg'}
+
+
+def test_rotation(tmp_path):
+    path = str(tmp_path / 'log.xml')
+    stream = LogStream(path, maxBytes=400, backupCount=2)
+    for i in range(40):
+        stream.write('Convert', message('message {:02d}'.format(i)))
+    stream.close()
+    assert os.path.exists(path)
+    assert os.path.exists(path + '.1')
+    assert os.path.exists(path + '.2')
+    assert not os.path.exists(path + '.3')
+    texts = []
+    for f in (path + '.2', path + '.1', path):
+        doc = minidom.parse(f)      # each file is a complete document.
+        assert os.path.getsize(f) <= 400 + len('</Project>\n</Projects>\n')
+        texts += [node.firstChild.data for node in doc.getElementsByTagName('Message')]
+    # the oldest records are dropped with the backups, the rest are in order.
+    assert texts == ['message {:02d}'.format(i) for i in range(40 - len(texts), 40)]
+
+
+def test_reopen_moves_the_earlier_records_to_a_backup(tmp_path):
+    path = str(tmp_path / 'log.xml')
+    stream = LogStream(path)
+    stream.write('Convert', message('first'))
+    stream.close()
+    stream.write('Convert', message('second'))
+    stream.close()
+    assert minidom.parse(path + '.1').getElementsByTagName('Message')[0].firstChild.data == 'first'
+    assert minidom.parse(path).getElementsByTagName('Message')[0].firstChild.data == 'second'
+
+
+def test_xml_is_escaped(tmp_path):
+    path = str(tmp_path / 'log.xml')
+    stream = LogStream(path)
+    stream.write('a "b" <c>', {'error': {'type': '<critical>', 'text': 'x & y'}})
+    stream.close()
+    error = minidom.parse(path).getElementsByTagName('Error')[0]
+    assert error.getAttribute('category') == 'a "b" <c>'
+    assert error.getElementsByTagName('type')[0].firstChild.data == '<critical>'
+    assert error.getElementsByTagName('text')[0].firstChild.data == 'x & y'
+
+
+def test_json_lines(tmp_path):
+    path = str(tmp_path / 'log.jsonl')
+    stream = LogStream(path, fmt=LogStream.JsonLines, maxBytes=200, backupCount=1)
+    for i in range(10):
+        stream.write('Upload', {'error': {'type': 'warning', 'text': 'retry {}'.format(i)}})
+    stream.close()
+    with open(path) as f:
+        entries = [json.loads(ln) for ln in f]
+    assert entries[-1]['text'] == 'retry 9'
+    assert all(e['category'] == 'Upload' and e['type'] == 'warning' for e in entries)
+    assert os.path.exists(path + '.1')
+    assert not os.path.exists(path + '.2')
+
+
+def test_move_to(tmp_path):
+    path = str(tmp_path / 'log.xml')
+    stream = LogStream(path, maxBytes=200)
+    for i in range(10):
+        stream.write('Convert', message('message {}'.format(i)))
+    dst = str(tmp_path / 'moved' / 'log.xml')
+    os.makedirs(os.path.dirname(dst))
+    assert stream.moveTo(dst)
+    assert os.path.exists(dst)
+    assert os.path.exists(dst + '.1')
+    assert not os.path.exists(path)
+    assert stream.path == dst
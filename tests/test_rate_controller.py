@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+import OptimizeRasters as O
+
+
+class ThrottleError(Exception):
+
+    def __init__(self, code):
+        super(ThrottleError, self).__init__(code)
+        self.response = {'Error': {'Code': code}}
+
+
+def test_starts_at_the_max_limit():
+    assert O.RequestRateController(8).limit == 8
+    assert O.RequestRateController(0).limit == O.RequestRateController.MinLimit
+
+
+def test_throttle_halves_the_limit_once_per_window():
+    c = O.RequestRateController(8)
+    c.acquire()
+    c.release(throttled=True)
+    assert c.limit == 4
+    c.acquire()
+    c.release(throttled=True)   # same congestion event.
+    assert c.limit == 4
+    c._lastDecrease -= c.WindowSecs
+    c.acquire()
+    c.release(throttled=True)
+    assert c.limit == 2
+    assert c.metrics['throttled'] == 3
+
+
+def test_limit_floor():
+    c = O.RequestRateController(2)
+    for i in range(4):
+        c._lastDecrease = 0
+        c.acquire()
+        c.release(throttled=True)
+    assert c.limit == O.RequestRateController.MinLimit
+
+
+def test_additive_increase():
+    c = O.RequestRateController(4)
+    c._limit = 2.0
+    c.acquire()
+    c.release()
+    c.acquire()
+    c.release()
+    assert c.limit == 2     # 2 + 1/2 + 1/2.5
+    c.acquire()
+    c.release()
+    assert c.limit == 3
+    for i in range(20):
+        c.acquire()
+        c.release()
+    assert c.limit == 4     # capped at the max.
+    assert c.metrics['requests'] == 23
+
+
+def test_call_reports_throttling():
+    c = O.RequestRateController(8)
+
+    def fnc():
+        raise ThrottleError('SlowDown')
+    with pytest.raises(ThrottleError):
+        c.call(fnc)
+    assert c.limit == 4
+    assert c.metrics['inflight'] == 0
+
+
+def test_call_other_errors_are_not_throttling():
+    c = O.RequestRateController(8)
+    c._limit = 5.0
+
+    def fnc():
+        raise ThrottleError('NoSuchKey')
+    with pytest.raises(ThrottleError):
+        c.call(fnc)
+    assert c.limit == 5
+
+
+def test_is_throttled():
+    class AzureError(Exception):
+        error_code = 'ServerBusy'
+
+    class HTTPError(Exception):
+        status_code = 429
+    assert O.RequestRateController.isThrottled(ThrottleError('RequestLimitExceeded'))
+    assert O.RequestRateController.isThrottled(AzureError())
+    assert O.RequestRateController.isThrottled(HTTPError())
+    assert O.RequestRateController.isThrottled(Exception('503 ServiceUnavailable'))
+    assert not O.RequestRateController.isThrottled(Exception('Access Denied'))
+
+
+def test_acquire_waits_for_a_slot():
+    c = O.RequestRateController(1)
+    c.acquire()
+    acquired = threading.Event()
+
+    def waiter():
+        c.acquire()
+        acquired.set()
+    t = threading.Thread(target=waiter)
+    t.start()
+    assert not acquired.wait(0.2)
+    c.release()
+    assert acquired.wait(5)
+    t.join()
+    c.release()
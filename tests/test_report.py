@@ -0,0 +1,93 @@
+import pytest
+
+import OptimizeRasters as O
+
+RECORDS = ['/data/in/{:02d}.tif'.format(i) for i in range(10)]
+
+
+def newReport(path):
+    report = O.Report(O.Base())
+    assert report.init(str(path))
+    return report
+
+
+@pytest.fixture
+def jobFile(tmp_path):
+    path = tmp_path / 'job.orjob'
+    report = newReport(path)
+    report.addHeader('input', '/data/in/')
+    for f in RECORDS:
+        assert report.addRecord(f, copied=O.CRPT_YES)
+    assert report.write()
+    return path
+
+
+def chunkedReport(jobFile):
+    report = newReport(jobFile)
+    report.ReadChunkSize = 3
+    assert report.read(chunked=True)
+    return report
+
+
+def test_write_read(jobFile):
+    report = newReport(jobFile)
+    assert report.read()
+    assert list(report) == RECORDS
+    assert report.header['input'] == '/data/in/'
+    assert report.getRecordStatus(RECORDS[4], O.CRPT_COPIED) == O.CRPT_YES
+    assert report.getRecordStatus(RECORDS[4], O.CRPT_PROCESSED) == ''
+    assert not (jobFile.parent / 'job.orjob.tmp').exists()
+
+
+def test_chunked_read_loads_the_first_chunk(jobFile):
+    report = chunkedReport(jobFile)
+    assert report._input_list._record_names == ['00.tif', '01.tif', '02.tif']
+    assert report.items[0] == RECORDS[0]
+
+
+def test_chunked_lookup_loads_up_to_its_chunk(jobFile):
+    report = chunkedReport(jobFile)
+    assert report.updateRecordStatus(RECORDS[7], O.CRPT_PROCESSED, O.CRPT_YES)
+    assert len(report._input_list._record_names) == 9     # chunks 0..2
+    assert report.getRecordStatus(RECORDS[7], O.CRPT_PROCESSED) == O.CRPT_YES
+    assert not report.updateRecordStatus('/data/in/missing.tif', O.CRPT_PROCESSED, O.CRPT_YES)
+    assert len(report._input_list._record_names) == 9     # unknown keys don't read in the rest.
+
+
+def test_chunked_iteration(jobFile):
+    assert list(chunkedReport(jobFile)) == RECORDS
+    assert len(chunkedReport(jobFile)) == len(RECORDS)
+
+
+def test_chunked_update_round_trip(jobFile):
+    report = chunkedReport(jobFile)
+    assert report.updateRecordStatus(RECORDS[1], O.CRPT_UPLOADED, O.CRPT_NO)
+    assert report.updateRecordStatus(RECORDS[9], O.CRPT_UPLOADED, O.CRPT_YES)
+    assert report.hasFailures()
+    assert report.write()
+    report = newReport(jobFile)
+    assert report.read()
+    assert list(report) == RECORDS     # the records never looked up are written out too.
+    assert report.getRecordStatus(RECORDS[1], O.CRPT_UPLOADED) == O.CRPT_NO
+    assert report.getRecordStatus(RECORDS[9], O.CRPT_UPLOADED) == O.CRPT_YES
+    assert report.getRecordStatus(RECORDS[5], O.CRPT_COPIED) == O.CRPT_YES
+
+
+def test_journal_is_replayed_after_the_last_chunk(jobFile):
+    report = chunkedReport(jobFile)
+    assert report.updateRecordStatusBatch([(RECORDS[8], O.CRPT_PROCESSED, O.CRPT_YES),
+                                           (RECORDS[2], 'invalid', O.CRPT_YES)]) == 1
+    report = chunkedReport(jobFile)
+    assert report.getRecordStatus(RECORDS[8], O.CRPT_PROCESSED) == O.CRPT_YES
+    assert report.write()
+    assert not (jobFile.parent / 'job.orjob.journal').exists()
+
+
+def test_failed_chunk_blocks_the_write(jobFile):
+    report = chunkedReport(jobFile)
+    corrupt = b'\xff' * jobFile.stat().st_size      # the unread chunks no longer hold utf-8 records.
+    jobFile.write_bytes(corrupt)
+    list(report)
+    assert report.hasFailures()
+    assert not report.write()
+    assert jobFile.read_bytes() == corrupt
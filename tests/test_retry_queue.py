@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+
+import OptimizeRasters as O
+
+
+@pytest.fixture
+def retryQueue():
+    q = O.RetryQueue()
+    q.BaseDelay = 0     # retries are due right away.
+    yield q
+    q.close()
+
+
+class Calls(object):
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.count = 0
+
+    def __call__(self):
+        self.count += 1
+        return self.count > self.failures
+
+
+def test_backoff_doubles_per_attempt_and_is_capped(monkeypatch):
+    monkeypatch.setattr(O.random, 'uniform', lambda low, high: high)
+    q = O.RetryQueue()
+    assert q.backoff(1) == 2
+    assert q.backoff(3) == 8
+    assert q.backoff(30) == O.RetryQueue.MaxDelay
+
+
+def test_backoff_has_full_jitter(monkeypatch):
+    monkeypatch.setattr(O.random, 'uniform', lambda low, high: low)
+    assert O.RetryQueue().backoff(5) == 0
+
+
+def test_first_call_succeeds(retryQueue):
+    settled = []
+    assert retryQueue.run(Calls(0), 3, settled.append) is True
+    assert retryQueue.pending == 0
+    assert settled == []
+
+
+def test_retry_succeeds(retryQueue):
+    settled = []
+    calls = Calls(2)
+    assert retryQueue.run(calls, 3, settled.append) is None
+    retryQueue.wait()
+    assert calls.count == 3
+    assert settled == [True]
+    assert retryQueue.pending == 0
+
+
+def test_gives_up_after_the_attempts(retryQueue):
+    settled = []
+    calls = Calls(10)
+    assert retryQueue.run(calls, 2, settled.append) is None
+    retryQueue.wait()
+    assert calls.count == 3     # first call plus two retries.
+    assert settled == [False]
+
+
+def test_exception_counts_as_failure(retryQueue):
+    settled = []
+    calls = []
+
+    def fnc():
+        calls.append(1)
+        if (len(calls) == 1):
+            raise IOError('connection reset')
+        return True
+    assert retryQueue.run(fnc, 1, settled.append) is None
+    retryQueue.wait()
+    assert settled == [True]
+
+
+def test_retry_budget(retryQueue):
+    retryQueue.MinRetryBudget = 2
+    retryQueue.RetryBudget = 0
+    retryQueue.backoff = lambda attempt: 0.5
+    settled = []
+    recovered = threading.Event()
+
+    def fnc():
+        return recovered.is_set()
+    assert retryQueue.run(fnc, 1, settled.append) is None
+    assert retryQueue.run(fnc, 1, settled.append) is None
+    assert retryQueue.run(fnc, 1, settled.append) is False     # over the budget.
+    assert settled == [False]   # the rejected call settles right away.
+    recovered.set()
+    retryQueue.wait()
+    assert settled == [False, True, True]
+
+
+def test_budget_grows_with_the_requests(retryQueue):
+    retryQueue.MinRetryBudget = 0
+    retryQueue.RetryBudget = 0.25
+    assert retryQueue.run(Calls(1), 1) is None      # 0 retries made, 0.25 allowed.
+    retryQueue.wait()
+    assert retryQueue.run(Calls(1), 1) is False     # 1 retry made, 0.5 allowed.
+    assert retryQueue.run(Calls(0), 1) is True
+    assert retryQueue.run(Calls(0), 1) is True
+    assert retryQueue.run(Calls(1), 1) is None      # 1.25 allowed.
+    retryQueue.wait()
+
+
+def test_retries_use_up_the_budget(retryQueue):
+    retryQueue.MinRetryBudget = 1
+    retryQueue.RetryBudget = 0
+    settled = []
+    calls = Calls(10)
+    assert retryQueue.run(calls, 5, settled.append) is None
+    retryQueue.wait()
+    assert calls.count == 2     # the second retry is over the budget.
+    assert settled == [False]
+
+
+def test_close_stops_the_scheduler():
+    q = O.RetryQueue()
+    q.BaseDelay = 0
+    assert q.run(Calls(1), 1) is None
+    scheduler = q._scheduler
+    q.close()
+    scheduler.join(5)
+    assert not scheduler.is_alive()
@@ -0,0 +1,42 @@
+import io
+
+import OptimizeRasters as O
+
+
+def progress():
+    p = O.TransferProgress(None)
+    p._intervalSecs = 3600      # no interim reports.
+    return p
+
+
+def test_overlapping_attempts_of_a_file():
+    p = progress()
+    first = p.add('a.tif', 100)
+    retry = p.add('a.tif', 100)
+    assert first != retry
+    p.update(first, 40)
+    p.update(retry, 10)
+    p.done(first, ok=False)
+    assert (p._totalBytes, p._seenBytes) == (100, 10)
+    p.done(retry)
+    assert (p._totalBytes, p._seenBytes, p._completed) == (100, 100, 1)
+    assert p._files == {}
+
+
+def test_unknown_token():
+    p = progress()
+    token = p.add('a.tif', 100)
+    p.done(token + 1)
+    p.update(token + 1, 10)
+    assert p._completed == 0
+    assert p._files == {token: ['a.tif', 100, 0]}
+
+
+def test_reader_reports_the_bytes_read():
+    seen = []
+    reader = O.ProgressReader(io.BytesIO(b'x' * 10), seen.append)
+    assert reader.read(4) == b'xxxx'
+    assert reader.read() == b'x' * 6
+    assert reader.read() == b''
+    assert seen == [4, 6]
+    assert reader.tell() == 10